@@ -1,83 +1,216 @@
 from decimal import Decimal
+from typing import Any, Iterator, NamedTuple
 
 from django.conf import settings
 from django.contrib.sessions.backends.base import SessionBase
+from django.http import HttpRequest
+from django.utils.functional import cached_property
 
 from shop.models import Product
 
 
+# Session keys of the scalars that are read without the cart lines
+QUANTITY_SESSION_KEY = f"{settings.CART_SESSION_ID}_quantity"
+TOTAL_PRICE_SESSION_KEY = f"{settings.CART_SESSION_ID}_total_price"
+
+SIGNED_COOKIES_SESSION_ENGINE = (
+    "django.contrib.sessions.backends.signed_cookies"
+)
+
+
+class CartOperation(NamedTuple):
+    """Named tuple that holds a change of a cart product."""
+
+    action: str  # "add", "update" or "remove"
+    product_id: int
+    quantity: int | None = None
+
+
+class CartLine(NamedTuple):
+    """Named tuple that holds a cart product with its quantity and prices."""
+
+    product: Product
+    quantity: int
+    price: Decimal
+    total_price: Decimal
+
+
+def _get_quantity_and_price_from_(item: Any) -> tuple[int, str]:
+    """
+    Returns the quantity and the price (string) of the session cart item
+    that is stored as [quantity, price] or as a legacy dictionary.
+    """
+    if isinstance(item, dict):
+        return item["quantity"], item["price"]
+    return item[0], item[1]
+
+
 class Cart:
     """
     Shopping cart that stores products, their quantities and their prices.
+    The session keeps {product ID: [quantity, price]} and the total
+    quantity and price, so reading the cart doesn't change the session
+    (unless some of its products have been deleted).
     """
 
     def __init__(self, request_session: SessionBase) -> None:
         """Initializes a new cart instance."""
         self.session = request_session
-        if not (cart := self.session.get(settings.CART_SESSION_ID)):
-            cart = self.session[settings.CART_SESSION_ID] = {}
-        self.cart = cart
+        self.cart = self.session.get(settings.CART_SESSION_ID) or {}
 
-    def __iter__(self):
+    @cached_property
+    def lines(self) -> list[CartLine]:
         """
-        Iterates over the items in the cart and yield each item dictionary.
+        Returns lines of the cart products that still exist and removes
+        the deleted products from the cart (with its total quantity and price).
         """
-        for product in Product.objects.filter(id__in=self.cart.keys()).only(
-            "name", "slug", "image"
-        ):
-            self.cart[str(product.id)]["product"] = product
+        products_by_id = {
+            str(product.id): product
+            for product in Product.objects.filter(
+                id__in=self.cart.keys()
+            ).only("name", "slug", "image")
+        }
+        if deleted_product_ids := self.cart.keys() - products_by_id.keys():
+            for product_id in deleted_product_ids:
+                del self.cart[product_id]
+            self.save()
 
-        for item in self.cart.values():
-            item["price"] = Decimal(item["price"])
-            item["total_price"] = item["price"] * item["quantity"]
-            yield item
-        # Remove not JSON serializable objects from the cart.
-        for item in self.cart.values():
-            del item["product"]
-            item["price"] = str(item["price"])
-            item["total_price"] = str(item["total_price"])
+        lines = []
+        for product_id, item in self.cart.items():
+            product = products_by_id[product_id]
+            quantity, price = _get_quantity_and_price_from_(item)
+            price = Decimal(price)
+            lines.append(CartLine(product, quantity, price, price * quantity))
+        return lines
+
+    def __iter__(self) -> Iterator[CartLine]:
+        """Iterates over the lines of the cart."""
+        return iter(self.lines)
 
     def __len__(self) -> int:
         """
         Returns the total number of items in the cart based on their quantities.
         """
-        return sum(item["quantity"] for item in self.cart.values())
+        if (quantity := self.session.get(QUANTITY_SESSION_KEY)) is None:
+            quantity = self._count_quantity()
+        return quantity
+
+    def get_quantities(self) -> dict[str, int]:
+        """Returns quantities of the cart products by their IDs."""
+        return {
+            product_id: _get_quantity_and_price_from_(item)[0]
+            for product_id, item in self.cart.items()
+        }
+
+    def _count_quantity(self) -> int:
+        """Returns the total quantity counted by the session items."""
+        return sum(self.get_quantities().values())
+
+    def _count_total_price(self) -> Decimal:
+        """Returns the total price counted by the session items."""
+        total_price = Decimal(0)
+        for item in self.cart.values():
+            quantity, price = _get_quantity_and_price_from_(item)
+            total_price += Decimal(price) * quantity
+        return total_price
 
     def save(self) -> None:
         """Saves the current state of the cart to the session."""
         self.session[settings.CART_SESSION_ID] = self.cart
+        self.session[QUANTITY_SESSION_KEY] = self._count_quantity()
+        self.session[TOTAL_PRICE_SESSION_KEY] = str(self._count_total_price())
         self.session.modified = True
+        self.__dict__.pop("lines", None)
 
     def add(self, product: Product, quantity: int) -> None:
         """Adds a product to the cart"""
-        if (product_id := str(product.id)) not in self.cart:
-            self.cart[product_id] = {
-                "quantity": quantity,
-                "price": str(product.price),
-            }
+        if self._add(product, quantity):
             self.save()
 
+    def is_full(self) -> bool:
+        """
+        Checks if no more products can be added to the cart (its size
+        is limited only if the session is stored in a signed cookie).
+        """
+        return (
+            settings.SESSION_ENGINE == SIGNED_COOKIES_SESSION_ENGINE
+            and len(self.cart) >= settings.CART_MAX_PRODUCTS
+        )
+
+    def _add(self, product: Product, quantity: int) -> bool:
+        """Adds a product without saving and returns if it was added."""
+        if (product_id := str(product.id)) in self.cart or self.is_full():
+            return False
+        self.cart[product_id] = [quantity, str(product.price)]
+        return True
+
     def update(self, product: Product, quantity: int) -> None:
         """Updates the cart product quantity."""
-        if (product_id := str(product.id)) in self.cart:
-            self.cart[product_id]["quantity"] = quantity
+        if self._update(product.id, quantity):
             self.save()
 
-    def get_total_price(self) -> int:
+    def _update(self, product_id: int, quantity: int) -> bool:
+        """Updates a quantity without saving and returns if it was updated."""
+        if (product_id := str(product_id)) not in self.cart:
+            return False
+        _, price = _get_quantity_and_price_from_(self.cart[product_id])
+        self.cart[product_id] = [quantity, price]
+        return True
+
+    def apply(
+        self,
+        operations: list[CartOperation],
+        products_by_id: dict[int, Product],
+    ) -> None:
+        """
+        Applies the operations with the given products (for adding)
+        in the given order and saves the cart once.
+        """
+        was_changed = False
+        for operation in operations:
+            if operation.action == "add":
+                is_changed = self._add(
+                    products_by_id[operation.product_id], operation.quantity
+                )
+            elif operation.action == "update":
+                is_changed = self._update(
+                    operation.product_id, operation.quantity
+                )
+            else:
+                is_changed = self._remove(operation.product_id)
+            was_changed = was_changed or is_changed
+        if was_changed:
+            self.save()
+
+    def get_total_price(self) -> Decimal:
         """Returns the total price of all items in the cart."""
-        return sum(
-            Decimal(item["price"]) * item["quantity"]
-            for item in self.cart.values()
-        )
+        if (total_price := self.session.get(TOTAL_PRICE_SESSION_KEY)) is None:
+            return self._count_total_price()
+        return Decimal(total_price)
 
     def remove(self, product: Product) -> None:
         """Removes a product from the cart."""
-        if (product_id := str(product.id)) in self.cart:
-            del self.cart[product_id]
+        if self._remove(product.id):
             self.save()
 
+    def _remove(self, product_id: int) -> bool:
+        """Removes a product without saving and returns if it was removed."""
+        return self.cart.pop(str(product_id), None) is not None
+
     def clear(self) -> None:
         """Clears all items from the cart."""
         self.cart.clear()
-        del self.session[settings.CART_SESSION_ID]
-        self.session.modified = True
+        for key in (
+            settings.CART_SESSION_ID,
+            QUANTITY_SESSION_KEY,
+            TOTAL_PRICE_SESSION_KEY,
+        ):
+            self.session.pop(key, None)
+        self.__dict__.pop("lines", None)
+
+
+def get_cart_of_(request: HttpRequest) -> Cart:
+    """Returns the cart of the request (one instance per request)."""
+    if not hasattr(request, "_cart"):
+        request._cart = Cart(request.session)
+    return request._cart
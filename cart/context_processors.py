@@ -1,8 +1,18 @@
+from django.conf import settings
 from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
 
-from .cart import Cart
+from .cart import get_cart_of_
 
 
-def cart(request: HttpRequest) -> dict[str, Cart]:
-    """Returns a dictionary with the cart object."""
-    return {"cart": Cart(request.session)}
+def cart(request: HttpRequest) -> dict:
+    """
+    Returns a dictionary with the lazy cart object (the session is loaded
+    only if a template reads the cart) and its total quantity for the navbar
+    badge from the cookie (set by CartQuantityCookieMiddleware).
+    """
+    quantity = request.COOKIES.get(settings.CART_QUANTITY_COOKIE_NAME, "")
+    return {
+        "cart": SimpleLazyObject(lambda: get_cart_of_(request)),
+        "cart_quantity": int(quantity) if quantity.isdigit() else 0,
+    }
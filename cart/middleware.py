@@ -0,0 +1,47 @@
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from .cart import Cart
+
+
+class CartQuantityCookieMiddleware:
+    """
+    Middleware that keeps the total quantity of the cart in a cookie,
+    so the navbar badge is rendered without loading the session.
+    The cookie is updated on every response whose request has loaded
+    the session (e.g. to change the cart or to log out).
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        """Initializes the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Sets the cookie if the quantity of the cart has been changed."""
+        response = self.get_response(request)
+        if request.session.accessed:
+            quantity = len(Cart(request.session))
+        elif settings.SESSION_COOKIE_NAME not in request.COOKIES:
+            quantity = 0
+        else:  # The cookie can't be checked without loading the session.
+            return response
+
+        cookie_name = settings.CART_QUANTITY_COOKIE_NAME
+        if request.COOKIES.get(cookie_name, "0") == str(quantity):
+            return response
+        if quantity:
+            response.set_cookie(
+                cookie_name,
+                str(quantity),
+                max_age=settings.SESSION_COOKIE_AGE,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+            )
+        else:
+            response.delete_cookie(
+                cookie_name, samesite=settings.SESSION_COOKIE_SAMESITE
+            )
+        return response
@@ -1,17 +1,20 @@
 import json
 import logging
+from typing import Any
 
 from django.conf import settings
 from django.contrib import messages
-from django.http import HttpRequest
+from django.http import HttpRequest, Http404
 from django.shortcuts import get_object_or_404
 
 from shop.models import Product
-from .cart import Cart
+from .cart import Cart, CartOperation, get_cart_of_
 
 
 logger = logging.getLogger(__name__)
 
+MAX_CART_OPERATIONS = 50
+
 
 def _get_product_id_and_quantity_from_(
     json_data: dict, prefix: str
@@ -39,12 +42,20 @@ def _process_cart_product(request: HttpRequest, action: str) -> str:
     if isinstance(product_id, str):
         return product_id  # Error message.
 
-    product = get_object_or_404(Product, id=product_id)
+    product = get_object_or_404(
+        Product.objects.only("id", "price"), id=product_id
+    )
     if action == "adding":
-        Cart(request.session).add(product, quantity)
+        cart = get_cart_of_(request)
+        if str(product.id) not in cart.cart and cart.is_full():
+            return (
+                "Your cart can't contain more than "
+                f"{settings.CART_MAX_PRODUCTS} products."
+            )
+        cart.add(product, quantity)
         return "Product has successfully added to your cart."
 
-    Cart(request.session).update(product, quantity)
+    get_cart_of_(request).update(product, quantity)
     return "The product quantity has successfully updated."
 
 
@@ -67,7 +78,71 @@ def remove_product_from_cart(request: HttpRequest) -> None:
         logger.error(f"cart product removing: {product_id=}")
         messages.error(request, settings.ERROR_MESSAGE)
         return
-    Cart(request.session).remove(get_object_or_404(Product, id=product_id))
+    get_cart_of_(request).remove(
+        get_object_or_404(Product.objects.only("id"), id=product_id)
+    )
     messages.success(
         request, "Product has successfully removed from your cart."
     )
+
+
+def _get_cart_operation_from_(data: dict) -> CartOperation:
+    """Returns the cart operation from the JSON data or raises ValueError."""
+    action = data["action"]
+    product_id = int(data["product_id"])
+    if action == "remove":
+        return CartOperation(action, product_id)
+    if action not in ("add", "update"):
+        raise ValueError(f"Unknown cart action: {action}")
+    if (quantity := int(data["quantity"])) < 1:
+        raise ValueError(f"Invalid cart product quantity: {quantity}")
+    return CartOperation(action, product_id, quantity)
+
+
+def _get_cart_operations_from_(
+    request_body: bytes,
+) -> list[CartOperation] | None:
+    """
+    Extracts and returns cart operations from a JSON request body
+    or None if the body is invalid.
+    """
+    try:
+        operations_data = json.loads(request_body)["operations"]
+        if len(operations_data) > MAX_CART_OPERATIONS:
+            return None
+        return [_get_cart_operation_from_(data) for data in operations_data]
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def get_cart_summary_of_(cart: Cart) -> dict[str, Any]:
+    """Returns the total quantity and price and the cart product quantities."""
+    return {
+        "quantity": len(cart),
+        "total_price": str(cart.get_total_price()),
+        "products": cart.get_quantities(),
+    }
+
+
+def apply_cart_operations_and_get_summary(
+    request: HttpRequest,
+) -> dict[str, Any] | None:
+    """
+    Applies the cart operations from the JSON request body
+    ({"operations": [{"action", "product_id", "quantity"}, ...]})
+    with one session write and returns the cart summary
+    or None if the body is invalid.
+    """
+    if (operations := _get_cart_operations_from_(request.body)) is None:
+        logger.error("cart batch: invalid operations")
+        return None
+
+    # Only added products are needed (with their prices).
+    product_ids = {o.product_id for o in operations if o.action == "add"}
+    products_by_id = Product.objects.only("id", "price").in_bulk(product_ids)
+    if len(products_by_id) != len(product_ids):
+        raise Http404("Some of the products don't exist.")
+
+    cart = get_cart_of_(request)
+    cart.apply(operations, products_by_id)
+    return get_cart_summary_of_(cart)
@@ -0,0 +1,308 @@
+import json
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from general.test_mixins.for_views import (
+    ViewNumQueriesTestMixin,
+    ProductTestMixin,
+)
+from order.models import Order
+from shop.models import Product, Brand, Category
+from .cart import QUANTITY_SESSION_KEY, TOTAL_PRICE_SESSION_KEY
+
+# Browsers ignore cookies that are bigger (with their names and attributes).
+MAX_COOKIE_SIZE = 4096
+
+
+class CartWithDeletedProductTest(ProductTestMixin, TestCase):
+    """Test that deleted products are removed from the cart."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Sets up test data by creating two products."""
+        super().setUpTestData()
+        cls.deleted_product = Product.objects.create(
+            name="Deleted product",
+            description="Some content",
+            image="./some_image.jpg",
+            price=500,
+            year=2023,
+            brand=cls.product.brand,
+            category=cls.product.category,
+        )
+
+    def setUp(self) -> None:
+        """Adds both products to the cart and deletes one of them."""
+        for product, quantity in (
+            (self.product, 1),
+            (self.deleted_product, 2),
+        ):
+            self.client.post(
+                "/cart/add/",
+                json.dumps({"product_id": product.id, "quantity": quantity}),
+                content_type="application/json",
+            )
+        self.deleted_product.delete()
+
+    def test_cart_page_shows_only_existing_products(self):
+        """Test that the cart page has lines of existing products only."""
+        response = self.client.get("/cart/")
+        self.assertEqual(
+            [line.product for line in response.context["cart"]],
+            [self.product],
+        )
+
+    def test_deleted_products_are_removed_from_session(self):
+        """Test that the session cart and its totals are recounted."""
+        self.client.get("/cart/")
+        session = self.client.session
+        self.assertEqual(list(session["cart"]), [str(self.product.id)])
+        self.assertEqual(session[QUANTITY_SESSION_KEY], 1)
+        self.assertEqual(
+            Decimal(session[TOTAL_PRICE_SESSION_KEY]), self.product.price
+        )
+
+
+class CartQuantityBadgeTest(
+    ViewNumQueriesTestMixin, ProductTestMixin, TestCase
+):
+    """
+    Test that a page without the cart renders the cart badge
+    from the cookie without loading the session.
+    """
+
+    url = "/faq/"
+    num_queries = 0
+
+    def setUp(self) -> None:
+        """Adds the product to the cart, so the visitor has a session."""
+        self.client.post(
+            "/cart/add/",
+            json.dumps({"product_id": self.product.id, "quantity": 2}),
+            content_type="application/json",
+        )
+
+    def _get_badge_quantity(self) -> int:
+        """Returns the cart quantity of the navbar badge of the page."""
+        return self.client.get(self.url).context["cart_quantity"]
+
+    def test_badge_shows_cart_quantity(self):
+        """Test that the badge shows the quantity of the cart products."""
+        self.assertIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+        self.assertEqual(self._get_badge_quantity(), 2)
+
+    def test_badge_is_updated_with_cart(self):
+        """Test that the cookie follows the changes of the cart."""
+        self.client.post(
+            "/cart/update/",
+            json.dumps({"product_id": self.product.id, "quantity": 5}),
+            content_type="application/json",
+        )
+        self.assertEqual(self._get_badge_quantity(), 5)
+        self.client.post(
+            "/cart/remove/",
+            json.dumps({"product_id": self.product.id}),
+            content_type="application/json",
+        )
+        self.assertEqual(self._get_badge_quantity(), 0)
+
+
+class _CartSessionTestMixin:
+    """
+    Test mixin for testing the cart views and the checkout
+    with a session engine (set by override_settings).
+    """
+
+    is_cart_size_limited = False
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Sets up test data by creating an user and the maximum number
+        of cart products (with long names and prices).
+        """
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        brand = Brand.objects.create(name="Test brand")
+        category = Category.objects.create(name="Test category")
+        cls.products = Product.objects.bulk_create(
+            Product(
+                name=f"Test product with a long name {i}",
+                slug=f"test-product-with-a-long-name-{i}",
+                description="Some content",
+                image=f"products/test-product-{i}.webp",
+                price=Decimal("99999.99") - i,
+                year=2023,
+                brand=brand,
+                category=category,
+            )
+            for i in range(settings.CART_MAX_PRODUCTS)
+        )
+
+    def _post_json(self, url: str, data: dict):
+        """Returns the response to the POST request with the JSON data."""
+        return self.client.post(
+            url, json.dumps(data), content_type="application/json"
+        )
+
+    def _get_session_quantities(self) -> dict[str, int]:
+        """Returns quantities of the session cart by product IDs."""
+        return {
+            product_id: item[0]
+            for product_id, item in self.client.session["cart"].items()
+        }
+
+    def _add_all_products(self):
+        """Adds all products to the cart at once and returns the response."""
+        return self._post_json(
+            "/cart/batch/",
+            {
+                "operations": [
+                    {"action": "add", "product_id": p.id, "quantity": 99}
+                    for p in self.products
+                ]
+            },
+        )
+
+    def test_add_update_and_remove(self):
+        """Test that the cart changes are saved in the session."""
+        first, second = self.products[:2]
+        for product in (first, second):
+            self._post_json(
+                "/cart/add/", {"product_id": product.id, "quantity": 2}
+            )
+        self._post_json(
+            "/cart/update/", {"product_id": first.id, "quantity": 5}
+        )
+        self._post_json("/cart/remove/", {"product_id": second.id})
+
+        self.assertEqual(self._get_session_quantities(), {str(first.id): 5})
+        session = self.client.session
+        self.assertEqual(session[QUANTITY_SESSION_KEY], 5)
+        self.assertEqual(
+            Decimal(session[TOTAL_PRICE_SESSION_KEY]), first.price * 5
+        )
+
+    def test_batch(self):
+        """Test that the batch operations are applied and saved at once."""
+        first, second = self.products[:2]
+        response = self._post_json(
+            "/cart/batch/",
+            {
+                "operations": [
+                    {"action": "add", "product_id": first.id, "quantity": 1},
+                    {"action": "add", "product_id": second.id, "quantity": 1},
+                    {
+                        "action": "update",
+                        "product_id": first.id,
+                        "quantity": 3,
+                    },
+                    {"action": "remove", "product_id": second.id},
+                ]
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "quantity": 3,
+                "total_price": str(first.price * 3),
+                "products": {str(first.id): 3},
+            },
+        )
+        self.assertEqual(self._get_session_quantities(), {str(first.id): 3})
+
+    def test_cart_size_limit(self):
+        """
+        Test that the cart can't contain more than the maximum
+        if the session engine limits the cart size.
+        """
+        self._add_all_products()
+        extra_product = Product.objects.create(
+            name="Extra product",
+            description="Some content",
+            image="products/extra-product.webp",
+            price=1500,
+            year=2023,
+            brand=self.products[0].brand,
+            category=self.products[0].category,
+        )
+        self._post_json(
+            "/cart/add/", {"product_id": extra_product.id, "quantity": 1}
+        )
+        self.assertEqual(
+            len(self.client.session["cart"]),
+            settings.CART_MAX_PRODUCTS + (not self.is_cart_size_limited),
+        )
+
+    def test_checkout(self):
+        """Test that the checkout creates the order and clears the cart."""
+        self.assertTrue(
+            self.client.login(username="testuser", password="testpass")
+        )
+        first, second = self.products[:2]
+        for product in (first, second):
+            self._post_json(
+                "/cart/add/", {"product_id": product.id, "quantity": 2}
+            )
+
+        response = self.client.post(
+            "/order/checkout/",
+            {
+                "first_name": "Test",
+                "last_name": "User",
+                "phone_number": "+380501234567",
+                "address": "Street 1",
+            },
+        )
+        order = Order.objects.get(user=self.user)
+        self.assertRedirects(
+            response, order.get_absolute_url(), fetch_redirect_response=False
+        )
+        self.assertEqual(
+            Decimal(str(order.total_price)), (first.price + second.price) * 2
+        )
+        self.assertEqual(order.orderitem_set.count(), 2)
+        self.assertNotIn("cart", self.client.session)
+
+
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.db")
+class CartDatabaseSessionTest(_CartSessionTestMixin, TestCase):
+    """Test the cart with the database session engine."""
+
+
+@override_settings(
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db"
+)
+class CartCachedDatabaseSessionTest(_CartSessionTestMixin, TestCase):
+    """Test the cart with the cached database session engine."""
+
+
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+class CartCacheSessionTest(_CartSessionTestMixin, TestCase):
+    """Test the cart with the cache session engine."""
+
+
+@override_settings(
+    SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"
+)
+class CartSignedCookiesSessionTest(_CartSessionTestMixin, TestCase):
+    """Test the cart with the signed cookies session engine."""
+
+    is_cart_size_limited = True
+
+    def test_full_cart_cookie_fits_browser_limit(self):
+        """Test that the cookie of the full cart isn't too big."""
+        self.assertTrue(
+            self.client.login(username="testuser", password="testpass")
+        )
+        self._add_all_products()
+        self.assertEqual(
+            len(self.client.session["cart"]), settings.CART_MAX_PRODUCTS
+        )
+        cookie = self.client.cookies[settings.SESSION_COOKIE_NAME]
+        self.assertLess(len(cookie.OutputString()), MAX_COOKIE_SIZE)
@@ -14,4 +14,5 @@ urlpatterns = [
     path("add/", views.CartAddView.as_view()),
     path("update/", views.CartUpdateView.as_view()),
     path("remove/", views.CartRemoveView.as_view()),
+    path("batch/", views.CartBatchView.as_view(), name="batch"),
 ]
@@ -1,5 +1,6 @@
 from django.views import generic
-from django.http import HttpRequest, HttpResponse
+from django.core.exceptions import BadRequest
+from django.http import HttpRequest, HttpResponse, JsonResponse
 
 from general.views import BaseView
 from . import services
@@ -32,3 +33,19 @@ class CartRemoveView(BaseView, generic.View):
         """Returns response message from service removing function."""
         services.remove_product_from_cart(request)
         return HttpResponse(status=200)
+
+
+class CartBatchView(BaseView, generic.View):
+    """View for changing several products in the user's cart at once."""
+
+    def post(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """Applies the cart operations and returns the cart summary."""
+        summary = services.apply_cart_operations_and_get_summary(request)
+        if summary is None:
+            raise BadRequest(
+                "The request body must be JSON like {\"operations\": [...]} "
+                f"with at most {services.MAX_CART_OPERATIONS} operations."
+            )
+        return JsonResponse(
+            summary, json_dumps_params={"separators": (",", ":")}
+        )
@@ -0,0 +1,105 @@
+from typing import Any
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+
+_MISSING = object()
+
+
+class TwoTierCache(BaseCache):
+    """
+    Cache backend with a small per-process L1 cache in front of a shared
+    L2 cache. L1 entries live at most L1_TIMEOUT seconds, so changes made
+    by other processes become visible after that time. add() and incr()
+    are decided by L2, so it must do them atomically (e.g. Redis).
+    Options: L1_ALIAS, L2_ALIAS, L1_TIMEOUT.
+    """
+
+    def __init__(self, location: str, params: dict[str, Any]) -> None:
+        """Initializes the backend with the aliases of the both tiers."""
+        options = params.get("OPTIONS", {})
+        self.l1_alias = options.get("L1_ALIAS", "l1")
+        self.l2_alias = options.get("L2_ALIAS", "shared")
+        self.l1_timeout = options.get("L1_TIMEOUT", 5)
+        super().__init__(params)
+
+    @property
+    def l1(self) -> BaseCache:
+        """Returns the per-process (L1) cache."""
+        return caches[self.l1_alias]
+
+    @property
+    def l2(self) -> BaseCache:
+        """Returns the shared (L2) cache."""
+        return caches[self.l2_alias]
+
+    def _get_l1_timeout_by_(self, timeout: Any) -> Any:
+        """Returns the L1 timeout that isn't longer than the given one."""
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self.l1_timeout
+        return min(timeout, self.l1_timeout)
+
+    def get(self, key: str, default: Any = None, version=None) -> Any:
+        """Returns the value from L1 or from L2 (then stores it in L1)."""
+        if (value := self.l1.get(key, _MISSING, version)) is not _MISSING:
+            return value
+        if (value := self.l2.get(key, _MISSING, version)) is _MISSING:
+            return default
+        self.l1.set(key, value, self.l1_timeout, version)
+        return value
+
+    def get_many(self, keys, version=None) -> dict[str, Any]:
+        """Returns the values from L1 and the missing ones from L2."""
+        values = self.l1.get_many(keys, version)
+        if missing_keys := [key for key in keys if key not in values]:
+            l2_values = self.l2.get_many(missing_keys, version)
+            self.l1.set_many(l2_values, self.l1_timeout, version)
+            values.update(l2_values)
+        return values
+
+    def has_key(self, key: str, version=None) -> bool:
+        """Returns True if the key is in L1 or L2."""
+        return self.l1.has_key(key, version) or self.l2.has_key(key, version)
+
+    def set(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT, version=None):
+        """Sets the value in the both tiers."""
+        self.l2.set(key, value, timeout, version)
+        self.l1.set(key, value, self._get_l1_timeout_by_(timeout), version)
+
+    def set_many(self, data: dict, timeout=DEFAULT_TIMEOUT, version=None):
+        """Sets the values in the both tiers."""
+        failed_keys = self.l2.set_many(data, timeout, version)
+        self.l1.set_many(data, self._get_l1_timeout_by_(timeout), version)
+        return failed_keys
+
+    def add(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT, version=None):
+        """Adds the value to L2 (the only source of truth for locks)."""
+        if was_added := self.l2.add(key, value, timeout, version):
+            self.l1.set(key, value, self._get_l1_timeout_by_(timeout), version)
+        return was_added
+
+    def incr(self, key: str, delta: int = 1, version=None) -> int:
+        """Increments the value in L2 and refreshes it in L1."""
+        value = self.l2.incr(key, delta, version)
+        self.l1.set(key, value, self.l1_timeout, version)
+        return value
+
+    def touch(self, key: str, timeout=DEFAULT_TIMEOUT, version=None) -> bool:
+        """Updates the timeout of the L2 entry."""
+        return self.l2.touch(key, timeout, version)
+
+    def delete(self, key: str, version=None) -> bool:
+        """Deletes the value from the both tiers."""
+        self.l1.delete(key, version)
+        return self.l2.delete(key, version)
+
+    def delete_many(self, keys, version=None) -> None:
+        """Deletes the values from the both tiers."""
+        self.l1.delete_many(keys, version)
+        self.l2.delete_many(keys, version)
+
+    def clear(self) -> None:
+        """Clears the both tiers (L1 only in the current process)."""
+        self.l1.clear()
+        self.l2.clear()
@@ -0,0 +1,282 @@
+import html
+import re
+from functools import cache
+from html.parser import HTMLParser
+from typing import NamedTuple
+from urllib.parse import urljoin
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+
+# Critical CSS of a page is saved as the static file with this name
+CRITICAL_CSS_NAME_FORMAT = "css/critical/{page}.css"
+# The markup above the fold is the header and the first rows of the main
+# content (the title with messages and the first content row).
+FOLD_ROWS_COUNT = 2
+_VOID_ELEMENTS = set(
+    "area base br col embed hr img input link meta source track wbr".split()
+)
+
+_COMMENT_REGEX = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINK_TAG_REGEX = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_ATTRIBUTE_REGEX = re.compile(r'([\w-]+)\s*=\s*"\s*([^"]*?)\s*"')
+_CLASS_ATTRIBUTE_REGEX = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+_ID_ATTRIBUTE_REGEX = re.compile(r'\bid\s*=\s*"([^"]*)"')
+_SELECTOR_CLASS_REGEX = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_SELECTOR_ID_REGEX = re.compile(r"#(-?[_a-zA-Z][\w-]*)")
+_TAG_REGEX = re.compile(r"<([a-zA-Z][\w-]*)")
+_SELECTOR_TAG_REGEX = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_PSEUDO_REGEX = re.compile(r"::?[\w-]+(\([^)]*\))?")
+# Elements that are on every page (e.g. in selectors of the root)
+_ALWAYS_USED_TAGS = {"html", "body"}
+# States that can't be on the first paint (the full CSS handles them)
+_INTERACTION_STATE_REGEX = re.compile(
+    r":(hover|focus|focus-visible|focus-within|active|checked|disabled)\b"
+)
+_RELATIVE_URL_REGEX = re.compile(
+    r"url\(\s*(['\"]?)(?!data:|https?:|/)([^'\")]+)\1\s*\)"
+)
+
+
+class UsedSelectors(NamedTuple):
+    """Named tuple that holds classes, IDs and tags that are used in HTML."""
+
+    classes: set[str]
+    ids: set[str]
+    tags: set[str]
+
+
+class _FoldParser(HTMLParser):
+    """
+    HTML parser that finds the position (line and column) where
+    the given number of the top rows (elements with the 'row' class
+    that aren't in other rows) of the main element end.
+    """
+
+    def __init__(self, rows_count: int) -> None:
+        """Initializes the parser."""
+        super().__init__()
+        self.rows_count = rows_count
+        self.fold_position: tuple[int, int] | None = None
+        self._open_tags: list[tuple[str, bool]] = []  # (tag, is top row)
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """Opens the element (if it isn't void)."""
+        if self.fold_position is not None or tag in _VOID_ELEMENTS:
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        is_top_row = (
+            "row" in classes
+            and any(open_tag == "main" for open_tag, _ in self._open_tags)
+            and not any(is_row for _, is_row in self._open_tags)
+        )
+        self._open_tags.append((tag, is_top_row))
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        """Ignores self-closing elements."""
+
+    def handle_endtag(self, tag: str) -> None:
+        """Closes the element (and unclosed ones in it)."""
+        while self.fold_position is None and self._open_tags:
+            open_tag, is_top_row = self._open_tags.pop()
+            if open_tag != tag:
+                continue
+            if is_top_row:
+                self.rows_count -= 1
+                if self.rows_count == 0:
+                    self.fold_position = self.getpos()
+            break
+
+
+def get_above_the_fold_html_of_(
+    page_html: str, rows_count: int = FOLD_ROWS_COUNT
+) -> str:
+    """
+    Returns the markup of the page above the fold: from the start
+    to the end of the given number of the top rows of the main element
+    (the whole page if there are fewer rows).
+    """
+    parser = _FoldParser(rows_count)
+    parser.feed(page_html)
+    parser.close()
+    if parser.fold_position is None:
+        return page_html
+    line, column = parser.fold_position
+    lines = page_html.splitlines(keepends=True)
+    return "".join(lines[: line - 1]) + lines[line - 1][:column]
+
+
+def get_used_selectors_of_(page_html: str) -> UsedSelectors:
+    """Returns classes, IDs and tags of all elements of the HTML."""
+    return UsedSelectors(
+        classes={
+            name
+            for value in _CLASS_ATTRIBUTE_REGEX.findall(page_html)
+            for name in value.split()
+        },
+        ids=set(_ID_ATTRIBUTE_REGEX.findall(page_html)),
+        tags={tag.lower() for tag in _TAG_REGEX.findall(page_html)}
+        | _ALWAYS_USED_TAGS,
+    )
+
+
+def get_stylesheet_names_from_(page_html: str) -> list[str]:
+    """
+    Returns names of static stylesheets that are linked in the HTML
+    (loaded at once or preloaded to be loaded asynchronously).
+    Remote stylesheets (e.g. of fonts) aren't a part of the critical CSS,
+    so it's built offline from the pinned files.
+    """
+    names = []
+    for tag in _LINK_TAG_REGEX.findall(page_html):
+        attributes = {
+            name: html.unescape(value)
+            for name, value in _ATTRIBUTE_REGEX.findall(tag)
+        }
+        is_stylesheet = attributes.get("rel") == "stylesheet" or (
+            attributes.get("rel") == "preload"
+            and attributes.get("as") == "style"
+        )
+        url = attributes.get("href", "")
+        if is_stylesheet and url.startswith(staticfiles_storage.base_url):
+            name = url.removeprefix(staticfiles_storage.base_url)
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def read_stylesheet_by_(name: str) -> str:
+    """
+    Returns the content of the static stylesheet with relative URLs
+    (e.g. of images) resolved against the stylesheet URL.
+    """
+    if path := finders.find(name):
+        with open(path, encoding="utf-8") as file:
+            css = file.read()
+    else:  # a hashed name of the collectstatic build
+        with staticfiles_storage.open(name) as file:
+            css = file.read().decode("utf-8")
+    url = staticfiles_storage.base_url + name
+    return _RELATIVE_URL_REGEX.sub(
+        lambda match: f'url("{urljoin(url, match.group(2))}")', css
+    )
+
+
+def _get_block_end_index(css: str, start: int) -> int:
+    """Returns the index of the brace that closes the block at start."""
+    depth, index, quote = 0, start, None
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    return len(css)
+
+
+def _split_rules(css: str) -> list[tuple[str, str]]:
+    """Returns preludes (selectors or at-rules) and bodies of the rules."""
+    rules, index = [], 0
+    while (block_start := css.find("{", index)) != -1:
+        prelude = css[index:block_start].strip()
+        # Statement at-rules (e.g. @charset) before the rule
+        while prelude.startswith("@") and ";" in prelude:
+            prelude = prelude.split(";", 1)[1].strip()
+        block_end = _get_block_end_index(css, block_start)
+        rules.append((prelude, css[block_start + 1 : block_end].strip()))
+        index = block_end + 1
+    return rules
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """Returns the selectors of the comma-separated list."""
+    selectors, depth, start = [], 0, 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:index].strip())
+            start = index + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def _is_selector_used(selector: str, used: UsedSelectors) -> bool:
+    """Checks if the selector can match elements on the first paint."""
+    without_attributes = re.sub(r"\[[^\]]*\]", "", selector)
+    tags = _SELECTOR_TAG_REGEX.findall(
+        _PSEUDO_REGEX.sub("", without_attributes)
+    )
+    return (
+        not _INTERACTION_STATE_REGEX.search(without_attributes)
+        and set(_SELECTOR_CLASS_REGEX.findall(without_attributes))
+        <= used.classes
+        and set(_SELECTOR_ID_REGEX.findall(without_attributes)) <= used.ids
+        and {tag.lower() for tag in tags} <= used.tags
+    )
+
+
+def _collapse_whitespace(css: str) -> str:
+    """Returns the CSS with whitespace sequences replaced by one space."""
+    return re.sub(r"\s+", " ", css).strip()
+
+
+def extract_critical_css(css: str, used: UsedSelectors) -> str:
+    """
+    Returns (minified) rules of the CSS that match the used classes and IDs,
+    at-rules with such rules, custom properties and font faces.
+    """
+    critical_rules = []
+    for prelude, body in _split_rules(_COMMENT_REGEX.sub("", css)):
+        prelude = _collapse_whitespace(prelude)
+        if prelude.startswith(("@media", "@supports")):
+            if inner_css := extract_critical_css(body, used):
+                critical_rules.append(f"{prelude}{{{inner_css}}}")
+        elif prelude.startswith("@font-face"):
+            critical_rules.append(f"{prelude}{{{_collapse_whitespace(body)}}}")
+        elif not prelude.startswith("@"):  # e.g. not @keyframes
+            selectors = [
+                selector
+                for selector in _split_selectors(prelude)
+                if _is_selector_used(selector, used)
+            ]
+            if selectors:
+                critical_rules.append(
+                    f"{','.join(selectors)}{{{_collapse_whitespace(body)}}}"
+                )
+    return "".join(critical_rules)
+
+
+def build_critical_css_of_(page_html: str) -> str:
+    """
+    Returns the critical CSS of the page: rules of its static stylesheets
+    that are used by its markup above the fold (so the page can be
+    rendered before the stylesheets are loaded).
+    """
+    used = get_used_selectors_of_(get_above_the_fold_html_of_(page_html))
+    return "".join(
+        extract_critical_css(read_stylesheet_by_(name), used)
+        for name in get_stylesheet_names_from_(page_html)
+    )
+
+
+@cache
+def get_critical_css_of_(page: str) -> str:
+    """Returns the built critical CSS of the page ("" if there is none)."""
+    if path := finders.find(CRITICAL_CSS_NAME_FORMAT.format(page=page)):
+        with open(path, encoding="utf-8") as file:
+            return file.read()
+    return ""
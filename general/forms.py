@@ -1,3 +1,10 @@
+from typing import Any, Callable, Iterable, Iterator
+
+from django import forms
+from django.db.models import Model
+from django.core.exceptions import ValidationError
+
+
 FIELD_WIDGET_ATTRS_CLASS = "w-50 form-control mb-2"
 
 
@@ -6,3 +13,97 @@ def get_field_widget_attrs_with_placeholder_(
 ) -> dict[str, str]:
     """Returns a dict of field widget attributes with the given placeholder."""
     return {"class": FIELD_WIDGET_ATTRS_CLASS, "placeholder": placeholder}
+
+
+class _ProvidedObjectsChoiceIterator(forms.models.ModelChoiceIterator):
+    """Choice iterator over the objects from the field objects provider."""
+
+    def __iter__(self) -> Iterator[tuple[Any, str]]:
+        """Yields the empty choice (if any) and the provided object choices."""
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.field.get_provided_objects():
+            yield self.choice(obj)
+
+    def __len__(self) -> int:
+        """Returns the number of choices."""
+        return len(self.field.get_provided_objects()) + (
+            self.field.empty_label is not None
+        )
+
+    def __bool__(self) -> bool:
+        """Checks if there are any choices."""
+        return self.field.empty_label is not None or bool(
+            self.field.get_provided_objects()
+        )
+
+
+class _ProvidedObjectsFieldMixin:
+    """
+    Mixin for model choice fields that take their objects from the given
+    provider (for example, from cache) only when they are needed,
+    instead of querying the database for choices and for validation.
+    """
+
+    iterator = _ProvidedObjectsChoiceIterator
+
+    def __init__(
+        self, objects_provider: Callable[[], list[Model]], *args, **kwargs
+    ) -> None:
+        """Saves the objects provider and initializes the field."""
+        self.objects_provider = objects_provider
+        self._objects_by_pk: dict[Any, Model] | None = None
+        super().__init__(*args, **kwargs)
+
+    def __deepcopy__(self, memo: dict) -> "_ProvidedObjectsFieldMixin":
+        """Returns a copy of the field without the provided objects."""
+        result = super().__deepcopy__(memo)
+        result._objects_by_pk = None
+        return result
+
+    def get_provided_objects(self) -> list[Model]:
+        """Returns the provided objects (gets them once per field copy)."""
+        if self._objects_by_pk is None:
+            self._objects_by_pk = {
+                obj.pk: obj for obj in self.objects_provider()
+            }
+        return list(self._objects_by_pk.values())
+
+    def get_provided_object_by_(self, value: Any) -> Model:
+        """Returns the provided object by the primary key value."""
+        if isinstance(value, Model):
+            value = value.pk
+        self.get_provided_objects()
+        try:
+            return self._objects_by_pk[int(value)]
+        except (KeyError, ValueError, TypeError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+
+class ProvidedModelChoiceField(
+    _ProvidedObjectsFieldMixin, forms.ModelChoiceField
+):
+    """ModelChoiceField with choices from the given objects provider."""
+
+    def to_python(self, value: Any) -> Model | None:
+        """Returns the provided object by the value or None if it's empty."""
+        if value in self.empty_values:
+            return None
+        return self.get_provided_object_by_(value)
+
+
+class ProvidedModelMultipleChoiceField(
+    _ProvidedObjectsFieldMixin, forms.ModelMultipleChoiceField
+):
+    """ModelMultipleChoiceField with choices from the objects provider."""
+
+    def _check_values(self, value: Iterable[Any]) -> list[Model]:
+        """Returns the list of the provided objects by the given values."""
+        return [
+            self.get_provided_object_by_(pk_value)
+            for pk_value in dict.fromkeys(value)
+        ]
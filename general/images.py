@@ -0,0 +1,149 @@
+import hashlib
+import io
+import os
+import re
+
+from PIL import Image
+
+try:  # Pillow encodes AVIF only with the plugin (pillow-avif-plugin).
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+
+MAX_IMAGE_WIDTH = 800  # px
+WEBP_QUALITY = 80
+AVIF_QUALITY = 60
+
+# Widths of the smaller copies of an image for responsive image tags
+RENDITION_WIDTHS = (160, 320, 480, 800)  # px
+FULL_WIDTH_RENDITION_WIDTHS = (480, 800, 1200, 1600, 1920)  # px
+RENDITIONS_DIR_NAME = "renditions"
+
+# Content hash in file names (e.g. "slug.0123456789ab.webp"),
+# so the files can be cached forever.
+CONTENT_HASH_LENGTH = 12
+CONTENT_HASH_REGEX = re.compile(r"\.[0-9a-f]{%d}$" % CONTENT_HASH_LENGTH)
+
+
+def get_content_hash_of_(content: bytes) -> str:
+    """Returns the content hash for a file name."""
+    return hashlib.md5(content).hexdigest()[:CONTENT_HASH_LENGTH]
+
+
+def is_content_hashed_(file_name: str) -> bool:
+    """Checks if the file name contains the content hash."""
+    stem = os.path.splitext(file_name)[0]
+    return CONTENT_HASH_REGEX.search(stem) is not None
+
+
+def _get_stem_without_hash_of_(file_name: str) -> str:
+    """Returns the file name without the extension and content hash."""
+    return CONTENT_HASH_REGEX.sub("", os.path.splitext(file_name)[0])
+
+
+def _get_content_hashed_path_of_(path: str, content: bytes) -> str:
+    """Returns the path of the file with the content hash in its name."""
+    directory, file_name = os.path.split(path)
+    stem = _get_stem_without_hash_of_(file_name)
+    extension = os.path.splitext(file_name)[1]
+    return os.path.join(
+        directory, f"{stem}.{get_content_hash_of_(content)}{extension}"
+    )
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """
+    Writes the content to the file atomically (to a temporary file that
+    replaces it), so the file is never served partially written.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(content)
+    os.replace(temporary_path, path)
+
+
+def save_optimized_copy_of_image_file(
+    path: str, max_width: int = MAX_IMAGE_WIDTH
+) -> str:
+    """
+    Saves the resized (if it's wider than max_width) and optimized (WebP)
+    copy of the image file next to it with the content hash in its name
+    and returns its path. The original file isn't changed, so it can be
+    served until the new name is saved. It doesn't need Django, so it can
+    run in worker processes.
+    """
+    with Image.open(path) as img:
+        img.load()
+        if img.width > max_width:
+            ratio = max_width / float(img.width)
+            new_height = int(ratio * img.height)
+            img = img.resize((max_width, new_height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, "webp", quality=WEBP_QUALITY, optimize=True)
+
+    content = buffer.getvalue()
+    new_path = _get_content_hashed_path_of_(path, content)
+    if new_path != path:
+        _write_file(new_path, content)
+    return new_path
+
+
+def get_rendition_formats() -> tuple[str, ...]:
+    """Returns formats of renditions (AVIF only if Pillow can encode it)."""
+    Image.init()
+    if "AVIF" in Image.SAVE:
+        return ("avif", "webp")
+    return ("webp",)
+
+
+def create_image_renditions(
+    path: str, widths: tuple[int, ...] = RENDITION_WIDTHS
+) -> dict[str, dict[str, str]]:
+    """
+    Saves copies of the image file with the given widths (but not wider
+    than the image) in every rendition format to the 'renditions' folder
+    next to it and returns their (content-hashed) paths by format and width.
+    """
+    directory, file_name = os.path.split(path)
+    stem = _get_stem_without_hash_of_(file_name)
+    renditions_directory = os.path.join(directory, RENDITIONS_DIR_NAME)
+    os.makedirs(renditions_directory, exist_ok=True)
+
+    renditions = {}
+    with Image.open(path) as img:
+        img.load()
+        for image_format in get_rendition_formats():
+            renditions[image_format] = {}
+            quality = AVIF_QUALITY if image_format == "avif" else WEBP_QUALITY
+            for width in sorted({min(w, img.width) for w in widths}):
+                height = max(round(img.height * width / img.width), 1)
+                buffer = io.BytesIO()
+                img.resize((width, height), Image.LANCZOS).save(
+                    buffer, image_format, quality=quality
+                )
+                content = buffer.getvalue()
+                rendition_path = os.path.join(
+                    renditions_directory,
+                    f"{stem}-{width}w.{get_content_hash_of_(content)}"
+                    f".{image_format}",
+                )
+                _write_file(rendition_path, content)
+                renditions[image_format][str(width)] = rendition_path
+    return renditions
+
+
+def process_image_file(
+    path: str,
+    max_width: int | None = MAX_IMAGE_WIDTH,
+    widths: tuple[int, ...] = RENDITION_WIDTHS,
+) -> tuple[str, dict[str, dict[str, str]]]:
+    """
+    Saves the optimized copy of the image file with the content hash
+    in its name (unless max_width is None, then the original is kept)
+    and creates its renditions. Returns the path of the copy (or original)
+    and paths of the renditions by format and width.
+    """
+    if max_width is not None:
+        path = save_optimized_copy_of_image_file(path, max_width)
+    return path, create_image_renditions(path, widths)
@@ -0,0 +1,7 @@
+from django.conf import settings
+from django.core.files.storage import Storage, default_storage
+
+
+def get_media_url_of_(name: str, storage: Storage = default_storage) -> str:
+    """Returns the URL of the media file on the media origin."""
+    return settings.MEDIA_ORIGIN + storage.url(name)
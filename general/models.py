@@ -1,4 +1,3 @@
-from PIL import Image
 from uuid import uuid4
 
 from django.db import models
@@ -7,6 +6,9 @@ from django.conf import settings
 from django.utils.text import slugify
 from django.contrib.auth.models import User
 
+from .images import RENDITION_WIDTHS
+from .media import get_media_url_of_
+
 
 class ModelWithUUIDPK(models.Model):
     """Abstract model with 'id' UUIDField as primary key."""
@@ -77,34 +79,113 @@ class ModelWithDescription(models.Model):
 
 
 class ModelWithImage(models.Model):
-    """Abstract model with 'image' ImageField."""
+    """
+    Abstract model with 'image' ImageField.
+    A changed image is renamed on saving and marked for processing
+    by the image processing worker, which resizes and optimizes it
+    (if it's allowed) and creates its renditions (smaller copies for srcset).
+    """
 
     image = models.ImageField(
         upload_to="content/", blank=False, verbose_name="Image"
     )
+    # Rendition names by format and width, e.g. {"webp": {"160": "..."}}
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Image renditions",
+    )
+
+    # Whether the worker resizes the image itself (renditions are always
+    # created) and the widths of the renditions
+    is_allow_to_resize = True
+    image_rendition_widths = RENDITION_WIDTHS
+    # Whether the saved image must be processed by the worker
+    is_image_processing_required = False
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remembers the loaded image name to track its changes."""
+        instance = super().from_db(db, field_names, values)
+        if "image" in field_names:
+            instance._loaded_image_name = values[field_names.index("image")]
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None) -> None:
+        """Remembers the reloaded image name (e.g. renamed by the worker)."""
+        super().refresh_from_db(using, fields)
+        if fields is None or "image" in fields:
+            self._loaded_image_name = self.image.name
 
     def save(self, *args, **kwargs):
-        """Changes the image name and optimize if it's allowed."""
-        is_allow_to_resize_image = self._get_allow_for_image_resizing()
+        """Changes the image name and marks it for processing if allowed."""
+        # It's read by the post_save signal receivers.
+        self.is_image_processing_required = (
+            self._get_allow_for_image_resizing() and not settings.TESTING
+        )
         super().save(*args, **kwargs)
-        if (
-                is_allow_to_resize_image
-                and self.is_allow_to_resize
-                and not settings.TESTING
-        ):
-            self._resize_and_optimize_image()
+        self._loaded_image_name = self.image.name
 
     def _get_allow_for_image_resizing(self) -> bool:
         """Checks instance and returns an allow for resizing after saving."""
         if self._is_not_new_instance():
-            prev_instance = type(self).objects.get(pk=self.pk)
-            if prev_instance.image != self.image:
-                prev_instance.image.delete(save=False)
+            prev_image_name = self._get_loaded_image_name()
+            if prev_image_name != self.image.name:
+                if prev_image_name:
+                    self.image.storage.delete(prev_image_name)
+                self._delete_image_renditions()
                 return self._set_image_name_and_allow_resizing()
             return False
         else:  # if it's a new instance
             return self._set_image_name_and_allow_resizing()
 
+    def _delete_image_renditions(self) -> None:
+        """Deletes rendition files of the previous image."""
+        for renditions in self.image_renditions.values():
+            for name in renditions.values():
+                self.image.storage.delete(name)
+        self.image_renditions = {}
+
+    def get_image_url(self) -> str:
+        """Returns the image URL on the media origin."""
+        return get_media_url_of_(self.image.name, self.image.storage)
+
+    def get_image_rendition_urls(
+        self, image_format: str = "webp"
+    ) -> list[tuple[int, str]]:
+        """Returns widths and URLs of the image renditions (narrow first)."""
+        renditions = self.image_renditions.get(image_format, {})
+        return sorted(
+            (int(width), get_media_url_of_(name, self.image.storage))
+            for width, name in renditions.items()
+        )
+
+    def get_image_url_for_(self, width: int) -> str:
+        """
+        Returns the URL of the narrowest WebP rendition that is not narrower
+        than the given width (or the image URL if there is no such one).
+        """
+        for rendition_width, url in self.get_image_rendition_urls():
+            if rendition_width >= width:
+                return url
+        return self.get_image_url()
+
+    def _get_loaded_image_name(self) -> str | None:
+        """
+        Returns the image name that was loaded from the database
+        (queries it only if the instance wasn't loaded with the image).
+        """
+        try:
+            return self._loaded_image_name
+        except AttributeError:
+            return (
+                type(self)
+                .objects.filter(pk=self.pk)
+                .values_list("image", flat=True)
+                .first()
+            )
+
     def _is_not_new_instance(self) -> bool:
         """Returns True if it's not a new instance and False if it is."""
         return self.pk is not None
@@ -118,18 +199,6 @@ class ModelWithImage(models.Model):
         self.image.name = f"{image_name}.webp"
         return True
 
-    def _resize_and_optimize_image(self) -> None:
-        """Resizes the image if it's larger than 800px and optimizes."""
-        img = Image.open(self.image)
-
-        if img.width > 800:
-            ratio = 800 / float(img.width)
-            new_height = int(ratio * img.height)
-            img = img.resize((800, new_height), Image.ANTIALIAS)
-
-        img.save(self.image.path, "webp", quality=80, optimize=True)
-        img.close()
-
     class Meta:
         abstract = True
 
@@ -0,0 +1,289 @@
+import json
+from typing import Any, Iterator
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator, InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django.utils.functional import cached_property
+
+
+CURSOR_SALT = "general.pagination.cursor"
+
+# Planner estimates below this number are replaced with the exact count.
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the number of objects from the PostgreSQL planner
+    instead of an exact COUNT(*) if there are a lot of them.
+    """
+
+    exact_count_threshold = EXACT_COUNT_THRESHOLD
+
+    @cached_property
+    def is_estimated(self) -> bool:
+        """Checks if the number of objects is estimated."""
+        return self._estimated_count is not None
+
+    @cached_property
+    def _estimated_count(self) -> int | None:
+        """Returns the planner estimate if it's above the threshold."""
+        if not isinstance(self.object_list, QuerySet):
+            return None
+        estimate = _get_planner_row_estimate_of_(self.object_list)
+        if estimate is None or estimate < self.exact_count_threshold:
+            return None
+        return estimate
+
+    @cached_property
+    def count(self) -> int:
+        """Returns the estimated or the exact number of objects."""
+        if self._estimated_count is not None:
+            return self._estimated_count
+        return super().count
+
+    def validate_number(self, number: Any) -> int:
+        """
+        Validates the page number without the upper limit
+        if the number of pages is estimated (pages past the end are empty).
+        """
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise InvalidPage("That page number is not an integer")
+        if number < 1:
+            raise InvalidPage("That page number is less than 1")
+        return number
+
+
+def _get_planner_row_estimate_of_(queryset: QuerySet) -> int | None:
+    """Returns the number of rows estimated by the PostgreSQL planner."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class _CursorSerializer:
+    """Serializer for cursor tokens that supports Decimal values."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Returns the object in compact JSON."""
+        return json.dumps(
+            obj, separators=(",", ":"), cls=DjangoJSONEncoder
+        ).encode("latin-1")
+
+    def loads(self, data: bytes) -> Any:
+        """Returns the object from JSON."""
+        return json.loads(data.decode("latin-1"))
+
+
+class KeysetPage:
+    """Page of objects that are located after or before the cursor."""
+
+    def __init__(
+        self,
+        object_list: list[Model],
+        paginator: "KeysetPaginator",
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        """Initializes the page with the objects and its neighbours."""
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self) -> Iterator[Model]:
+        """Iterates over the objects of the page."""
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        """Returns the number of objects on the page."""
+        return len(self.object_list)
+
+    def __repr__(self) -> str:
+        """Returns the page representation."""
+        return f"<KeysetPage of {len(self)} objects>"
+
+    def has_next(self) -> bool:
+        """Checks if there is a next page."""
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        """Checks if there is a previous page."""
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        """Checks if there is a next or previous page."""
+        return self._has_next or self._has_previous
+
+    @cached_property
+    def next_cursor(self) -> str | None:
+        """Returns the cursor of the next page or None."""
+        if not self._has_next:
+            return None
+        return self.paginator.get_cursor_by_(self.object_list[-1])
+
+    @cached_property
+    def previous_cursor(self) -> str | None:
+        """Returns the cursor of the previous page or None."""
+        if not self._has_previous:
+            return None
+        return self.paginator.get_cursor_by_(
+            self.object_list[0], is_previous=True
+        )
+
+
+class KeysetPaginator:
+    """
+    Paginator that seeks to the page by the values of the ordering fields
+    of its neighbour object (passed in a signed opaque cursor) instead of
+    OFFSET, so every page is fetched by an index without COUNT(*).
+    """
+
+    is_keyset = True
+
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        """Initializes the paginator with the queryset and page size."""
+        self.ordering = get_keyset_ordering_of_(queryset)
+        if self.ordering is None:
+            raise ValueError("The queryset ordering doesn't support keysets.")
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def get_page(self, cursor: str | None) -> KeysetPage:
+        """Returns the page after (before) the cursor or the first page."""
+        if not cursor:
+            return self._get_page_after_(None)
+
+        try:
+            data = signing.loads(
+                cursor, salt=CURSOR_SALT, serializer=_CursorSerializer
+            )
+        except signing.BadSignature:
+            raise InvalidPage("That cursor is invalid")
+        if data.get("o") != self.ordering:
+            raise InvalidPage("That cursor is for another ordering")
+
+        values = [
+            _get_field_by_(self.queryset.model, field_name).to_python(value)
+            for field_name, value in zip(self.ordering, data["v"])
+        ]
+        if data.get("p"):
+            return self._get_page_before_(values)
+        return self._get_page_after_(values)
+
+    def get_cursor_by_(self, obj: Model, is_previous: bool = False) -> str:
+        """Returns the signed cursor with values of the object."""
+        data = {
+            "o": self.ordering,
+            "v": [getattr(obj, f.lstrip("-")) for f in self.ordering],
+        }
+        if is_previous:
+            data["p"] = 1
+        return signing.dumps(
+            data, salt=CURSOR_SALT, serializer=_CursorSerializer
+        )
+
+    def _get_page_after_(self, values: list[Any] | None) -> KeysetPage:
+        """Returns the page of objects after the given values."""
+        queryset = self.queryset.order_by(*self.ordering)
+        if values is not None:
+            queryset = queryset.filter(
+                _get_keyset_filter_(self.ordering, values)
+            )
+        objects = list(queryset[: self.per_page + 1])
+        return KeysetPage(
+            objects[: self.per_page],
+            paginator=self,
+            has_next=len(objects) > self.per_page,
+            has_previous=values is not None,
+        )
+
+    def _get_page_before_(self, values: list[Any]) -> KeysetPage:
+        """Returns the page of objects before the given values."""
+        reversed_ordering = [_get_reversed_(f) for f in self.ordering]
+        objects = list(
+            self.queryset.order_by(*reversed_ordering).filter(
+                _get_keyset_filter_(reversed_ordering, values)
+            )[: self.per_page + 1]
+        )
+        return KeysetPage(
+            objects[: self.per_page][::-1],
+            paginator=self,
+            has_next=True,
+            has_previous=len(objects) > self.per_page,
+        )
+
+
+def get_keyset_ordering_of_(queryset: QuerySet) -> list[str] | None:
+    """
+    Returns the queryset ordering with the primary key at the end
+    (to make it unique) or None if the ordering can't be used for keysets
+    (e.g. it has expressions).
+    """
+    if queryset.query.order_by:
+        ordering = list(queryset.query.order_by)
+    elif queryset.query.default_ordering:
+        ordering = list(queryset.model._meta.ordering)
+    else:
+        ordering = []
+
+    for field_name in ordering:
+        if not isinstance(field_name, str) or field_name == "?":
+            return None
+        try:
+            field = _get_field_by_(queryset.model, field_name)
+        except FieldDoesNotExist:  # e.g. a field of a related model
+            return None
+        if field.is_relation:
+            return None
+
+    pk_names = ("pk", queryset.model._meta.pk.name)
+    if not any(f.lstrip("-") in pk_names for f in ordering):
+        # The same direction allows to scan an index like (price, id) back.
+        is_descending = bool(ordering) and ordering[0].startswith("-")
+        ordering.append("-pk" if is_descending else "pk")
+    return ordering
+
+
+def _get_field_by_(model: type[Model], field_name: str):
+    """Returns the local model field by the name (supports 'pk')."""
+    field_name = field_name.lstrip("-")
+    if field_name == "pk":
+        return model._meta.pk
+    return model._meta.get_field(field_name)
+
+
+def _get_reversed_(field_name: str) -> str:
+    """Returns the ordering field name with the opposite direction."""
+    if field_name.startswith("-"):
+        return field_name[1:]
+    return f"-{field_name}"
+
+
+def _get_keyset_filter_(ordering: list[str], values: list[Any]) -> Q:
+    """
+    Returns the filter of objects that are located after the given values
+    in the given ordering: (a > x) OR (a = x AND b > y) OR ...
+    """
+    keyset_filter, equal_filter = Q(), Q()
+    for field_name, value in zip(ordering, values):
+        name = field_name.lstrip("-")
+        lookup = "lt" if field_name.startswith("-") else "gt"
+        keyset_filter |= equal_filter & Q(**{f"{name}__{lookup}": value})
+        equal_filter &= Q(**{name: value})
+    return keyset_filter
@@ -0,0 +1,97 @@
+import os
+import re
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.test import Client
+
+
+_ASSET_URL_REGEX = re.compile(r'(?:src|href)="\s*([^"\s]+)\s*"')
+
+
+class StaticAsset(NamedTuple):
+    """Named tuple that holds sizes (bytes) of a static file of a page."""
+
+    name: str
+    size: int
+    transferred_size: int  # the smallest of the raw, Brotli and gzip files
+    is_immutable: bool  # cached forever (its name contains content hash)
+
+
+class PageAssets(NamedTuple):
+    """Named tuple that holds static files of a page."""
+
+    path: str
+    status_code: int
+    assets: list[StaticAsset]
+
+    @property
+    def size(self) -> int:
+        """Returns the raw size of all static files."""
+        return sum(asset.size for asset in self.assets)
+
+    @property
+    def first_visit_size(self) -> int:
+        """Returns the transferred size on the first visit (empty cache)."""
+        return sum(asset.transferred_size for asset in self.assets)
+
+    @property
+    def repeat_visit_size(self) -> int:
+        """
+        Returns the transferred size on a repeat visit, when only files
+        that can't be cached forever are downloaded (or revalidated) again.
+        """
+        return sum(
+            asset.transferred_size
+            for asset in self.assets
+            if not asset.is_immutable
+        )
+
+
+def _get_static_names_from_(html: str) -> list[str]:
+    """Returns names of static files that are linked in the HTML."""
+    static_prefix = staticfiles_storage.base_url
+    names = []
+    for url in _ASSET_URL_REGEX.findall(html):
+        name = url.split("?")[0].removeprefix(static_prefix)
+        if url.startswith(static_prefix) and name not in names:
+            names.append(name)
+    return names
+
+
+def _get_static_asset_by_(name: str, immutable_names: set[str]) -> StaticAsset:
+    """Returns sizes of the collected static file (0 if it's missing)."""
+    path = os.path.join(settings.STATIC_ROOT, name)
+    sizes = [
+        os.path.getsize(path + extension)
+        for extension in ("", ".br", ".gz")
+        if os.path.exists(path + extension)
+    ]
+    return StaticAsset(
+        name,
+        size=sizes[0] if os.path.exists(path) else 0,
+        transferred_size=min(sizes, default=0),
+        is_immutable=name in immutable_names,
+    )
+
+
+def get_page_assets_of_(paths: list[str]) -> list[PageAssets]:
+    """
+    Requests the pages and returns sizes of their collected static files
+    (the build of the collectstatic command).
+    """
+    client = Client(HTTP_HOST="localhost")  # it's in ALLOWED_HOSTS
+    # Hashed names of the manifest storage are cached forever by WhiteNoise.
+    immutable_names = set(
+        getattr(staticfiles_storage, "hashed_files", {}).values()
+    )
+    pages = []
+    for path in paths:
+        response = client.get(path)
+        names = _get_static_names_from_(response.content.decode())
+        assets = [
+            _get_static_asset_by_(name, immutable_names) for name in names
+        ]
+        pages.append(PageAssets(path, response.status_code, assets))
+    return pages
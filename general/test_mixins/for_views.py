@@ -52,6 +52,20 @@ class ViewNameTestMixin(_ViewTestMixin):
         self.assertEqual(response.status_code, 200)
 
 
+class ViewNumQueriesTestMixin(_ViewTestMixin):
+    """Test mixin to test a view's fixed number of database queries."""
+
+    url: str
+    num_queries: int
+
+    def test_view_makes_fixed_number_of_queries(self):
+        """Test that the view makes the expected number of queries."""
+        self._login_if_it_is_required()
+        with self.assertNumQueries(self.num_queries):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+
 class ViewTestMixin(ViewURLTestMixin, ViewNameTestMixin):
     """Base test mixin for views."""
 
@@ -0,0 +1,56 @@
+from django.test import SimpleTestCase
+
+from . import critical_css
+
+
+PAGE_HTML = """<html>
+<body>
+    <header class="panel-bg-color"><nav class="navbar"></nav></header>
+    <main>
+        <div class="container-fluid">
+            <div class="row"><h2 class="title">Title</h2></div>
+            <div class="row">
+                <div class="col-12"><div class="row inner"></div></div>
+                <img class="card-img" src="/media/image.webp" />
+            </div>
+            <div class="row"><table class="table below"></table></div>
+        </div>
+    </main>
+</body>
+</html>"""
+
+
+class CriticalCSSTest(SimpleTestCase):
+    """Test that the critical CSS is limited to the markup above the fold."""
+
+    def test_above_the_fold_html_ends_after_first_rows_of_main(self):
+        """Test that the fold is after the title and first content rows."""
+        fold_html = critical_css.get_above_the_fold_html_of_(PAGE_HTML)
+        self.assertIn('class="navbar"', fold_html)
+        self.assertIn('class="row inner"', fold_html)
+        self.assertIn('class="card-img"', fold_html)
+        self.assertNotIn("below", fold_html)
+
+    def test_whole_page_is_above_the_fold_without_enough_rows(self):
+        """Test that a page with fewer rows is used entirely."""
+        self.assertEqual(
+            critical_css.get_above_the_fold_html_of_(PAGE_HTML, 4),
+            PAGE_HTML,
+        )
+
+    def test_only_rules_of_markup_above_the_fold_are_extracted(self):
+        """Test that rules of classes and tags below the fold are skipped."""
+        used = critical_css.get_used_selectors_of_(
+            critical_css.get_above_the_fold_html_of_(PAGE_HTML)
+        )
+        css = (
+            ":root{--a:1}body{margin:0}h2{margin:0}table{width:100%}"
+            ".navbar{display:flex}.navbar:hover{color:red}"
+            ".below{color:red}a:not([href]){color:inherit}"
+            "@media (min-width:768px){.row>*{flex:1}.table{width:50%}}"
+        )
+        self.assertEqual(
+            critical_css.extract_critical_css(css, used),
+            ":root{--a:1}body{margin:0}h2{margin:0}.navbar{display:flex}"
+            "@media (min-width:768px){.row>*{flex:1}}",
+        )
@@ -0,0 +1,17 @@
+import logging
+
+logger = logging.getLogger("gunicorn.error")
+
+
+def post_worker_init(worker) -> None:
+    """Builds the in-memory catalog indexes before the worker takes requests."""
+    from shop.facets import facet_index
+    from shop.search import product_search_index
+    from shop.suggestions import suggestion_index
+
+    try:
+        facet_index.build()
+        product_search_index.build()
+        suggestion_index.build()
+    except Exception as e:  # The indexes will be built on the first request.
+        logger.warning(f"Catalog indexes were not built on startup: {e!r}")
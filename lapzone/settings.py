@@ -1,7 +1,9 @@
 import os
+import sys
 from pathlib import Path
 
 from django.contrib.messages import constants as messages
+from django.core.exceptions import ImproperlyConfigured
 from django.urls import reverse_lazy
 from dotenv import load_dotenv
 
@@ -14,6 +16,9 @@ SECRET_KEY = str(os.getenv("SECRET_KEY"))
 
 DEBUG = False
 
+# Images aren't processed while running tests.
+TESTING = "test" in sys.argv
+
 ALLOWED_HOSTS = [
     "127.0.0.1",
     "localhost",
@@ -50,6 +55,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "cart.middleware.CartQuantityCookieMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -92,6 +98,66 @@ DATABASES = {
     }
 }
 
+if TESTING:  # Tests must not read or clear the cache of the site.
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    }
+elif REDIS_URL := os.getenv("REDIS_URL"):
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+elif CACHE_DIR := os.getenv("CACHE_DIR"):
+    # Development only: incr() and add() of the file-based cache aren't
+    # atomic, so catalog generations and locks can collide if several
+    # processes (e.g. gunicorn workers) share it. Production needs Redis.
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": CACHE_DIR,
+    }
+else:
+    raise ImproperlyConfigured(
+        "Set REDIS_URL (or CACHE_DIR for a single-process development "
+        "server) to configure the shared cache."
+    )
+
+CACHES = {
+    # Two-tier cache: per-process L1 in front of the shared L2 cache
+    "default": {
+        "BACKEND": "general.cache_backends.TwoTierCache",
+        "OPTIONS": {
+            "L1_ALIAS": "l1",
+            "L2_ALIAS": "shared",
+            "L1_TIMEOUT": int(os.getenv("CACHE_L1_TIMEOUT", 5)),  # seconds
+        },
+    },
+    "l1": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "l1",
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("CACHE_L1_MAX_ENTRIES", 500)),
+        },
+    },
+    "shared": {
+        **SHARED_CACHE,
+        "KEY_PREFIX": "lapzone",
+        "TIMEOUT": 60 * 60,  # 1 hour
+    },
+}
+
+# "db", "cached_db", "cache" or "signed_cookies" (the last two don't write
+# sessions, e.g. carts of anonymous visitors, to the database at all)
+SESSION_ENGINE = "django.contrib.sessions.backends." + os.getenv(
+    "SESSION_BACKEND", "db"
+)
+# Sessions must not be served by the per-process L1 cache.
+SESSION_CACHE_ALIAS = "shared"
+
+# Liked products of a user are changed in place, so they must not be served
+# by a stale copy of the per-process L1 cache either.
+LIKES_CACHE_ALIAS = "shared"
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
@@ -113,7 +179,15 @@ USE_I18N = False
 USE_TZ = True
 
 STATIC_URL = "static/"
-STATIC_ROOT = BASE_DIR / "static"
+STATIC_ROOT = BASE_DIR / "staticfiles"  # collectstatic build
+STATICFILES_DIRS = [BASE_DIR / "static"]
+# Content-hashed names and Brotli/gzip copies (served by WhiteNoise
+# with far-future "immutable" caching). The build isn't made for tests.
+STATICFILES_STORAGE = (
+    "django.contrib.staticfiles.storage.StaticFilesStorage"
+    if TESTING
+    else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -154,6 +228,11 @@ LOGIN_REDIRECT_URL = reverse_lazy("customer:detail")
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Scheme and host of a CDN (or another server) that media files are served
+# from, e.g. "https://cdn.lapzone.store". If it's empty, they're served
+# by the site itself (with far-future caching of content-hashed files).
+MEDIA_ORIGIN = os.getenv("MEDIA_ORIGIN", "").rstrip("/")
+MEDIA_CACHE_MAX_AGE = 60 * 60  # 1 hour (for files without content hash)
 
 MESSAGE_TAGS = {messages.INFO: "primary", messages.ERROR: "danger"}
 
@@ -168,6 +247,17 @@ EMAIL_HOST_PASSWORD = str(os.getenv("EMAIL_HOST_PASSWORD"))
 EMAIL_BACKEND = str(os.getenv("EMAIL_BACKEND"))
 
 CART_SESSION_ID = "cart"
+# The navbar badge reads the total quantity of the cart from this cookie.
+CART_QUANTITY_COOKIE_NAME = "cart_quantity"
+# Keeps the session small enough for the signed cookie (~4 KB) backend
+# (carts of the other session backends aren't limited).
+CART_MAX_PRODUCTS = int(os.getenv("CART_MAX_PRODUCTS", 30))
+
+# "offset" (page numbers), "estimated" (page numbers without exact COUNT)
+# or "keyset" (next/previous cursors)
+PRODUCT_LIST_PAGINATION_MODE = os.getenv(
+    "PRODUCT_LIST_PAGINATION_MODE", "offset"
+)
 
 ERROR_MESSAGE = "There was an error; please try again later."
 
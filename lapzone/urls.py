@@ -1,5 +1,6 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, re_path, include
 from django.views.generic import TemplateView
 
 from . import views
@@ -39,4 +40,9 @@ urlpatterns = [
         name="feedback",
     ),
     path("robots.txt", views.get_robots_txt, name="robots_txt"),
+    re_path(
+        r"^%s(?P<path>.+)$" % settings.MEDIA_URL.lstrip("/"),
+        views.serve_media,
+        name="media",
+    ),
 ]
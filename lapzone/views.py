@@ -1,4 +1,9 @@
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
+
+from general.images import is_content_hashed_
 
 
 def get_robots_txt(request: HttpRequest) -> HttpResponse:
@@ -8,3 +13,20 @@ def get_robots_txt(request: HttpRequest) -> HttpResponse:
         Disallow: /
     """.replace("        ", "").strip()
     return HttpResponse(content, content_type="text/plain")
+
+
+def serve_media(request: HttpRequest, path: str) -> HttpResponse:
+    """
+    Returns the media file, which is cached forever if its name
+    contains the content hash (it's a new name for a new content).
+    """
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if is_content_hashed_(path):
+        patch_cache_control(
+            response, public=True, max_age=60 * 60 * 24 * 365, immutable=True
+        )
+    else:
+        patch_cache_control(
+            response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE
+        )
+    return response
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import MailingEmailAddress
+from .models import MailingEmailAddress, OutgoingEmail, Campaign
 
 
 @admin.register(MailingEmailAddress)
@@ -12,3 +12,51 @@ class MailingEmailAddressModelAdmin(admin.ModelAdmin):
     readonly_fields = ["id", "created"]
     search_help_text = "Searching by email address."
     list_display = fields = ["id", "email", "created"]
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailModelAdmin(admin.ModelAdmin):
+    """Admin class for the monitoring OutgoingEmail instances (outbox)."""
+
+    list_filter = ["status", "created"]
+    search_fields = ["to_email", "subject"]
+    search_help_text = "Searching by recipient and subject."
+    list_display = [
+        "subject",
+        "to_email",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    ]
+    readonly_fields = [
+        "created",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+        "last_error",
+    ]
+
+
+@admin.register(Campaign)
+class CampaignModelAdmin(admin.ModelAdmin):
+    """Admin class for the managing Campaign instances."""
+
+    list_filter = ["created", "finished_at"]
+    search_fields = ["subject"]
+    search_help_text = "Searching by subject."
+    list_display = [
+        "subject",
+        "created",
+        "sent_count",
+        "failed_count",
+        "finished_at",
+    ]
+    readonly_fields = [
+        "created",
+        "sent_count",
+        "failed_count",
+        "last_subscriber_created",
+        "last_subscriber_id",
+        "finished_at",
+    ]
@@ -0,0 +1,183 @@
+import time
+import logging
+from itertools import islice
+from smtplib import SMTPRecipientsRefused
+from typing import Callable, Iterator, NamedTuple
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F, Q, QuerySet
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape
+
+from .models import Campaign, MailingEmailAddress
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+TEMPLATE_NAME = "mailing/campaign.html"
+
+# Placeholders that are replaced with the subscriber data
+# in the HTML message that is rendered once for all subscribers
+EMAIL_PLACEHOLDER = "__SUBSCRIBER_EMAIL__"
+UNSUBSCRIBE_URL_PLACEHOLDER = "__UNSUBSCRIBE_URL__"
+
+
+class BatchResult(NamedTuple):
+    """Named tuple that holds the numbers of sent and refused emails."""
+
+    sent: int
+    failed: int
+
+
+def _get_subscribers_after_checkpoint_of_(
+    campaign: Campaign,
+) -> QuerySet[MailingEmailAddress]:
+    """Returns subscribers that the campaign hasn't been sent to yet."""
+    subscribers = MailingEmailAddress.objects.order_by("created", "id").only(
+        "id", "email", "created"
+    )
+    if campaign.last_subscriber_id is None:
+        return subscribers
+    return subscribers.filter(
+        Q(created__gt=campaign.last_subscriber_created)
+        | Q(
+            created=campaign.last_subscriber_created,
+            id__gt=campaign.last_subscriber_id,
+        )
+    )
+
+
+def _get_batches_of_(
+    subscribers: QuerySet[MailingEmailAddress], batch_size: int
+) -> Iterator[list[MailingEmailAddress]]:
+    """Yields lists of subscribers streamed from the database."""
+    iterator = subscribers.iterator(chunk_size=batch_size)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _render_html_message_of_(campaign: Campaign) -> str:
+    """Returns the HTML message with placeholders for subscriber data."""
+    return render_to_string(
+        TEMPLATE_NAME,
+        {
+            "subject": campaign.subject,
+            "html_content": campaign.html_content,
+            "email": EMAIL_PLACEHOLDER,
+            "unsubscribe_url": UNSUBSCRIBE_URL_PLACEHOLDER,
+        },
+    )
+
+
+def _get_message_for_(
+    subscriber: MailingEmailAddress,
+    campaign: Campaign,
+    html_message: str,
+    base_url: str,
+) -> EmailMultiAlternatives:
+    """Returns the campaign message for the subscriber."""
+    unsubscribe_url = base_url + reverse(
+        "mailing:delete", args=[subscriber.pk]
+    )
+    message = EmailMultiAlternatives(
+        settings.ACCOUNT_EMAIL_SUBJECT_PREFIX + campaign.subject,
+        campaign.message,
+        settings.EMAIL_HOST_USER,
+        [subscriber.email],
+    )
+    message.attach_alternative(
+        html_message.replace(EMAIL_PLACEHOLDER, escape(subscriber.email))
+        .replace(UNSUBSCRIBE_URL_PLACEHOLDER, escape(unsubscribe_url)),
+        "text/html",
+    )
+    return message
+
+
+def _save_checkpoint_of_(
+    campaign: Campaign,
+    last_subscriber: MailingEmailAddress,
+    result: BatchResult,
+) -> None:
+    """Saves the last sent subscriber, so sending can be resumed after it."""
+    campaign.last_subscriber_created = last_subscriber.created
+    campaign.last_subscriber_id = last_subscriber.id
+    Campaign.objects.filter(id=campaign.id).update(
+        last_subscriber_created=last_subscriber.created,
+        last_subscriber_id=last_subscriber.id,
+        sent_count=F("sent_count") + result.sent,
+        failed_count=F("failed_count") + result.failed,
+    )
+
+
+def _send_batch_to_(
+    subscribers: list[MailingEmailAddress],
+    campaign: Campaign,
+    connection,
+    html_message: str,
+    base_url: str,
+) -> BatchResult:
+    """
+    Sends the campaign to the subscribers one by one, skips (and logs)
+    the refused addresses and saves the checkpoint after the last
+    processed subscriber, even if the connection has failed.
+    """
+    sent = failed = 0
+    last_subscriber = None
+    try:
+        for subscriber in subscribers:
+            message = _get_message_for_(
+                subscriber, campaign, html_message, base_url
+            )
+            try:
+                is_sent = bool(connection.send_messages([message]))
+            except SMTPRecipientsRefused as e:
+                logger.warning(
+                    f"Campaign {campaign.id} was not sent to "
+                    f"{subscriber.email}: {e.recipients!r}"
+                )
+                is_sent = False
+            sent += is_sent
+            failed += not is_sent
+            last_subscriber = subscriber
+    finally:
+        if last_subscriber is not None:
+            _save_checkpoint_of_(
+                campaign, last_subscriber, BatchResult(sent, failed)
+            )
+    return BatchResult(sent, failed)
+
+
+def send_campaign(
+    campaign: Campaign,
+    base_url: str,
+    batch_size: int = BATCH_SIZE,
+    max_rate: float = 0,
+    on_batch_sent: Callable[[BatchResult], None] | None = None,
+) -> None:
+    """
+    Sends the campaign to all subscribers after its checkpoint in batches
+    over one connection and saves the checkpoint after every batch.
+    Sending is throttled to max_rate emails per second (0 - unlimited).
+    """
+    html_message = _render_html_message_of_(campaign)
+    subscribers = _get_subscribers_after_checkpoint_of_(campaign)
+
+    with get_connection() as connection:
+        for batch in _get_batches_of_(subscribers, batch_size):
+            batch_started_at = time.monotonic()
+            result = _send_batch_to_(
+                batch, campaign, connection, html_message, base_url
+            )
+            if on_batch_sent is not None:
+                on_batch_sent(result)
+
+            if max_rate:
+                batch_duration = len(batch) / max_rate
+                elapsed = time.monotonic() - batch_started_at
+                time.sleep(max(batch_duration - elapsed, 0))
+
+    Campaign.objects.filter(id=campaign.id).update(finished_at=timezone.now())
@@ -0,0 +1,88 @@
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from mailing import campaigns
+from mailing.models import Campaign
+
+
+class Command(BaseCommand):
+    """
+    Command that sends the campaign to all mailing subscribers.
+    It continues from the last sent batch if it has been interrupted.
+    """
+
+    help = "Sends (or resumes sending) the campaign to all subscribers."
+
+    def add_arguments(self, parser) -> None:
+        """Adds the campaign, batch and throttling arguments."""
+        parser.add_argument("campaign_id", type=int, help="Campaign ID.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=campaigns.BATCH_SIZE,
+            help="Number of emails sent at once (between checkpoints).",
+        )
+        parser.add_argument(
+            "--max-rate",
+            type=float,
+            default=0,
+            help="Maximum number of emails per second (0 - unlimited).",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="Site URL for links (https://<current site> by default).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Send the campaign from the first subscriber again.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Sends the campaign and reports the progress."""
+        try:
+            campaign = Campaign.objects.get(id=options["campaign_id"])
+        except Campaign.DoesNotExist:
+            raise CommandError(
+                f"Campaign {options['campaign_id']} does not exist."
+            )
+        if options["restart"]:
+            Campaign.objects.filter(id=campaign.id).update(
+                sent_count=0,
+                failed_count=0,
+                last_subscriber_created=None,
+                last_subscriber_id=None,
+                finished_at=None,
+            )
+            campaign.refresh_from_db()
+        elif campaign.finished_at is not None:
+            raise CommandError(
+                "The campaign has already been sent (use --restart)."
+            )
+
+        if campaign.last_subscriber_id is not None:
+            self.stdout.write(
+                f"Resuming after {campaign.sent_count} sent "
+                f"and {campaign.failed_count} failed emails."
+            )
+        base_url = options["base_url"]
+        if not base_url:
+            base_url = f"https://{Site.objects.get_current().domain}"
+        sent_count, failed_count = campaign.sent_count, campaign.failed_count
+
+        def report(result: campaigns.BatchResult) -> None:
+            nonlocal sent_count, failed_count
+            sent_count += result.sent
+            failed_count += result.failed
+            self.stdout.write(
+                f"Sent {sent_count} emails ({failed_count} failed)."
+            )
+
+        campaigns.send_campaign(
+            campaign,
+            base_url.rstrip("/"),
+            batch_size=options["batch_size"],
+            max_rate=options["max_rate"],
+            on_batch_sent=report,
+        )
+        self.stdout.write(self.style.SUCCESS("The campaign has been sent."))
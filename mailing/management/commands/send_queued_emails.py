@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from mailing import outbox
+
+
+class Command(BaseCommand):
+    """
+    Command (delivery worker) that sends emails from the outbox in batches
+    and retries failed ones with exponential backoff.
+    """
+
+    help = "Sends queued emails (once or continuously with --loop)."
+
+    def add_arguments(self, parser) -> None:
+        """Adds the batch, retry and loop arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=outbox.BATCH_SIZE,
+            help="Maximum number of emails sent over one connection.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=outbox.MAX_ATTEMPTS,
+            help="Number of attempts after which an email is failed.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting when it's empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds between polls of the empty outbox (with --loop).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Sends batches of due emails until the outbox is empty."""
+        while True:
+            try:
+                result = outbox.send_due_emails(
+                    options["batch_size"], options["max_attempts"]
+                )
+            except Exception as e:  # e.g. the mail server is unavailable
+                if not options["loop"]:
+                    raise
+                self.stderr.write(f"Batch was not sent: {e!r}")
+                time.sleep(options["interval"])
+                continue
+
+            if result.total:
+                self.stdout.write(
+                    f"Sent: {result.sent}, retried later: {result.retried}, "
+                    f"failed: {result.failed}."
+                )
+            elif options["loop"]:
+                time.sleep(options["interval"])
+            else:
+                break
@@ -0,0 +1,83 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:50
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mailing", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutgoingEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created datetime"
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255, verbose_name="Subject")),
+                ("message", models.TextField(verbose_name="Message")),
+                (
+                    "html_message",
+                    models.TextField(blank=True, verbose_name="HTML message"),
+                ),
+                ("from_email", models.CharField(max_length=255, verbose_name="From")),
+                ("to_email", models.EmailField(max_length=254, verbose_name="To")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Attempts"
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Next attempt at",
+                    ),
+                ),
+                ("sent_at", models.DateTimeField(null=True, verbose_name="Sent at")),
+                ("last_error", models.TextField(blank=True, verbose_name="Last error")),
+            ],
+            options={
+                "verbose_name": "Outgoing email",
+                "verbose_name_plural": "Outgoing emails",
+                "ordering": ["-created"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outgoingemail",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["next_attempt_at"],
+                name="outgoing_email_due_idx",
+            ),
+        ),
+    ]
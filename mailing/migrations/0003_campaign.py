@@ -0,0 +1,67 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mailing", "0002_outgoing_email"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Campaign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created datetime"
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255, verbose_name="Subject")),
+                ("message", models.TextField(verbose_name="Plain text message")),
+                ("html_content", models.TextField(verbose_name="HTML content")),
+                (
+                    "sent_count",
+                    models.PositiveIntegerField(
+                        default=0, editable=False, verbose_name="Sent emails"
+                    ),
+                ),
+                (
+                    "last_subscriber_created",
+                    models.DateTimeField(
+                        editable=False,
+                        null=True,
+                        verbose_name="Last subscriber created",
+                    ),
+                ),
+                (
+                    "last_subscriber_id",
+                    models.UUIDField(
+                        editable=False, null=True, verbose_name="Last subscriber ID"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        editable=False, null=True, verbose_name="Finished at"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Campaign",
+                "verbose_name_plural": "Campaigns",
+                "ordering": ["-created"],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mailing", "0003_campaign"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="failed_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Failed emails"
+            ),
+        ),
+    ]
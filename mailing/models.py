@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from general.models import ModelWithUUIDPK, ModelWithCreatedDateTime
 
@@ -19,3 +20,95 @@ class MailingEmailAddress(
         ordering = ["-created"]
         verbose_name = "Mailing email address"
         verbose_name_plural = "Mailing email addresses"
+
+
+class OutgoingEmail(ModelWithCreatedDateTime, models.Model):
+    """
+    A model representing an email in the outbox (delivery queue)
+    that is sent by the 'send_queued_emails' management command.
+    Fields: created, subject, message, html_message, from_email, to_email,
+    status, attempts, next_attempt_at, sent_at, last_error.
+    """
+
+    class Status(models.TextChoices):
+        """Delivery statuses of the outgoing email."""
+
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255, verbose_name="Subject")
+    message = models.TextField(verbose_name="Message")
+    html_message = models.TextField(blank=True, verbose_name="HTML message")
+    from_email = models.CharField(max_length=255, verbose_name="From")
+    to_email = models.EmailField(verbose_name="To")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Status",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="Attempts"
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name="Next attempt at"
+    )
+    sent_at = models.DateTimeField(null=True, verbose_name="Sent at")
+    last_error = models.TextField(blank=True, verbose_name="Last error")
+
+    def __str__(self) -> str:
+        """Returns string representation of the OutgoingEmail model."""
+        return f"'{self.subject}' to {self.to_email} ({self.status})"
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "Outgoing email"
+        verbose_name_plural = "Outgoing emails"
+        indexes = [
+            # Due emails for the delivery worker
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="outgoing_email_due_idx",
+            ),
+        ]
+
+
+class Campaign(ModelWithCreatedDateTime, models.Model):
+    """
+    A model representing an email campaign to all mailing subscribers
+    that is sent by the 'send_campaign' management command.
+    Fields: created, subject, message, html_content, sent_count,
+    failed_count, last_subscriber_created, last_subscriber_id, finished_at.
+    """
+
+    subject = models.CharField(max_length=255, verbose_name="Subject")
+    message = models.TextField(verbose_name="Plain text message")
+    html_content = models.TextField(verbose_name="HTML content")
+    sent_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Sent emails"
+    )
+    # Emails that were refused by the server (e.g. for invalid addresses)
+    failed_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Failed emails"
+    )
+    # Checkpoint: the last subscriber (in the sending order) that was sent
+    last_subscriber_created = models.DateTimeField(
+        null=True, editable=False, verbose_name="Last subscriber created"
+    )
+    last_subscriber_id = models.UUIDField(
+        null=True, editable=False, verbose_name="Last subscriber ID"
+    )
+    finished_at = models.DateTimeField(
+        null=True, editable=False, verbose_name="Finished at"
+    )
+
+    def __str__(self) -> str:
+        """Returns string representation of the Campaign model."""
+        return self.subject
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "Campaign"
+        verbose_name_plural = "Campaigns"
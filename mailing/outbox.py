@@ -0,0 +1,133 @@
+import logging
+from datetime import timedelta
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 60  # seconds (doubles after every failed attempt)
+BACKOFF_MAX = 60 * 60  # 1 hour
+# Claimed emails are not taken by other workers for this time.
+CLAIM_TIMEOUT = 5 * 60  # 5 minutes
+
+
+class BatchResult(NamedTuple):
+    """Named tuple that holds the numbers of processed emails of a batch."""
+
+    sent: int
+    retried: int
+    failed: int
+
+    @property
+    def total(self) -> int:
+        """Returns the number of processed emails."""
+        return self.sent + self.retried + self.failed
+
+
+def enqueue_email(
+    subject: str,
+    message: str,
+    to_email: str,
+    html_message: str = "",
+    from_email: str | None = None,
+) -> OutgoingEmail:
+    """Adds the email to the outbox (it's sent by the delivery worker)."""
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        message=message,
+        html_message=html_message,
+        from_email=from_email or settings.EMAIL_HOST_USER,
+        to_email=to_email,
+    )
+
+
+def _claim_due_emails(batch_size: int) -> list[OutgoingEmail]:
+    """
+    Returns due pending emails and postpones them for the claim timeout,
+    so concurrent workers don't send them twice.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=OutgoingEmail.Status.PENDING, next_attempt_at__lte=now
+            )
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        OutgoingEmail.objects.filter(id__in=[e.id for e in emails]).update(
+            next_attempt_at=now + timedelta(seconds=CLAIM_TIMEOUT)
+        )
+    return emails
+
+
+def _get_backoff_delay_by_(attempts: int) -> timedelta:
+    """Returns the delay before the next attempt (exponential backoff)."""
+    return timedelta(
+        seconds=min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+    )
+
+
+def _get_message_from_(
+    email: OutgoingEmail, connection
+) -> EmailMultiAlternatives:
+    """Returns the message to send by the outgoing email."""
+    message = EmailMultiAlternatives(
+        email.subject,
+        email.message,
+        email.from_email,
+        [email.to_email],
+        connection=connection,
+    )
+    if email.html_message:
+        message.attach_alternative(email.html_message, "text/html")
+    return message
+
+
+def send_due_emails(
+    batch_size: int = BATCH_SIZE, max_attempts: int = MAX_ATTEMPTS
+) -> BatchResult:
+    """
+    Sends a batch of due emails over one connection and schedules
+    a retry with backoff (or fails) every email that wasn't sent.
+    """
+    if not (emails := _claim_due_emails(batch_size)):
+        return BatchResult(0, 0, 0)
+
+    sent = retried = failed = 0
+    with get_connection() as connection:
+        for email in emails:
+            email.attempts += 1
+            try:
+                _get_message_from_(email, connection).send()
+            except Exception as e:
+                logger.warning(f"Email {email.id} was not sent: {e!r}")
+                email.last_error = repr(e)
+                if email.attempts >= max_attempts:
+                    email.status = OutgoingEmail.Status.FAILED
+                    failed += 1
+                else:
+                    email.next_attempt_at = (
+                        timezone.now() + _get_backoff_delay_by_(email.attempts)
+                    )
+                    retried += 1
+            else:
+                email.status = OutgoingEmail.Status.SENT
+                email.sent_at = timezone.now()
+                email.last_error = ""
+                sent += 1
+
+    OutgoingEmail.objects.bulk_update(
+        emails,
+        ["status", "attempts", "next_attempt_at", "sent_at", "last_error"],
+    )
+    return BatchResult(sent, retried, failed)
@@ -1,21 +1,23 @@
 from django.conf import settings
 from django.http import HttpRequest
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 
+from . import outbox
 from .models import MailingEmailAddress
 
 
 def send_mail_to_(
     mailing_email_address: MailingEmailAddress, request: HttpRequest
 ) -> None:
-    """Sends an email to the given email address."""
+    """
+    Queues a subscription confirmation email to the given email address
+    (it's sent by the delivery worker).
+    """
     subject_prefix = settings.ACCOUNT_EMAIL_SUBJECT_PREFIX
-    send_mail(
+    outbox.enqueue_email(
         f"{subject_prefix}You have successfully subscribed to our mailing",
         "You will be noticed about all our changes.",
-        settings.EMAIL_HOST_USER,
-        [mailing_email_address.email],
+        mailing_email_address.email,
         html_message=render_to_string(
             "mailing/email.html",
             {
@@ -0,0 +1,111 @@
+from io import StringIO
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from . import campaigns
+from .models import Campaign, MailingEmailAddress
+
+
+BASE_URL = "https://example.com"
+
+
+class SendCampaignTest(TestCase):
+    """Test that the campaign is sent once to every valid subscriber."""
+
+    subscribers_count = 5
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Sets up test data by creating subscribers and a campaign."""
+        for i in range(cls.subscribers_count):
+            MailingEmailAddress.objects.create(email=f"user{i}@example.com")
+        cls.emails = list(
+            MailingEmailAddress.objects.order_by("created", "id").values_list(
+                "email", flat=True
+            )
+        )
+        cls.campaign = Campaign.objects.create(
+            subject="News", message="News", html_content="<p>News</p>"
+        )
+
+    def _send_with_errors(self, errors_by_email: dict[str, Exception]):
+        """Sends the campaign, raising the errors for the given emails."""
+        send_messages = EmailBackend.send_messages
+
+        def send_or_raise(backend, messages):
+            if (email := messages[0].to[0]) in errors_by_email:
+                raise errors_by_email.pop(email)
+            return send_messages(backend, messages)
+
+        with mock.patch.object(
+            EmailBackend, "send_messages", autospec=True
+        ) as patched_send_messages:
+            patched_send_messages.side_effect = send_or_raise
+            campaigns.send_campaign(self.campaign, BASE_URL, batch_size=3)
+
+    def _get_sent_emails(self) -> list[str]:
+        """Returns the recipients of the sent messages."""
+        return [message.to[0] for message in mail.outbox]
+
+    def test_refused_address_is_skipped(self):
+        """Test that a refused address doesn't stop the campaign."""
+        refused_email = self.emails[1]
+        with self.assertLogs(campaigns.logger, "WARNING") as logs:
+            self._send_with_errors(
+                {
+                    refused_email: SMTPRecipientsRefused(
+                        {refused_email: (550, b"No such user")}
+                    )
+                }
+            )
+        self.assertIn(refused_email, logs.output[0])
+        self.assertEqual(
+            self._get_sent_emails(),
+            [email for email in self.emails if email != refused_email],
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(
+            (self.campaign.sent_count, self.campaign.failed_count),
+            (self.subscribers_count - 1, 1),
+        )
+        self.assertIsNotNone(self.campaign.finished_at)
+
+    def test_sending_is_resumed_after_last_sent_email(self):
+        """
+        Test that the checkpoint is saved after the last sent message
+        of the interrupted batch, so no message is sent twice.
+        """
+        with self.assertRaises(SMTPServerDisconnected):
+            self._send_with_errors({self.emails[4]: SMTPServerDisconnected()})
+        self.assertEqual(self._get_sent_emails(), self.emails[:4])
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.sent_count, 4)
+        self.assertIsNone(self.campaign.finished_at)
+
+        campaigns.send_campaign(self.campaign, BASE_URL, batch_size=3)
+        self.assertEqual(self._get_sent_emails(), self.emails)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.sent_count, self.subscribers_count)
+        self.assertIsNotNone(self.campaign.finished_at)
+
+    def test_command_resumes_and_finishes_campaign(self):
+        """Test that the command resumes the campaign only once."""
+        with self.assertRaises(SMTPServerDisconnected):
+            self._send_with_errors({self.emails[2]: SMTPServerDisconnected()})
+        stdout = StringIO()
+        call_command(
+            "send_campaign", self.campaign.id, base_url=BASE_URL, stdout=stdout
+        )
+        self.assertIn("Resuming after 2 sent and 0 failed", stdout.getvalue())
+        self.assertEqual(self._get_sent_emails(), self.emails)
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "send_campaign", self.campaign.id, base_url=BASE_URL
+            )
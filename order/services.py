@@ -1,37 +1,77 @@
+from decimal import Decimal
 from uuid import uuid4, UUID
-from typing import NoReturn
+from typing import NamedTuple, NoReturn
 
-from django.conf import settings
 from django.contrib import messages
+from django.db import transaction
 from django.db.models import QuerySet
 from django.contrib.auth import login
-from django.core.mail import send_mail
 from django.contrib.auth.models import User
 from django.http import Http404, HttpRequest
 from allauth.account.models import EmailAddress
 from django.template.loader import render_to_string
 from allauth.account.utils import send_email_confirmation
 
+from mailing import outbox
+from shop.models import Product
 from .forms import OrderCheckoutModelForm
 from .models import Order, OrderItem
-from cart.cart import Cart
+from cart.cart import Cart, get_cart_of_
+
+
+class OrderLine(NamedTuple):
+    """Named tuple that holds an ordered product with the snapshot prices."""
+
+    product: Product
+    quantity: int
+    price: Decimal
+    total_price: Decimal
+
+
+def _get_order_lines_and_total_price_from_(
+    cart: Cart,
+) -> tuple[list[OrderLine], Decimal]:
+    """
+    Returns order lines with the current prices of the cart products
+    (fetched with one query) and their total price.
+    """
+    quantities = cart.get_quantities()
+    products_by_id = Product.objects.only(
+        "name", "slug", "image", "price"
+    ).in_bulk(map(int, quantities))
+
+    lines, total_price = [], Decimal(0)
+    for product_id, quantity in quantities.items():
+        if (product := products_by_id.get(int(product_id))) is None:
+            continue  # The product has been deleted.
+        price = Decimal(str(product.price))
+        lines.append(OrderLine(product, quantity, price, price * quantity))
+        total_price += lines[-1].total_price
+    return lines, total_price
 
 
 def _send_email_to_customer_by_(
-    email: str, order_id: UUID, request: HttpRequest
+    email: str,
+    order_id: UUID,
+    lines: list[OrderLine],
+    total_price: Decimal,
+    request: HttpRequest,
 ) -> None:
-    """Sends a receipt email to the customer at the given email address."""
-    messages.info(request, f"We've just sent a receipt email to {email}")
-    send_mail(
+    """
+    Queues a receipt email to the customer at the given email address
+    (it's sent by the delivery worker after the transaction is committed).
+    """
+    outbox.enqueue_email(
         "Thank you for your order from LapZone!",
         "Your order has been received and is currently being processed.",
-        settings.EMAIL_HOST_USER,
-        [email],
+        email,
         html_message=render_to_string(
             "order/email.html",
             {
                 "email": email,
                 "order_id": order_id,
+                "lines": lines,
+                "total_price": total_price,
             },
             request=request,
         ),
@@ -92,23 +132,34 @@ def _get_or_create_user(
     return user
 
 
-def _create_order_for_user_with_data_from_(
-    cart: Cart, user: User, order_id: UUID
+def _create_order_for_user_with_(
+    lines: list[OrderLine],
+    total_price: Decimal,
+    user: User,
+    order_id: UUID,
+    email: str,
+    request: HttpRequest,
 ) -> str:
     """
-    Creates an order for the given user with the data from the given cart.
-    Returns the absolute url of the created order.
+    Creates an order with all its items for the given user and queues
+    its receipt email atomically. Returns the absolute url of the order.
     """
-    order = Order.objects.create(
-        id=order_id, user=user, total_price=cart.get_total_price()
-    )
-    for item_dict in cart:
-        OrderItem.objects.create(
-            order=order,
-            product=item_dict["product"],
-            quantity=item_dict["quantity"],
-            price=item_dict["price"],
-            total_price=item_dict["price"] * item_dict["quantity"],
+    with transaction.atomic():
+        order = Order.objects.create(
+            id=order_id, user=user, total_price=total_price
+        )
+        OrderItem.objects.bulk_create(
+            OrderItem(
+                order=order,
+                product=line.product,
+                quantity=line.quantity,
+                price=line.price,
+                total_price=line.total_price,
+            )
+            for line in lines
+        )
+        _send_email_to_customer_by_(
+            email, order_id, lines, total_price, request
         )
     return order.get_absolute_url()
 
@@ -117,19 +168,16 @@ def process_order_and_get_redirect_url(
     request: HttpRequest, form: OrderCheckoutModelForm
 ) -> str:
     """Processes an order by the given form and returns the redirect url."""
-    order_id = uuid4()
-    _send_email_to_customer_by_(
-        form.cleaned_data.get("email", None) or request.user.email,
-        order_id,
-        request,
-    )
+    cart = get_cart_of_(request)
+    lines, total_price = _get_order_lines_and_total_price_from_(cart)
     redirect_url = "/"
-    cart = Cart(request.session)
     if (user := _get_or_create_user(request, form)) is not None:
-        redirect_url = _create_order_for_user_with_data_from_(
-            cart, user, order_id
+        email = form.cleaned_data.get("email", None) or user.email
+        redirect_url = _create_order_for_user_with_(
+            lines, total_price, user, uuid4(), email, request
         )
         messages.success(request, "Order has successfully created.")
+        messages.info(request, f"We've just sent a receipt email to {email}")
     cart.clear()
     return redirect_url
 
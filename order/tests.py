@@ -0,0 +1,80 @@
+import json
+from unittest import mock
+
+from django.db import IntegrityError
+from django.contrib.messages import get_messages
+from django.test import TestCase
+
+from general.test_mixins.for_views import UserTestMixin, ProductTestMixin
+from mailing.models import OutgoingEmail
+from .models import Order, OrderItem
+
+
+class OrderCheckoutReceiptTest(UserTestMixin, ProductTestMixin, TestCase):
+    """Test that the receipt email is queued only with its order."""
+
+    form_data = {
+        "first_name": "Test",
+        "last_name": "User",
+        "email": "customer@example.com",
+        "phone_number": "+380501234567",
+        "address": "Street 1",
+        "is_create_profile": "False",
+    }
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Sets up test data by creating an user and a product."""
+        UserTestMixin.setUpTestData.__func__(cls)
+        ProductTestMixin.setUpTestData.__func__(cls)
+
+    def setUp(self) -> None:
+        """Adds the product to the cart."""
+        self.client.post(
+            "/cart/add/",
+            json.dumps({"product_id": self.product.id, "quantity": 1}),
+            content_type="application/json",
+        )
+
+    def _get_message_texts_of_(self, response) -> list[str]:
+        """Returns texts of the messages of the response."""
+        return [m.message for m in get_messages(response.wsgi_request)]
+
+    def test_receipt_is_queued_with_order(self):
+        """Test that the receipt of the created order is queued."""
+        self.assertTrue(
+            self.client.login(username="testuser", password="testpass")
+        )
+        response = self.client.post("/order/checkout/", self.form_data)
+        order = Order.objects.get(user=self.user)
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.to_email, self.user.email)
+        self.assertIn(str(order.id), email.html_message)
+        self.assertIn(
+            f"We've just sent a receipt email to {self.user.email}",
+            self._get_message_texts_of_(response),
+        )
+
+    def test_receipt_is_not_queued_without_order(self):
+        """Test that nothing is queued if no order is created."""
+        response = self.client.post("/order/checkout/", self.form_data)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(OutgoingEmail.objects.exists())
+        self.assertFalse(
+            any(
+                "receipt" in text
+                for text in self._get_message_texts_of_(response)
+            )
+        )
+
+    def test_receipt_is_rolled_back_with_order(self):
+        """Test that the receipt isn't queued if the order isn't saved."""
+        self.assertTrue(
+            self.client.login(username="testuser", password="testpass")
+        )
+        with mock.patch.object(
+            OrderItem.objects, "bulk_create", side_effect=IntegrityError
+        ), self.assertRaises(IntegrityError):
+            self.client.post("/order/checkout/", self.form_data)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(OutgoingEmail.objects.exists())
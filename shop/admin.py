@@ -63,9 +63,9 @@ class ModelWithImageAdminMixin:
     that inherited from abstract ModeWithImage."""
 
     def get_image(self, obj: models.Product | models.ProductShot) -> SafeText:
-        """Returns HTML image tag with product or product shot image url"""
+        """Returns HTML image tag with the smallest product (shot) image"""
         return mark_safe(
-            f"<img src='https://raw.githubusercontent.com/Gubchik123/LapZone/master{obj.image.url}' loading='lazy' width='60' height='60' />"
+            f"<img src='{obj.get_image_url_for_(60)}' loading='lazy' width='60' height='60' />"
         )
 
     get_image.short_description = "Mini image"
@@ -274,3 +274,29 @@ class CarouselImageModelAdmin(
         ("image", "get_image"),
         ("product", "get_product_link"),
     )
+
+
+@admin.register(models.ImageJob)
+class ImageJobModelAdmin(admin.ModelAdmin):
+    """Admin class for monitoring ImageJob instances (image queue)."""
+
+    list_filter = ("status", "model")
+    search_fields = ("image_name",)
+    list_display = (
+        "id",
+        "image_name",
+        "model",
+        "status",
+        "attempts",
+        "updated",
+    )
+    readonly_fields = (
+        "key",
+        "model",
+        "object_id",
+        "image_name",
+        "attempts",
+        "created",
+        "updated",
+        "last_error",
+    )
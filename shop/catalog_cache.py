@@ -0,0 +1,125 @@
+import time
+from typing import Any, Callable, Collection
+
+from django.core.cache import cache
+
+
+GENERATION_KEY = "catalog:generation"
+
+# Changed product IDs of every generation, so in-memory indexes of all
+# processes can be updated incrementally instead of being rebuilt
+CHANGES_TIMEOUT = 60 * 60  # 1 hour
+MAX_LOGGED_GENERATIONS = 1000
+ALL_PRODUCTS = "all"  # the change can affect all products
+
+LOCK_TIMEOUT = 10  # seconds
+LOCK_WAIT_TIMEOUT = 2  # seconds
+LOCK_POLL_INTERVAL = 0.05  # seconds
+
+_MISSING = object()
+
+
+def get_catalog_generation() -> int:
+    """Returns the current catalog generation (starts it if it's missing)."""
+    if (generation := cache.get(GENERATION_KEY)) is None:
+        _start_catalog_generation()
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_catalog_generation(
+    changed_product_ids: Collection[int] | None = None,
+) -> None:
+    """
+    Starts a new catalog generation, so all previous entries are stale,
+    and logs IDs of the changed products (None - all can be changed).
+    """
+    try:
+        generation = cache.incr(GENERATION_KEY)
+    except ValueError:  # The generation key has been evicted or is missing.
+        _start_catalog_generation()
+        return
+    cache.set(
+        _get_changes_key_by_(generation),
+        ALL_PRODUCTS
+        if changed_product_ids is None
+        else list(changed_product_ids),
+        CHANGES_TIMEOUT,
+    )
+
+
+def _get_changes_key_by_(generation: int) -> str:
+    """Returns the cache key of the changed product IDs of the generation."""
+    return f"catalog:changes:{generation}"
+
+
+def get_changed_product_ids_between(
+    old_generation: int, new_generation: int
+) -> set[int] | None:
+    """
+    Returns IDs of the products that have been changed after the old
+    generation up to the new one or None if they are unknown (e.g. the log
+    has expired or a change could affect all products).
+    """
+    if not 0 <= new_generation - old_generation <= MAX_LOGGED_GENERATIONS:
+        return None
+    keys = [
+        _get_changes_key_by_(generation)
+        for generation in range(old_generation + 1, new_generation + 1)
+    ]
+    changes = cache.get_many(keys)
+    product_ids = set()
+    for key in keys:
+        if (changed_ids := changes.get(key, ALL_PRODUCTS)) == ALL_PRODUCTS:
+            return None
+        product_ids.update(changed_ids)
+    return product_ids
+
+
+def _start_catalog_generation() -> None:
+    """
+    Sets a time-based generation, so an evicted generation key
+    can never bring back entries of an older catalog state.
+    """
+    cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def _get_entry_key_by_(name: str) -> str:
+    """Returns the cache key of the catalog entry of the current generation."""
+    return f"catalog:{get_catalog_generation()}:{name}"
+
+
+def get_or_set_catalog_entry(
+    name: str, get_value: Callable[[], Any], timeout: int
+) -> Any:
+    """
+    Returns the catalog entry by the given name from cache or computes it
+    with the given function and caches it for the given timeout (seconds).
+    Only one process computes a missing entry, the others wait for it.
+    """
+    key = _get_entry_key_by_(name)
+    if (value := cache.get(key, _MISSING)) is not _MISSING:
+        return value
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, True, timeout=LOCK_TIMEOUT):
+        try:
+            value = get_value()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+    return _wait_for_entry_or_compute(key, get_value)
+
+
+def _wait_for_entry_or_compute(key: str, get_value: Callable[[], Any]) -> Any:
+    """
+    Waits for the entry that is computing by another process
+    and computes it without caching if waiting takes too long.
+    """
+    deadline = time.monotonic() + LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        if (value := cache.get(key, _MISSING)) is not _MISSING:
+            return value
+    return get_value()
@@ -0,0 +1,84 @@
+import logging
+import threading
+from typing import Any
+
+from django.db import connection
+
+from . import catalog_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogIndex:
+    """
+    Base of in-memory catalog indexes. Every process builds an index once
+    and then updates the products changed by any process (from the catalog
+    changes log). If the changes are unknown, it's rebuilt in the background
+    while the requests use the previous state.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty (not built) index."""
+        self.generation: int | None = None
+        self._lock = threading.RLock()
+        self._is_rebuilding = False
+
+    def _get_built_state(self) -> dict[str, Any]:
+        """Returns attributes of the index built from the database."""
+        raise NotImplementedError
+
+    def _update_products(self, product_ids: set[int]) -> None:
+        """Updates the products by the IDs (removes the deleted ones)."""
+        raise NotImplementedError
+
+    def build(self) -> None:
+        """
+        Builds the index from the database (without locking the current
+        state) and replaces the current state.
+        """
+        generation = catalog_cache.get_catalog_generation()
+        state = self._get_built_state()
+        with self._lock:
+            vars(self).update(state)
+            self.generation = generation
+
+    def _rebuild_in_background(self) -> None:
+        """Starts rebuilding the index in a thread if it isn't started."""
+        with self._lock:
+            if self._is_rebuilding:
+                return
+            self._is_rebuilding = True
+        threading.Thread(target=self._rebuild, daemon=True).start()
+
+    def _rebuild(self) -> None:
+        """Rebuilds the index (in the background thread)."""
+        try:
+            self.build()
+        except Exception as e:  # It will be started again by a request.
+            logger.warning(f"{type(self).__name__} was not rebuilt: {e!r}")
+        finally:
+            self._is_rebuilding = False
+            connection.close()  # the thread's own database connection
+
+    def _ensure_fresh(self) -> None:
+        """
+        Builds the index if it isn't built yet or updates the products
+        that have been changed since its generation (under the lock).
+        """
+        generation = catalog_cache.get_catalog_generation()
+        if self.generation == generation:
+            return
+        if self.generation is None:
+            self.build()
+            return
+
+        changed_product_ids = catalog_cache.get_changed_product_ids_between(
+            self.generation, generation
+        )
+        if changed_product_ids is None:
+            self._rebuild_in_background()
+            return
+        if changed_product_ids:
+            self._update_products(changed_product_ids)
+        self.generation = generation
@@ -0,0 +1,266 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Any, NamedTuple, Collection
+
+from .catalog_index import CatalogIndex
+from .models import Product
+
+
+# Upper bounds of the price bands in dollars (the last band is unbounded)
+PRICE_BAND_BOUNDS = (500, 1000, 1500, 2000)
+COUNTS_CACHE_SIZE = 256
+
+
+class PriceBand(NamedTuple):
+    """Named tuple that holds a price range (min <= price < max)."""
+
+    min_price: int | None
+    max_price: int | None
+
+    @property
+    def label(self) -> str:
+        """Returns the human-readable price range."""
+        if self.min_price is None:
+            return f"Under {self.max_price}$"
+        if self.max_price is None:
+            return f"{self.min_price}$ and more"
+        return f"{self.min_price}$ - {self.max_price}$"
+
+
+PRICE_BANDS = [
+    PriceBand(min_price, max_price)
+    for min_price, max_price in zip(
+        (None, *PRICE_BAND_BOUNDS), (*PRICE_BAND_BOUNDS, None)
+    )
+]
+
+
+class FacetFilters(NamedTuple):
+    """Named tuple that holds the current state of the product filters."""
+
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    price_band: int | None = None
+    category_id: int | None = None
+    brand_ids: frozenset[int] = frozenset()
+    years: frozenset[int] = frozenset()
+
+
+class FacetCounts(NamedTuple):
+    """
+    Named tuple that holds the number of products that match the filters
+    and the number of products every facet value would return.
+    """
+
+    total: int
+    price_bands: dict[int, int]
+    categories: dict[int, int]
+    brands: dict[int, int]
+    years: dict[int, int]
+
+
+def _get_cents_from_(price: Decimal | float) -> int:
+    """Returns the price in cents."""
+    return round(price * 100)
+
+
+_PRICE_BAND_BOUNDS_IN_CENTS = [_get_cents_from_(b) for b in PRICE_BAND_BOUNDS]
+
+
+class _FacetValues(NamedTuple):
+    """Named tuple that holds the filterable fields of a product."""
+
+    price: int  # in cents
+    price_band: int
+    category_id: int
+    brand_id: int
+    year: int
+
+
+# Facets (the fields of the counts) by the fields of the product values
+_FACETS = {
+    "price_band": "price_bands",
+    "category_id": "categories",
+    "brand_id": "brands",
+    "year": "years",
+}
+
+
+class FacetIndex(CatalogIndex):
+    """
+    In-memory filterable fields of all products with sets of product IDs
+    by every facet value, so facet counts never query the database and
+    counts for search results are intersections with the found IDs.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty (not built) index."""
+        super().__init__()
+        self._values: dict[int, _FacetValues] = {}
+        # facet -> {value -> product IDs}
+        self._ids_by_value: dict[str, dict[int, set[int]]] = {
+            facet: {} for facet in _FACETS.values()
+        }
+        self._counts_cache: dict[FacetFilters, FacetCounts] = {}
+
+    def _get_built_state(self) -> dict[str, Any]:
+        """Returns the fields and the sets of IDs of all products."""
+        index = FacetIndex()
+        for row in _get_product_rows():
+            index._add_product(*row)
+        return {
+            "_values": index._values,
+            "_ids_by_value": index._ids_by_value,
+            "_counts_cache": {},
+        }
+
+    def _update_products(self, product_ids: set[int]) -> None:
+        """Replaces the fields of the products by the IDs."""
+        for product_id in product_ids:
+            self._remove_product(product_id)
+        for row in _get_product_rows(product_ids):
+            self._add_product(*row)
+        self._counts_cache = {}
+
+    def _add_product(
+        self,
+        product_id: int,
+        price: float,
+        category_id: int,
+        brand_id: int,
+        year: int,
+    ) -> None:
+        """Adds the fields of the product."""
+        price_in_cents = _get_cents_from_(price)
+        values = _FacetValues(
+            price_in_cents,
+            bisect_right(_PRICE_BAND_BOUNDS_IN_CENTS, price_in_cents),
+            category_id,
+            brand_id,
+            year,
+        )
+        self._values[product_id] = values
+        for field, facet in _FACETS.items():
+            self._ids_by_value[facet].setdefault(
+                getattr(values, field), set()
+            ).add(product_id)
+
+    def _remove_product(self, product_id: int) -> None:
+        """Removes the fields of the product if it's in the index."""
+        if (values := self._values.pop(product_id, None)) is None:
+            return
+        for field, facet in _FACETS.items():
+            ids_by_value = self._ids_by_value[facet]
+            ids = ids_by_value[value := getattr(values, field)]
+            ids.discard(product_id)
+            if not ids:
+                del ids_by_value[value]
+
+    def get_years(self) -> list[int]:
+        """Returns sorted years of all products."""
+        with self._lock:
+            self._ensure_fresh()
+            return sorted(self._ids_by_value["years"])
+
+    def get_counts_for_(
+        self,
+        filters: FacetFilters,
+        product_ids: Collection[int] | None = None,
+    ) -> FacetCounts:
+        """
+        Returns facet counts for the filters (and the found product IDs).
+        Every facet ignores its own filter, so its counts show how many
+        products every value of it would return.
+        """
+        with self._lock:
+            self._ensure_fresh()
+            if product_ids is not None:
+                return self._count(filters, self._values.keys() & product_ids)
+            if filters not in self._counts_cache:
+                if len(self._counts_cache) >= COUNTS_CACHE_SIZE:
+                    self._counts_cache.clear()
+                self._counts_cache[filters] = self._count(
+                    filters, set(self._values)
+                )
+            return self._counts_cache[filters]
+
+    def _count(self, filters: FacetFilters, ids: set[int]) -> FacetCounts:
+        """Returns facet counts among the products by the IDs."""
+        matched_ids = {
+            "price_bands": self._get_price_matched_ids_of_(ids, filters),
+            "categories": self._get_matched_ids_of_(
+                ids,
+                "categories",
+                [] if filters.category_id is None else [filters.category_id],
+            ),
+            "brands": self._get_matched_ids_of_(
+                ids, "brands", filters.brand_ids
+            ),
+            "years": self._get_matched_ids_of_(ids, "years", filters.years),
+        }
+        counts = {}
+        for facet, ids_by_value in self._ids_by_value.items():
+            other_ids = _intersect(
+                [ids for name, ids in matched_ids.items() if name != facet]
+            )
+            counts[facet] = {
+                value: count
+                for value, value_ids in ids_by_value.items()
+                if (count := len(other_ids & value_ids))
+            }
+        return FacetCounts(
+            total=len(_intersect(list(matched_ids.values()))), **counts
+        )
+
+    def _get_price_matched_ids_of_(
+        self, ids: set[int], filters: FacetFilters
+    ) -> set[int]:
+        """Returns the IDs that match the price range and band filters."""
+        if filters.price_band is not None:
+            ids = ids & self._ids_by_value["price_bands"].get(
+                filters.price_band, set()
+            )
+        min_price = max_price = None
+        if filters.min_price is not None:
+            min_price = _get_cents_from_(filters.min_price)
+        if filters.max_price is not None:
+            max_price = _get_cents_from_(filters.max_price)
+        if min_price is None and max_price is None:
+            return ids
+        return {
+            id_
+            for id_ in ids
+            if (min_price is None or self._values[id_].price >= min_price)
+            and (max_price is None or self._values[id_].price <= max_price)
+        }
+
+    def _get_matched_ids_of_(
+        self, ids: set[int], facet: str, values: Collection[int]
+    ) -> set[int]:
+        """Returns the IDs that have any of the facet values (all IDs
+        if there are no values to filter by)."""
+        if not values:
+            return ids
+        ids_by_value = self._ids_by_value[facet]
+        return ids & set().union(
+            *(ids_by_value.get(value, ()) for value in values)
+        )
+
+
+def _intersect(id_sets: list[set[int]]) -> set[int]:
+    """Returns the intersection of the sets (starting with the smallest)."""
+    id_sets = sorted(id_sets, key=len)
+    return id_sets[0].intersection(*id_sets[1:])
+
+
+def _get_product_rows(product_ids: Collection[int] | None = None):
+    """Returns rows with the filterable fields of products (all or by IDs)."""
+    products = Product.objects.order_by()
+    if product_ids is not None:
+        products = products.filter(id__in=product_ids)
+    return products.values_list(
+        "id", "price", "category_id", "brand_id", "year"
+    ).iterator(chunk_size=2000)
+
+
+facet_index = FacetIndex()
@@ -1,8 +1,14 @@
+from typing import Any, Collection
+
 from django import forms
 from django.db.models import QuerySet
 
-from . import services
-from .models import Product, Review
+from general.forms import (
+    ProvidedModelChoiceField,
+    ProvidedModelMultipleChoiceField,
+)
+from . import facets, services
+from .models import Product, Review, Category, Brand
 
 
 class ProductFilterForm(forms.Form):
@@ -26,32 +32,44 @@ class ProductFilterForm(forms.Form):
             attrs={"class": "form-control mb-2", "placeholder": "Max price"}
         ),
     )
-    category = forms.ModelChoiceField(
-        queryset=services.get_all_categories(),
+    price_band = forms.TypedChoiceField(
+        choices=[
+            (index, price_band.label)
+            for index, price_band in enumerate(facets.PRICE_BANDS)
+        ],
+        coerce=int,
+        empty_value=None,
+        widget=forms.RadioSelect,
+        label="Price",
+        required=False,
+    )
+    category = ProvidedModelChoiceField(
+        objects_provider=services.get_all_categories,
+        queryset=Category.objects.all(),
         widget=forms.RadioSelect,
         required=False,
     )
-    brands = forms.ModelMultipleChoiceField(
-        queryset=services.get_all_brands(),
+    brands = ProvidedModelMultipleChoiceField(
+        objects_provider=services.get_all_brands,
+        queryset=Brand.objects.all(),
         widget=forms.CheckboxSelectMultiple,
         label="Brand",
         required=False,
     )
-    years = forms.MultipleChoiceField(
-        choices=[
-            (year, year)
-            for year in set(
-                map(
-                    lambda tup: int(tup[0]),
-                    Product.objects.all().values_list("year"),
-                )
-            )
-        ],
+    years = forms.TypedMultipleChoiceField(
+        coerce=int,
         widget=forms.CheckboxSelectMultiple,
         label="Year",
         required=False,
     )
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Sets the year choices from the facet index of the catalog."""
+        super().__init__(*args, **kwargs)
+        self.fields["years"].choices = [
+            (year, year) for year in facets.facet_index.get_years()
+        ]
+
     def get_filtered_(self, products: QuerySet[Product]) -> QuerySet[Product]:
         """Returns the filtered given products."""
         if self.cleaned_data.get("min_price"):
@@ -62,6 +80,13 @@ class ProductFilterForm(forms.Form):
             products = products.filter(
                 price__lte=self.cleaned_data.get("max_price")
             )
+        price_band_index = self.cleaned_data.get("price_band")
+        if price_band_index is not None:
+            price_band = facets.PRICE_BANDS[price_band_index]
+            if price_band.min_price is not None:
+                products = products.filter(price__gte=price_band.min_price)
+            if price_band.max_price is not None:
+                products = products.filter(price__lt=price_band.max_price)
         if self.cleaned_data.get("category"):
             products = products.filter(category=self.cleaned_data["category"])
         if self.cleaned_data.get("brands"):
@@ -70,6 +95,45 @@ class ProductFilterForm(forms.Form):
             products = products.filter(year__in=self.cleaned_data["years"])
         return products
 
+    def get_facet_filters(self) -> facets.FacetFilters:
+        """Returns the facet filters from the cleaned data of the form."""
+        data = self.cleaned_data if self.is_valid() else {}
+        category: Category | None = data.get("category")
+        return facets.FacetFilters(
+            min_price=data.get("min_price"),
+            max_price=data.get("max_price"),
+            price_band=data.get("price_band"),
+            category_id=category.id if category else None,
+            brand_ids=frozenset(brand.id for brand in data.get("brands", [])),
+            years=frozenset(data.get("years", [])),
+        )
+
+    def add_facet_counts(
+        self, product_ids: Collection[int] | None = None
+    ) -> facets.FacetCounts:
+        """
+        Adds to the choice labels how many products every choice would return
+        (among the found product IDs if they are given) and returns the counts.
+        """
+        counts = facets.facet_index.get_counts_for_(
+            self.get_facet_filters(), product_ids
+        )
+        self.fields["price_band"].choices = [
+            (index, f"{band.label} ({counts.price_bands.get(index, 0)})")
+            for index, band in enumerate(facets.PRICE_BANDS)
+        ]
+        self.fields["category"].label_from_instance = lambda category: (
+            f"{category} ({counts.categories.get(category.id, 0)})"
+        )
+        self.fields["brands"].label_from_instance = lambda brand: (
+            f"{brand} ({counts.brands.get(brand.id, 0)})"
+        )
+        self.fields["years"].choices = [
+            (year, f"{year} ({counts.years.get(year, 0)})")
+            for year in facets.facet_index.get_years()
+        ]
+        return counts
+
 
 dict_with_field_classes = {"class": "form-control w-50 mb-2"}
 
@@ -0,0 +1,278 @@
+import logging
+import os
+import posixpath
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F, Q, Min
+from django.utils import timezone
+
+from general.images import (
+    MAX_IMAGE_WIDTH,
+    RENDITIONS_DIR_NAME,
+    process_image_file,
+)
+from general.models import ModelWithImage
+from . import catalog_cache
+from .models import ImageJob
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 3
+# Jobs that are processing longer (e.g. the worker was killed) are retaken.
+PROCESSING_TIMEOUT = 10 * 60  # 10 minutes
+# Replaced original images are deleted after this delay, when the cached
+# catalog entries that link to them have expired in the per-process cache
+# tier of every worker (L1_TIMEOUT) and the loaded pages have got them.
+ORIGINAL_DELETION_DELAY = 60  # seconds
+
+
+class BatchResult(NamedTuple):
+    """Named tuple that holds the numbers of processed jobs of a batch."""
+
+    done: int
+    retried: int
+    failed: int
+
+    @property
+    def total(self) -> int:
+        """Returns the number of processed jobs."""
+        return self.done + self.retried + self.failed
+
+
+def _get_job_key_of_(instance: ModelWithImage) -> str:
+    """Returns the idempotent key of the job for the instance image."""
+    return f"{instance._meta.label_lower}:{instance.pk}:{instance.image.name}"
+
+
+def enqueue_image_job_for_(instance: ModelWithImage) -> None:
+    """
+    Adds the job for the instance image if there is no unfinished one
+    (a finished job is restarted, because a new image can have the same name).
+    """
+    job, was_created = ImageJob.objects.get_or_create(
+        key=_get_job_key_of_(instance),
+        defaults={
+            "model": instance._meta.label_lower,
+            "object_id": str(instance.pk),
+            "image_name": instance.image.name,
+        },
+    )
+    finished_statuses = [ImageJob.Status.DONE, ImageJob.Status.FAILED]
+    if not was_created:
+        ImageJob.objects.filter(
+            id=job.id, status__in=finished_statuses
+        ).update(
+            status=ImageJob.Status.PENDING,
+            attempts=0,
+            last_error="",
+            updated=timezone.now(),
+        )
+
+
+def enqueue_image_jobs_without_renditions_for_(
+    *models: type[ModelWithImage],
+) -> int:
+    """
+    Adds jobs for saved images of the given models that have no renditions
+    (e.g. uploaded before renditions) and returns their number.
+    """
+    count = 0
+    for model in models:
+        instances = model.objects.filter(image_renditions={}).only("image")
+        for instance in instances.iterator():
+            enqueue_image_job_for_(instance)
+            count += 1
+    return count
+
+
+def _claim_jobs(batch_size: int) -> list[ImageJob]:
+    """
+    Returns pending (or stuck processing) jobs and marks them as processing,
+    so concurrent workers don't take them.
+    """
+    stuck_before = timezone.now() - timedelta(seconds=PROCESSING_TIMEOUT)
+    is_stuck = Q(status=ImageJob.Status.PROCESSING, updated__lt=stuck_before)
+    with transaction.atomic():
+        jobs = list(
+            ImageJob.objects.select_for_update(skip_locked=True)
+            .filter(Q(status=ImageJob.Status.PENDING) | is_stuck)
+            .order_by("updated")[:batch_size]
+        )
+        ImageJob.objects.filter(id__in=[job.id for job in jobs]).update(
+            status=ImageJob.Status.PROCESSING,
+            attempts=F("attempts") + 1,
+            updated=timezone.now(),
+        )
+    for job in jobs:
+        job.attempts += 1
+    return jobs
+
+
+def _get_image_path_of_(job: ImageJob) -> str | None:
+    """
+    Returns the path of the job image or None if the object
+    has been deleted or its image has been changed since then.
+    """
+    model = apps.get_model(job.model)
+    image_name = (
+        model.objects.filter(pk=job.object_id)
+        .values_list("image", flat=True)
+        .first()
+    )
+    if image_name != job.image_name:
+        return None
+    return model._meta.get_field("image").storage.path(image_name)
+
+
+def _get_storage_name_of_(path: str, image_name: str) -> str:
+    """
+    Returns the storage name of the processed image file (or its rendition)
+    by the path of the file and the job image name.
+    """
+    directory = posixpath.dirname(image_name)
+    if os.path.basename(os.path.dirname(path)) == RENDITIONS_DIR_NAME:
+        directory = posixpath.join(directory, RENDITIONS_DIR_NAME)
+    return posixpath.join(directory, os.path.basename(path))
+
+
+def _get_rendition_names_of_(
+    renditions: dict[str, dict[str, str]] | None,
+) -> set[str]:
+    """Returns all names of the renditions manifest."""
+    return {
+        name
+        for names_by_width in (renditions or {}).values()
+        for name in names_by_width.values()
+    }
+
+
+def _save_processed_image_of_(
+    job: ImageJob, path: str, rendition_paths: dict[str, dict[str, str]]
+) -> str | None:
+    """
+    Saves the new (content-hashed) image name and rendition names
+    to the object and deletes the previous renditions. If the object
+    has been deleted or its image has been changed since then,
+    the processed files are deleted instead. Returns the name of the
+    original image that must be deleted when the new name is served.
+    """
+    model = apps.get_model(job.model)
+    image_name = _get_storage_name_of_(path, job.image_name)
+    renditions = {
+        image_format: {
+            width: _get_storage_name_of_(rendition_path, job.image_name)
+            for width, rendition_path in paths.items()
+        }
+        for image_format, paths in rendition_paths.items()
+    }
+    new_names = {image_name} | _get_rendition_names_of_(renditions)
+
+    objects = model.objects.filter(pk=job.object_id, image=job.image_name)
+    previous_renditions = objects.values_list(
+        "image_renditions", flat=True
+    ).first()
+    # update() doesn't send signals, the catalog cache is invalidated once
+    # for the whole batch.
+    original_image_name = None
+    if objects.update(image=image_name, image_renditions=renditions):
+        names_to_delete = (
+            _get_rendition_names_of_(previous_renditions) - new_names
+        )
+        if image_name != job.image_name:
+            original_image_name = job.image_name
+    else:
+        names_to_delete = new_names
+
+    storage = model._meta.get_field("image").storage
+    for name in names_to_delete:
+        storage.delete(name)
+    return original_image_name
+
+
+def _delete_due_original_images() -> None:
+    """
+    Deletes the replaced original images whose deletion delay has passed
+    (unless an object uses the same image name again).
+    """
+    jobs = list(
+        ImageJob.objects.filter(
+            delete_original_after__lte=timezone.now()
+        ).only("model", "image_name")
+    )
+    for job in jobs:
+        model = apps.get_model(job.model)
+        if not model.objects.filter(image=job.image_name).exists():
+            model._meta.get_field("image").storage.delete(job.image_name)
+    ImageJob.objects.filter(id__in=[job.id for job in jobs]).update(
+        delete_original_after=None
+    )
+
+
+def get_next_original_deletion_time() -> datetime | None:
+    """Returns the time when the next replaced original image is deleted."""
+    return ImageJob.objects.aggregate(
+        next_deletion=Min("delete_original_after")
+    )["next_deletion"]
+
+
+def process_image_jobs(
+    executor: Executor,
+    batch_size: int = BATCH_SIZE,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> BatchResult:
+    """
+    Processes a batch of image jobs in parallel with the executor
+    (e.g. a process pool) and returns the numbers of processed jobs.
+    The replaced original images of the previous batches are deleted
+    when they are no longer served.
+    """
+    _delete_due_original_images()
+    if not (jobs := _claim_jobs(batch_size)):
+        return BatchResult(0, 0, 0)
+
+    futures = {}
+    for job in jobs:
+        if (path := _get_image_path_of_(job)) is not None:
+            model = apps.get_model(job.model)
+            futures[job.id] = executor.submit(
+                process_image_file,
+                path,
+                MAX_IMAGE_WIDTH if model.is_allow_to_resize else None,
+                model.image_rendition_widths,
+            )
+
+    done = retried = failed = 0
+    delete_original_after = timezone.now() + timedelta(
+        seconds=ORIGINAL_DELETION_DELAY
+    )
+    for job in jobs:
+        job.status, job.last_error = ImageJob.Status.DONE, ""
+        try:
+            if (future := futures.get(job.id)) is not None:
+                if _save_processed_image_of_(job, *future.result()):
+                    job.delete_original_after = delete_original_after
+        except Exception as e:
+            logger.warning(f"Image {job.image_name} was not processed: {e!r}")
+            job.last_error = repr(e)
+            if job.attempts >= max_attempts:
+                job.status = ImageJob.Status.FAILED
+                failed += 1
+            else:
+                job.status = ImageJob.Status.PENDING
+                retried += 1
+        else:
+            done += 1
+        job.updated = timezone.now()
+
+    ImageJob.objects.bulk_update(
+        jobs, ["status", "last_error", "updated", "delete_original_after"]
+    )
+    if done:
+        catalog_cache.bump_catalog_generation(changed_product_ids=[])
+    return BatchResult(done, retried, failed)
@@ -0,0 +1,168 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction, IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Like, Product
+
+
+CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+def _get_cache_key_by_(user_id: int) -> str:
+    """Returns the cache key of the product IDs liked by the user."""
+    return f"likes:{user_id}"
+
+
+def get_liked_product_ids_of_(user_id: int) -> array:
+    """
+    Returns the sorted array of IDs of products liked by the user
+    from cache or database.
+    """
+    cache = caches[settings.LIKES_CACHE_ALIAS]
+    if (product_ids := cache.get(_get_cache_key_by_(user_id))) is None:
+        product_ids = array(
+            "q",
+            Like.objects.filter(user_id=user_id)
+            .order_by("product_id")
+            .values_list("product_id", flat=True),
+        )
+        _set_liked_product_ids_of_(user_id, product_ids)
+    return product_ids
+
+
+def _set_liked_product_ids_of_(user_id: int, product_ids: array) -> None:
+    """Caches the sorted array of IDs of products liked by the user."""
+    caches[settings.LIKES_CACHE_ALIAS].set(
+        _get_cache_key_by_(user_id), product_ids, CACHE_TIMEOUT
+    )
+
+
+def _contains(product_ids: array, product_id: int) -> bool:
+    """Checks if the sorted array contains the product ID."""
+    index = bisect_left(product_ids, product_id)
+    return index < len(product_ids) and product_ids[index] == product_id
+
+
+def get_liked_among_(user_id: int, product_ids: Iterable[int]) -> set[int]:
+    """Returns a set of the given product IDs that the user liked."""
+    liked_product_ids = get_liked_product_ids_of_(user_id)
+    return {
+        product_id
+        for product_id in product_ids
+        if _contains(liked_product_ids, product_id)
+    }
+
+
+def _update_cached_liked_product_ids_of_(
+    user_id: int, product_id: int, is_liked: bool
+) -> None:
+    """
+    Adds the product ID to the cached sorted array of IDs liked
+    by the user or removes it (if the array is cached).
+    """
+    cache = caches[settings.LIKES_CACHE_ALIAS]
+    if (product_ids := cache.get(_get_cache_key_by_(user_id))) is None:
+        return
+    if is_liked == _contains(product_ids, product_id):
+        return
+    index = bisect_left(product_ids, product_id)
+    if is_liked:
+        product_ids.insert(index, product_id)
+    else:
+        del product_ids[index]
+    _set_liked_product_ids_of_(user_id, product_ids)
+
+
+def toggle_like(user_id: int, product_id: int) -> bool:
+    """
+    Adds the like of the user to the product or deletes it if it exists,
+    updates the like counter of the product and the cached IDs liked
+    by the user. Returns True if the product is liked now.
+    """
+    if connection.vendor == "postgresql":
+        is_liked = _toggle_like_in_one_statement(user_id, product_id)
+    else:
+        is_liked = _toggle_like_in_transaction(user_id, product_id)
+
+    # Runs at once or after the outer transaction (e.g. of a batch).
+    transaction.on_commit(
+        lambda: _update_cached_liked_product_ids_of_(
+            user_id, product_id, is_liked
+        )
+    )
+    return is_liked
+
+
+def _get_toggle_like_sql() -> str:
+    """Returns the SQL that toggles a like and updates the like counter."""
+    like_table = connection.ops.quote_name(Like._meta.db_table)
+    product_table = connection.ops.quote_name(Product._meta.db_table)
+    return f"""
+        WITH deleted AS (
+            DELETE FROM {like_table}
+            WHERE user_id = %(user_id)s AND product_id = %(product_id)s
+            RETURNING 1
+        ), inserted AS (
+            INSERT INTO {like_table} (user_id, product_id, created)
+            SELECT %(user_id)s, %(product_id)s, %(created)s
+            WHERE NOT EXISTS (SELECT 1 FROM deleted)
+            ON CONFLICT (user_id, product_id) DO NOTHING
+            RETURNING 1
+        ), counted AS (
+            UPDATE {product_table}
+            SET like_count = GREATEST(
+                like_count
+                + (SELECT COUNT(*) FROM inserted)
+                - (SELECT COUNT(*) FROM deleted),
+                0
+            )
+            WHERE id = %(product_id)s
+        )
+        SELECT NOT EXISTS (SELECT 1 FROM deleted)
+    """
+
+
+def _toggle_like_in_one_statement(user_id: int, product_id: int) -> bool:
+    """
+    Toggles the like with one PostgreSQL statement (one round trip).
+    A like inserted by a concurrent request is kept (the product is liked).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _get_toggle_like_sql(),
+            {
+                "user_id": user_id,
+                "product_id": product_id,
+                "created": timezone.now(),
+            },
+        )
+        return cursor.fetchone()[0]
+
+
+def _toggle_like_in_transaction(user_id: int, product_id: int) -> bool:
+    """Toggles the like with ORM queries in one transaction."""
+    with transaction.atomic():
+        deleted_count, _ = Like.objects.filter(
+            user_id=user_id, product_id=product_id
+        ).delete()
+        if deleted_count:
+            Product.objects.filter(
+                id=product_id, like_count__gte=deleted_count
+            ).update(like_count=F("like_count") - deleted_count)
+            return False
+
+        try:
+            with transaction.atomic():
+                Like.objects.create(user_id=user_id, product_id=product_id)
+        except IntegrityError:  # A concurrent request has liked it.
+            return True
+        Product.objects.filter(id=product_id).update(
+            like_count=F("like_count") + 1
+        )
+        return True
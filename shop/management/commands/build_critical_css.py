@@ -0,0 +1,62 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from general import critical_css
+from shop.models import Product
+
+
+class Command(BaseCommand):
+    """
+    Command that builds the critical CSS of the main page templates
+    (rules of the static stylesheets that are used by their markup
+    above the fold), which is inlined by the critical_css template tag.
+    """
+
+    help = "Builds the critical CSS of the home, product and cart pages."
+
+    def handle(self, *args, **options) -> None:
+        """Renders every page and saves its critical CSS as a static file."""
+        client = Client(HTTP_HOST="localhost")  # it's in ALLOWED_HOSTS
+        product = Product.objects.only("slug").first()
+        if product is None:
+            raise CommandError("There are no products to render the pages.")
+        # The cart page is built with the product table, not the empty cart.
+        client.post(
+            "/cart/add/",
+            json.dumps({"product_id": product.id, "quantity": 1}),
+            content_type="application/json",
+        )
+        for page, path in self._get_page_paths_by_(product).items():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise CommandError(f"{path} returned {response.status_code}.")
+            try:
+                css = critical_css.build_critical_css_of_(
+                    response.content.decode()
+                )
+            except OSError as e:
+                raise CommandError(f"Stylesheet of {path} is unavailable: {e}")
+
+            file_path = os.path.join(
+                settings.BASE_DIR,
+                "static",
+                critical_css.CRITICAL_CSS_NAME_FORMAT.format(page=page),
+            )
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(css)
+            self.stdout.write(f"{page} ({path}): {len(css)} bytes.")
+
+    def _get_page_paths_by_(self, product: Product) -> dict[str, str]:
+        """Returns paths of the pages (that have the same markup above
+        the fold as other pages of their templates) by template names."""
+        return {
+            "home": "/",
+            "product_list": "/products/",
+            "product_detail": product.get_absolute_url(),
+            "cart": "/cart/",
+        }
@@ -0,0 +1,71 @@
+import sys
+import json
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Command that imports all project modules in a new process and fails
+    if they query the database or take too long on import.
+    """
+
+    help = (
+        "Checks that no project module queries the database on import "
+        "and that the startup (imports) fits in the time budget."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Adds the budget arguments."""
+        parser.add_argument(
+            "--max-queries",
+            type=int,
+            default=0,
+            help="Maximum number of database queries on import.",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=10.0,
+            help="Maximum startup (import) time in seconds.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Runs the import probe and checks its report by the budgets."""
+        report = self._get_import_probe_report()
+
+        for error in report["errors"]:
+            self.stderr.write(f"{error['module']}:\n{error['error']}")
+        for query in report["queries"]:
+            self.stdout.write(f"{query['module']}: {query['sql']}")
+        self.stdout.write(
+            f"Imports took {report['seconds']:.2f}s "
+            f"and made {len(report['queries'])} database queries."
+        )
+
+        if report["errors"]:
+            raise CommandError("Some modules could not be imported.")
+        if len(report["queries"]) > options["max_queries"]:
+            raise CommandError(
+                f"Modules made more than {options['max_queries']} "
+                "database queries on import."
+            )
+        if report["seconds"] > options["max_seconds"]:
+            raise CommandError(
+                f"Imports took more than {options['max_seconds']}s."
+            )
+        self.stdout.write(self.style.SUCCESS("Import budget check passed."))
+
+    def _get_import_probe_report(self) -> dict:
+        """Runs the import probe in a new process and returns its report."""
+        process = subprocess.run(
+            [sys.executable, "-m", "shop.management.import_probe"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            raise CommandError(f"Import probe has failed:\n{process.stderr}")
+        return json.loads(process.stdout)
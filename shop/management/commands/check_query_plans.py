@@ -0,0 +1,57 @@
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand, CommandError
+
+from shop import query_plans
+
+
+class Command(BaseCommand):
+    """
+    Command that runs EXPLAIN on the canonical catalog queries against
+    a seeded dataset (in a rolled back transaction) and fails if any of them
+    falls back to a sequential scan (the same check as the test of shop).
+    """
+
+    help = (
+        "Checks that the canonical catalog queries use indexes "
+        "(PostgreSQL only; the seeded data is rolled back)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """Adds the seeding arguments."""
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=5000,
+            help="Number of products to seed.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Seeds data, checks the query plans and rolls everything back."""
+        if connection.vendor != "postgresql":
+            raise CommandError("Query plans can be checked only on PostgreSQL")
+
+        failed_cases = []
+        with transaction.atomic():
+            for case_name, run_case in (
+                query_plans.get_catalog_query_cases_for_(
+                    *query_plans.seed_catalog_with_(options["products"])
+                )
+            ):
+                if tables := query_plans.get_seq_scan_tables_of_(run_case):
+                    failed_cases.append(case_name)
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"{case_name}: sequential scan on "
+                            f"{', '.join(sorted(tables))}"
+                        )
+                    )
+                else:
+                    self.stdout.write(f"{case_name}: OK")
+
+            transaction.set_rollback(True)
+
+        if failed_cases:
+            raise CommandError(
+                f"{len(failed_cases)} catalog queries use sequential scans."
+            )
+        self.stdout.write(self.style.SUCCESS("All query plans use indexes."))
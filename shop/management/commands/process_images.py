@@ -0,0 +1,86 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from shop import images
+from shop.models import Product, ProductShot, CarouselImage
+
+
+class Command(BaseCommand):
+    """
+    Command (image processing worker) that resizes and optimizes
+    saved images from the job queue (if it's allowed) and creates
+    their renditions with a pool of processes.
+    """
+
+    help = "Processes queued images (once or continuously with --loop)."
+
+    def add_arguments(self, parser) -> None:
+        """Adds the pool, batch, retry, loop and backfill arguments."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes (all cores by default).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=images.BATCH_SIZE,
+            help="Maximum number of jobs taken at once.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=images.MAX_ATTEMPTS,
+            help="Number of attempts after which a job is failed.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting when it's empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds between polls of the empty queue (with --loop).",
+        )
+        parser.add_argument(
+            "--enqueue-missing",
+            action="store_true",
+            help="Queue images without renditions first.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Processes batches of jobs until the queue is empty
+        and the replaced original images are deleted.
+        """
+        if options["enqueue_missing"]:
+            count = images.enqueue_image_jobs_without_renditions_for_(
+                Product, ProductShot, CarouselImage
+            )
+            self.stdout.write(f"Queued {count} images without renditions.")
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            while True:
+                result = images.process_image_jobs(
+                    executor, options["batch_size"], options["max_attempts"]
+                )
+                if result.total:
+                    self.stdout.write(
+                        f"Done: {result.done}, "
+                        f"retried later: {result.retried}, "
+                        f"failed: {result.failed}."
+                    )
+                elif options["loop"]:
+                    time.sleep(options["interval"])
+                elif deletion_time := images.get_next_original_deletion_time():
+                    # The replaced originals are deleted by the next batch.
+                    delay = (deletion_time - timezone.now()).total_seconds()
+                    time.sleep(max(delay, 0))
+                else:
+                    break
@@ -0,0 +1,63 @@
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.core.management.base import BaseCommand
+
+from shop.models import Product, Like, Review
+
+
+def _get_subquery_of_(model, aggregate) -> Subquery:
+    """Returns the aggregate of the model rows of the outer product."""
+    return Subquery(
+        model.objects.filter(product_id=OuterRef("id"))
+        .order_by()
+        .values("product_id")
+        .annotate(value=aggregate)
+        .values("value")[:1]
+    )
+
+
+class Command(BaseCommand):
+    """
+    Command that recounts the denormalized like and review counters
+    of products (e.g. after likes or reviews were deleted in the admin).
+    """
+
+    help = "Recounts like and review counters of all products."
+
+    def add_arguments(self, parser) -> None:
+        """Adds the batch size argument."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of products (by ID range) updated in one query.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Updates the counters with one UPDATE per range of product IDs."""
+        id_range = Product.objects.aggregate(
+            min_id=Min("id"), max_id=Max("id")
+        )
+        if id_range["min_id"] is None:
+            self.stdout.write("There are no products.")
+            return
+
+        batch_size = options["batch_size"]
+        updated_count = 0
+        for first_id in range(
+            id_range["min_id"], id_range["max_id"] + 1, batch_size
+        ):
+            updated_count += Product.objects.filter(
+                id__gte=first_id, id__lt=first_id + batch_size
+            ).update(
+                like_count=Coalesce(_get_subquery_of_(Like, Count("id")), 0),
+                review_count=Coalesce(
+                    _get_subquery_of_(Review, Count("id")), 0
+                ),
+                last_reviewed_at=_get_subquery_of_(Review, Max("created")),
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recounted counters of {updated_count} products."
+            )
+        )
@@ -0,0 +1,52 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from general import static_assets
+from shop.models import Product
+
+
+class Command(BaseCommand):
+    """
+    Command that reports static file bytes of shop pages
+    on the first and on a repeat visit (with the browser cache).
+    """
+
+    help = "Reports per-page static file sizes of the collectstatic build."
+
+    def add_arguments(self, parser) -> None:
+        """Adds the page paths argument."""
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Page paths (the main shop pages by default).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Prints the sizes of every page and its not immutable files."""
+        if not os.path.isdir(settings.STATIC_ROOT):
+            raise CommandError("There is no build, run collectstatic first.")
+
+        for page in static_assets.get_page_assets_of_(
+            options["paths"] or self._get_default_paths()
+        ):
+            self.stdout.write(
+                f"{page.path} ({page.status_code}): "
+                f"{len(page.assets)} files, {page.size} bytes, "
+                f"first visit: {page.first_visit_size} bytes, "
+                f"repeat visit: {page.repeat_visit_size} bytes."
+            )
+            for asset in page.assets:
+                if not asset.is_immutable:
+                    self.stdout.write(
+                        f"  not immutable: {asset.name} "
+                        f"({asset.transferred_size} bytes)"
+                    )
+
+    def _get_default_paths(self) -> list[str]:
+        """Returns paths of the home, product list, detail and cart pages."""
+        paths = ["/", "/products/", "/cart/"]
+        if product := Product.objects.only("slug").first():
+            paths.insert(2, product.get_absolute_url())
+        return paths
@@ -0,0 +1,74 @@
+"""
+Script that sets up Django, imports all modules of the project apps
+and prints the import time and the database queries made on import
+in JSON. It is run in a new process by the check_import_queries command.
+"""
+import sys
+import json
+import time
+import pkgutil
+import importlib
+import traceback
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.db import connections
+
+
+SKIPPED_SUBPACKAGES = ("migrations", "management", "test_mixins", "tests")
+
+_current_module = "django.setup()"
+_queries: list[dict[str, str]] = []
+
+
+def _record_query(execute, sql, params, many, context):
+    """Records the query with the module that is being imported."""
+    _queries.append({"module": _current_module, "sql": sql})
+    return execute(sql, params, many, context)
+
+
+def _get_project_module_names() -> list[str]:
+    """Returns names of all modules of the project apps."""
+    from django.apps import apps
+
+    module_names = [settings.ROOT_URLCONF]
+    for app_config in apps.get_app_configs():
+        if not Path(app_config.path).is_relative_to(settings.BASE_DIR):
+            continue
+        for module_info in pkgutil.walk_packages(
+            app_config.module.__path__, prefix=f"{app_config.name}."
+        ):
+            name_parts = module_info.name.split(".")
+            if not any(part in SKIPPED_SUBPACKAGES for part in name_parts):
+                module_names.append(module_info.name)
+    return module_names
+
+
+def main() -> None:
+    """Imports the project modules and prints the report in JSON."""
+    global _current_module
+
+    errors = []
+    start_time = time.perf_counter()
+    for alias in settings.DATABASES:
+        connections[alias].execute_wrappers.append(_record_query)
+    django.setup()
+    for module_name in _get_project_module_names():
+        _current_module = module_name
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            errors.append(
+                {"module": module_name, "error": traceback.format_exc()}
+            )
+    seconds = time.perf_counter() - start_time
+
+    json.dump(
+        {"seconds": seconds, "queries": _queries, "errors": errors},
+        sys.stdout,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0002_product_catalog_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                condition=models.Q(("parent", None)),
+                fields=["product", "-id"],
+                name="review_product_thread_idx",
+            ),
+        ),
+    ]
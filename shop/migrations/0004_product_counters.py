@@ -0,0 +1,67 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:43
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_product_counters(apps, schema_editor):
+    """Counts likes and reviews of the existing products."""
+    Product = apps.get_model("shop", "Product")
+    Like = apps.get_model("shop", "Like")
+    Review = apps.get_model("shop", "Review")
+
+    def get_subquery_of_(model, aggregate):
+        return Subquery(
+            model.objects.filter(product_id=OuterRef("id"))
+            .order_by()
+            .values("product_id")
+            .annotate(value=aggregate)
+            .values("value")[:1]
+        )
+
+    Product.objects.update(
+        like_count=Coalesce(get_subquery_of_(Like, Count("id")), 0),
+        review_count=Coalesce(get_subquery_of_(Review, Count("id")), 0),
+        last_reviewed_at=get_subquery_of_(Review, Max("created")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0003_review_thread_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="last_reviewed_at",
+            field=models.DateTimeField(
+                editable=False, null=True, verbose_name="Last reviewed at"
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="like_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Like count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="review_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Review count"
+            ),
+        ),
+        migrations.RunPython(
+            fill_product_counters, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["-like_count", "-id"], name="product_popularity_idx"
+            ),
+        ),
+    ]
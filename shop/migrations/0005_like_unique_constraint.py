@@ -0,0 +1,57 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:45
+
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def delete_duplicate_likes(apps, schema_editor):
+    """
+    Deletes all but the first like of every user for every product
+    and recounts the likes of the products that had duplicates.
+    """
+    Like = apps.get_model("shop", "Like")
+    Product = apps.get_model("shop", "Product")
+
+    duplicates = (
+        Like.objects.order_by()
+        .values("user_id", "product_id")
+        .annotate(first_id=Min("id"), count=Count("id"))
+        .filter(count__gt=1)
+    )
+    product_ids = set()
+    for duplicate in duplicates.iterator():
+        Like.objects.filter(
+            user_id=duplicate["user_id"], product_id=duplicate["product_id"]
+        ).exclude(id=duplicate["first_id"]).delete()
+        product_ids.add(duplicate["product_id"])
+
+    like_count = Subquery(
+        Like.objects.filter(product_id=OuterRef("id"))
+        .order_by()
+        .values("product_id")
+        .annotate(value=Count("id"))
+        .values("value")[:1]
+    )
+    Product.objects.filter(id__in=product_ids).update(
+        like_count=Coalesce(like_count, 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0004_product_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_likes, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="like",
+            constraint=models.UniqueConstraint(
+                fields=("user", "product"), name="like_user_product_unique"
+            ),
+        ),
+    ]
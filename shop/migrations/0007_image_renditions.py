@@ -0,0 +1,43 @@
+# Generated by Django 4.1.7 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0006_image_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carouselimage",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Image renditions",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Image renditions",
+            ),
+        ),
+        migrations.AddField(
+            model_name="productshot",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Image renditions",
+            ),
+        ),
+    ]
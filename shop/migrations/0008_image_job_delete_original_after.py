@@ -0,0 +1,28 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0007_image_renditions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imagejob",
+            name="delete_original_after",
+            field=models.DateTimeField(
+                null=True, verbose_name="Delete the original image after"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="imagejob",
+            index=models.Index(
+                condition=models.Q(("delete_original_after__isnull", False)),
+                fields=["delete_original_after"],
+                name="image_job_original_idx",
+            ),
+        ),
+    ]
@@ -12,6 +12,7 @@ from general.models import (
     ModelWithFKToProduct,
     ModelWithFKToUser,
 )
+from general.images import FULL_WIDTH_RENDITION_WIDTHS
 
 
 class Brand(ModelWithNameAndSlug, models.Model):
@@ -80,16 +81,30 @@ class Product(
     # Model fields
     year = models.IntegerField(blank=False, verbose_name="Year")
 
+    # Composite indexes (see Meta.indexes) lead with these foreign keys.
     brand = models.ForeignKey(
-        Brand, on_delete=models.CASCADE, verbose_name="Brand"
+        Brand, on_delete=models.CASCADE, db_index=False, verbose_name="Brand"
     )
     category = models.ForeignKey(
-        Category, on_delete=models.CASCADE, verbose_name="Category"
+        Category,
+        on_delete=models.CASCADE,
+        db_index=False,
+        verbose_name="Category",
+    )
+
+    # Denormalized counters (updated with F() expressions, see services)
+    like_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Like count"
+    )
+    review_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Review count"
+    )
+    last_reviewed_at = models.DateTimeField(
+        null=True, editable=False, verbose_name="Last reviewed at"
     )
 
     def save(self, *args, **kwargs):
         """Sets the special attributes for the parent save method."""
-        self.is_allow_to_resize = True
         self.image_name = self.slug
         super().save(*args, **kwargs)
 
@@ -99,6 +114,36 @@ class Product(
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ["name", "-price"]
+        indexes = [
+            # Category and brand pages ordered by name (default) or price
+            # (covering the product card columns for name ordering)
+            models.Index(
+                fields=["category", "name"],
+                include=["slug", "image", "price"],
+                name="product_category_name_idx",
+            ),
+            models.Index(
+                fields=["brand", "name"],
+                include=["slug", "image", "price"],
+                name="product_brand_name_idx",
+            ),
+            models.Index(
+                fields=["category", "price", "id"],
+                name="product_category_price_idx",
+            ),
+            models.Index(
+                fields=["brand", "price", "id"],
+                name="product_brand_price_idx",
+            ),
+            # All products ordered by price and price range filters
+            models.Index(fields=["price", "id"], name="product_price_idx"),
+            # Year filters
+            models.Index(fields=["year"], name="product_year_idx"),
+            # All products ordered by popularity
+            models.Index(
+                fields=["-like_count", "-id"], name="product_popularity_idx"
+            ),
+        ]
 
 
 # Redefining an abstract model field parameter
@@ -118,7 +163,6 @@ class ProductShot(
 
     def save(self, *args, **kwargs):
         """Sets the special attributes for the parent save method."""
-        self.is_allow_to_resize = True
         shots_count = self.product.productshot_set.count() + 1
         self.image_name = f"{self.product.slug}-shot-{shots_count}"
         super().save(*args, **kwargs)
@@ -165,6 +209,11 @@ class Like(
         verbose_name = "Like"
         verbose_name_plural = "Likes"
         ordering = ["-created", "product_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "product"], name="like_user_product_unique"
+            ),
+        ]
 
 
 class _ReviewCustomManager(models.Manager):
@@ -210,6 +259,14 @@ class Review(
         verbose_name = "Review"
         verbose_name_plural = "Reviews"
         ordering = ["-created", "name", "product_id"]
+        indexes = [
+            # Pages of the newest review threads of a product
+            models.Index(
+                fields=["product", "-id"],
+                condition=models.Q(parent=None),
+                name="review_product_thread_idx",
+            ),
+        ]
 
 
 class CarouselImage(
@@ -223,9 +280,12 @@ class CarouselImage(
     Fields: name, description, image, product.
     """
 
+    # The image is shown in full width, only its renditions are resized.
+    is_allow_to_resize = False
+    image_rendition_widths = FULL_WIDTH_RENDITION_WIDTHS
+
     def save(self, *args, **kwargs):
         """Sets the special attributes for the parent save method."""
-        self.is_allow_to_resize = False
         self.image_name = self.name
         super().save(*args, **kwargs)
 
@@ -242,3 +302,68 @@ CarouselImage._meta.get_field("description").blank = True
 CarouselImage._meta.get_field("image").upload_to = "carousel_images/"
 CarouselImage._meta.get_field("product").blank = True
 CarouselImage._meta.get_field("product").null = True
+
+
+class ImageJob(ModelWithCreatedDateTime, models.Model):
+    """
+    A model representing a job (in the queue) for processing
+    a saved image that is run by the 'process_images' management command.
+    Fields: created, key, model, object_id, image_name, status, attempts,
+    updated, last_error, delete_original_after.
+    """
+
+    class Status(models.TextChoices):
+        """Processing statuses of the image job."""
+
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    # The same image of the same object is processed only once.
+    key = models.CharField(max_length=255, unique=True, verbose_name="Key")
+    model = models.CharField(max_length=100, verbose_name="Model")
+    object_id = models.CharField(max_length=64, verbose_name="Object ID")
+    image_name = models.CharField(max_length=255, verbose_name="Image name")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Status",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="Attempts"
+    )
+    updated = models.DateTimeField(
+        auto_now=True, verbose_name="Updated datetime"
+    )
+    last_error = models.TextField(blank=True, verbose_name="Last error")
+    # The replaced original image is deleted when it's no longer served.
+    delete_original_after = models.DateTimeField(
+        null=True, verbose_name="Delete the original image after"
+    )
+
+    def __str__(self) -> str:
+        """Returns string representation of the ImageJob model."""
+        return f"{self.image_name} ({self.status})"
+
+    class Meta:
+        """Meta options for the ImageJob model."""
+
+        verbose_name = "Image job"
+        verbose_name_plural = "Image jobs"
+        ordering = ["-created"]
+        indexes = [
+            # Unfinished jobs for the image processing worker
+            models.Index(
+                fields=["status", "updated"],
+                condition=models.Q(status__in=["pending", "processing"]),
+                name="image_job_unfinished_idx",
+            ),
+            # Replaced original images that must be deleted
+            models.Index(
+                fields=["delete_original_after"],
+                condition=models.Q(delete_original_after__isnull=False),
+                name="image_job_original_idx",
+            ),
+        ]
@@ -0,0 +1,193 @@
+import json
+import random
+from typing import Any, Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from general.pagination import KeysetPaginator
+from . import services
+from .forms import ProductFilterForm
+from .models import Product, Brand, Category
+from .views import AllProductsListView
+
+
+PAGE_SIZE = AllProductsListView.paginate_by
+SEED_PREFIX = "query-plan-check"
+SEED_YEARS = range(2015, 2024)
+
+# Ordering GET parameters (orderby, orderdir) of the product list views
+ORDERINGS = [
+    (None, None),
+    ("name", "asc"),
+    ("price", "asc"),
+    ("price", "desc"),
+    ("popularity", "desc"),
+]
+
+
+def seed_catalog_with_(products_count: int) -> tuple[Brand, Category]:
+    """
+    Creates brands, categories and products for the check, analyzes
+    the product table and forbids sequential scans in the transaction
+    (so every query that has a usable index must use it).
+    """
+    brands = Brand.objects.bulk_create(
+        Brand(name=f"{SEED_PREFIX} brand {i}", slug=f"{SEED_PREFIX}-b{i}")
+        for i in range(20)
+    )
+    categories = Category.objects.bulk_create(
+        Category(
+            name=f"{SEED_PREFIX} category {i}", slug=f"{SEED_PREFIX}-c{i}"
+        )
+        for i in range(5)
+    )
+    Product.objects.bulk_create(
+        (
+            Product(
+                name=f"{SEED_PREFIX} product {i}",
+                slug=f"{SEED_PREFIX}-p{i}",
+                description="Query plan check",
+                image="products/query-plan-check.webp",
+                price=round(random.uniform(100, 3000), 2),
+                year=random.choice(SEED_YEARS),
+                brand=random.choice(brands),
+                category=random.choice(categories),
+            )
+            for i in range(products_count)
+        ),
+        batch_size=1000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE shop_product")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return brands[0], categories[0]
+
+
+def get_catalog_query_cases_for_(
+    brand: Brand, category: Category
+) -> list[tuple[str, Callable[[], Any]]]:
+    """Returns names and functions of the canonical catalog queries."""
+    cases = []
+    for order_by, order_dir in ORDERINGS:
+        ordering_name = "default"
+        if order_by is not None:
+            ordering_name = f"{order_by} {order_dir}"
+        products = AllProductsListView.queryset.all()
+        if order_by is not None:
+            products = products.order_by(
+                services.get_ordering_field_by_(order_by, order_dir)
+            )
+
+        for page_name, page_products in (
+            ("all products", products),
+            (
+                "category page",
+                services.get_products_filtered_by_category_(
+                    category.slug, products
+                ),
+            ),
+            (
+                "brand page",
+                services.get_products_filtered_by_brand_(
+                    brand.slug, products
+                ),
+            ),
+        ):
+            cases.append(
+                (
+                    f"{page_name} by {ordering_name}",
+                    _get_first_page_function_of_(page_products),
+                )
+            )
+            cases.append(
+                (
+                    f"{page_name} by {ordering_name} (next keyset page)",
+                    _get_next_keyset_page_function_of_(page_products),
+                )
+            )
+
+    for filter_name, data in (
+        ("price range filter", {"min_price": 500, "max_price": 1500}),
+        ("price band filter", {"price_band": 2}),
+        ("years filter", {"years": [2018, 2021]}),
+        ("category filter", {"category": category.id}),
+        (
+            "category, price range and years filter",
+            {
+                "category": category.id,
+                "min_price": 500,
+                "years": [2020, 2021, 2022],
+            },
+        ),
+    ):
+        form = ProductFilterForm(data)
+        # The seeded category and years are not in the cached catalog lists
+        # and the facet index (bulk_create doesn't invalidate them).
+        form.fields["category"].objects_provider = lambda: [category]
+        form.fields["years"].choices = [(year, year) for year in SEED_YEARS]
+        if not form.is_valid():
+            raise ValueError(f"{filter_name}: {form.errors.as_text()}")
+        cases.append(
+            (
+                filter_name,
+                _get_first_page_function_of_(
+                    form.get_filtered_(AllProductsListView.queryset.all())
+                ),
+            )
+        )
+    return cases
+
+
+def _get_first_page_function_of_(products) -> Callable[[], Any]:
+    """Returns the function that fetches the first page of the products."""
+    return lambda: list(products[:PAGE_SIZE])
+
+
+def _get_next_keyset_page_function_of_(products) -> Callable[[], Any]:
+    """Returns the function that fetches the second page by the cursor."""
+    paginator = KeysetPaginator(products, PAGE_SIZE)
+    cursor = paginator.get_page(None).next_cursor
+    return lambda: paginator.get_page(cursor)
+
+
+def get_seq_scan_tables_of_(function: Callable[[], Any]) -> set[str]:
+    """
+    Returns names of the tables that the product queries
+    of the function scan sequentially.
+    """
+    tables = set()
+    for sql in _get_product_queries_made_by_(function):
+        tables |= _get_seq_scan_tables_from_(_get_plan_of_(sql))
+    return tables
+
+
+def _get_product_queries_made_by_(function: Callable[[], Any]) -> list[str]:
+    """Returns SQL of the product queries that the function makes."""
+    with CaptureQueriesContext(connection) as context:
+        function()
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith("SELECT") and "shop_product" in query["sql"]
+    ]
+
+
+def _get_plan_of_(sql: str) -> dict:
+    """Returns the query plan of the SQL query."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _get_seq_scan_tables_from_(plan: dict) -> set[str]:
+    """Returns names of the tables that are scanned sequentially."""
+    tables = set()
+    if plan["Node Type"] == "Seq Scan":
+        tables.add(plan["Relation Name"])
+    for subplan in plan.get("Plans", []):
+        tables |= _get_seq_scan_tables_from_(subplan)
+    return tables
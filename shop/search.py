@@ -0,0 +1,248 @@
+import re
+import heapq
+from math import log
+from html import unescape
+from typing import Any, Collection, NamedTuple
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from django.utils.html import strip_tags
+
+from .catalog_index import CatalogIndex
+from .models import Product
+
+
+# Weights of the product fields in a relevance score
+FIELD_WEIGHTS = {
+    "name": 5.0,
+    "brand": 3.0,
+    "category": 3.0,
+    "year": 2.0,
+    "description": 1.0,
+}
+PREFIX_MATCH_FACTOR = 0.6
+TYPO_MATCH_FACTOR = 0.4
+
+MIN_PREFIX_LENGTH = 2
+MIN_TYPO_TERM_LENGTH = 4
+MAX_TERM_EXPANSIONS = 50
+RESULTS_LIMIT = 500
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+class SearchResults(NamedTuple):
+    """
+    Named tuple that holds IDs of the most relevant found products
+    (not more than the limit) and the number of all found products.
+    """
+
+    product_ids: list[int]
+    total: int
+
+    @property
+    def is_limited(self) -> bool:
+        """Returns True if not all found products are in the results."""
+        return len(self.product_ids) < self.total
+
+
+def tokenize(text: str) -> list[str]:
+    """Returns a list of lowercase words from the given text."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _get_deletions_of_(term: str) -> set[str]:
+    """Returns all variants of the term without one of its characters."""
+    return {term[:i] + term[i + 1 :] for i in range(len(term))}
+
+
+class ProductSearchIndex(CatalogIndex):
+    """
+    In-memory inverted index of products by name, brand, category, year
+    and description without HTML tags.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty (not built) index."""
+        super().__init__()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clears all structures of the index."""
+        # term -> {product ID -> weight}
+        self._postings: dict[str, dict[int, float]] = {}
+        # product ID -> {term -> weight}
+        self._documents: dict[int, dict[str, float]] = {}
+        # Sorted vocabulary for prefix matching
+        self._terms: list[str] = []
+        # term or term without one character -> terms (for typo tolerance)
+        self._variants: dict[str, set[str]] = defaultdict(set)
+
+    def _get_built_state(self) -> dict[str, Any]:
+        """Returns the structures of the index of all products."""
+        index = ProductSearchIndex()
+        for row in _get_product_rows():
+            index._add_document(row[0], _get_weighted_terms_from_(row))
+        index._terms.sort()
+        return {
+            "_postings": index._postings,
+            "_documents": index._documents,
+            "_terms": index._terms,
+            "_variants": index._variants,
+        }
+
+    def _update_products(self, product_ids: set[int]) -> None:
+        """Re-indexes the products by the IDs."""
+        for product_id in product_ids:
+            self._remove_document(product_id)
+        for row in _get_product_rows(product_ids):
+            self._add_document(
+                row[0], _get_weighted_terms_from_(row), is_sorted=True
+            )
+
+    def search(
+        self, user_input: str, limit: int = RESULTS_LIMIT
+    ) -> SearchResults | None:
+        """
+        Returns IDs of the most relevant products (not more than the limit)
+        that match all words of the user input and the number of all
+        of them or None if there are no words to search by.
+        """
+        if not (tokens := tokenize(user_input)):
+            return None
+
+        with self._lock:
+            self._ensure_fresh()
+            scores: dict[int, float] | None = None
+            for token in tokens:
+                token_scores = self._get_scores_by_(token)
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {
+                        product_id: score + token_scores[product_id]
+                        for product_id, score in scores.items()
+                        if product_id in token_scores
+                    }
+                if not scores:
+                    return SearchResults([], 0)
+
+        product_ids = [
+            product_id
+            for product_id, _ in heapq.nlargest(
+                limit, scores.items(), key=lambda item: (item[1], -item[0])
+            )
+        ]
+        return SearchResults(product_ids, len(scores))
+
+    def _get_scores_by_(self, token: str) -> dict[int, float]:
+        """Returns the best score of every product that matches the token."""
+        scores = defaultdict(float)
+        documents_count = len(self._documents)
+        for term, factor in self._get_expansions_of_(token):
+            postings = self._postings[term]
+            idf = log(1 + documents_count / len(postings))
+            for product_id, weight in postings.items():
+                scores[product_id] = max(
+                    scores[product_id], weight * idf * factor
+                )
+        return scores
+
+    def _get_expansions_of_(self, token: str) -> list[tuple[str, float]]:
+        """
+        Returns the terms that match the token (exactly, by prefix or with
+        one typo if there are no other matches) with their score factors.
+        """
+        expansions = []
+        if token in self._postings:
+            expansions.append((token, 1.0))
+
+        if len(token) >= MIN_PREFIX_LENGTH:
+            index = bisect_left(self._terms, token)
+            while (
+                index < len(self._terms)
+                and len(expansions) < MAX_TERM_EXPANSIONS
+                and self._terms[index].startswith(token)
+            ):
+                if (term := self._terms[index]) != token:
+                    expansions.append((term, PREFIX_MATCH_FACTOR))
+                index += 1
+
+        if not expansions and len(token) >= MIN_TYPO_TERM_LENGTH:
+            similar_terms = set()
+            for variant in {token} | _get_deletions_of_(token):
+                similar_terms |= self._variants.get(variant, set())
+            expansions = [
+                (term, TYPO_MATCH_FACTOR)
+                for term in sorted(similar_terms)[:MAX_TERM_EXPANSIONS]
+            ]
+        return expansions
+
+    def _add_document(
+        self, product_id: int, terms: dict[str, float], is_sorted=False
+    ) -> None:
+        """Adds the product terms to the index."""
+        self._documents[product_id] = terms
+        for term, weight in terms.items():
+            if term not in self._postings:
+                self._postings[term] = {}
+                self._add_term(term, is_sorted)
+            self._postings[term][product_id] = weight
+
+    def _remove_document(self, product_id: int) -> None:
+        """Removes the product terms from the index."""
+        for term in self._documents.pop(product_id, {}):
+            postings = self._postings[term]
+            del postings[product_id]
+            if not postings:
+                del self._postings[term]
+                self._remove_term(term)
+
+    def _add_term(self, term: str, is_sorted: bool) -> None:
+        """Adds the new term to the vocabulary."""
+        if is_sorted:
+            insort(self._terms, term)
+        else:  # The vocabulary will be sorted after building.
+            self._terms.append(term)
+        if len(term) >= MIN_TYPO_TERM_LENGTH:
+            for variant in {term} | _get_deletions_of_(term):
+                self._variants[variant].add(term)
+
+    def _remove_term(self, term: str) -> None:
+        """Removes the term that has no postings from the vocabulary."""
+        del self._terms[bisect_left(self._terms, term)]
+        if len(term) >= MIN_TYPO_TERM_LENGTH:
+            for variant in {term} | _get_deletions_of_(term):
+                self._variants[variant].discard(term)
+                if not self._variants[variant]:
+                    del self._variants[variant]
+
+
+def _get_product_rows(product_ids: Collection[int] | None = None):
+    """Returns rows with product data for indexing (all or by the IDs)."""
+    products = Product.objects.all()
+    if product_ids is not None:
+        products = products.filter(id__in=product_ids)
+    return products.values_list(
+        "id", "name", "brand__name", "category__name", "year", "description"
+    ).iterator(chunk_size=2000)
+
+
+def _get_weighted_terms_from_(row: tuple) -> dict[str, float]:
+    """Returns terms of the product row with their summed field weights."""
+    _, name, brand, category, year, description = row
+    fields = {
+        "name": name,
+        "brand": brand,
+        "category": category,
+        "year": str(year),
+        "description": unescape(strip_tags(description)),
+    }
+    terms = defaultdict(float)
+    for field, text in fields.items():
+        for term in set(tokenize(text)):
+            terms[term] += FIELD_WEIGHTS[field]
+    return dict(terms)
+
+
+product_search_index = ProductSearchIndex()
@@ -1,61 +1,184 @@
 import json
 import logging
+from typing import Any, Iterable, NamedTuple
 
 from django.conf import settings
-from django.core.cache import cache
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import QuerySet, Case, When, Q, F
+from django.utils.dateformat import format as date_format
+from django.utils.timezone import localtime
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
 
-from . import models
+from . import models, catalog_cache, likes, search, suggestions
 
 logger = logging.getLogger(__name__)
 
+# The 'orderby' GET parameter -> the product field to order by
+ORDERING_FIELD_NAMES = {
+    "name": "name",
+    "price": "price",
+    "popularity": "like_count",
+}
 
-def get_recently_added_products(count: int) -> QuerySet[models.Product]:
+REVIEW_THREADS_PER_PAGE = 10
+LIKES_BATCH_MAX_SIZE = 50
+REVIEW_CREATED_FORMAT = "d.m.Y | H:i"  # the same as in templates
+
+
+def get_recently_added_products(count: int) -> list[models.Product]:
     """
     Returns the given number of recently added products from cache or database.
     """
-    if not (recently_added_products := cache.get("recently_added_products")):
-        recently_added_products = models.Product.objects.order_by("-id").only(
-            "name", "slug", "image", "price"
-        )[:count]
-        cache.set("recently_added_products", recently_added_products)
-    return recently_added_products
+    return catalog_cache.get_or_set_catalog_entry(
+        f"recently_added_products:{count}",
+        lambda: list(
+            models.Product.objects.order_by("-id").only(
+                "name", "slug", "image", "image_renditions", "price"
+            )[:count]
+        ),
+        timeout=60 * 15,  # 15 minutes
+    )
+
 
+def get_liked_product_ids_among_(
+        products: Iterable[models.Product], user: User
+) -> set[int]:
+    """Returns a set of IDs of the given products liked by the given user."""
+    return likes.get_liked_among_(user.id, (p.id for p in products))
 
-def get_liked_products_for_(user: User) -> list[int]:
-    """Returns a list of IDs for all products liked by the given user."""
-    return [tup[0] for tup in user.like_set.all().values_list("product_id")]
+
+def is_product_liked_by_(user: User, product_id: int) -> bool:
+    """Checks if the given user liked the product by the given ID."""
+    return bool(likes.get_liked_among_(user.id, [product_id]))
+
+
+def get_product_shots_for_(
+        product: models.Product,
+) -> QuerySet[models.ProductShot]:
+    """Returns shots (name and image only) of the given product."""
+    return models.ProductShot.objects.filter(product=product).only(
+        "name", "image", "image_renditions"
+    )
+
+
+class ReviewThread(NamedTuple):
+    """Named tuple that holds a top-level review with its answers."""
+
+    review: models.Review
+    answers: list[models.Review]
+
+
+def get_review_threads_for_(
+        product_id: int,
+        before_id: int | None = None,
+        count: int = REVIEW_THREADS_PER_PAGE,
+) -> tuple[list[ReviewThread], int | None]:
+    """
+    Returns the given number of the newest review threads of the product
+    (before the top-level review by the given ID) and the ID to load the next
+    threads before (or None if there are no more) in one query.
+    """
+    top_level_reviews = models.Review.objects.filter(
+        product_id=product_id, parent=None
+    )
+    if before_id is not None:
+        top_level_reviews = top_level_reviews.filter(id__lt=before_id)
+    # One more thread to know if there are more threads.
+    top_level_ids = top_level_reviews.order_by("-id").values("id")[: count + 1]
+
+    reviews = (
+        models.Review.objects.filter(
+            Q(id__in=top_level_ids) | Q(parent_id__in=top_level_ids)
+        )
+        .only("name", "body", "created", "parent_id")
+        .order_by("-id")
+    )
+    threads = _get_review_threads_from_(reviews)
+    if len(threads) > count:
+        return threads[:count], threads[count - 1].review.id
+    return threads, None
 
 
-def get_all_brands() -> QuerySet[models.Brand]:
-    """Returns a QuerySet with all brands from cache or database."""
-    if not (brands := cache.get("all_brands")):
-        brands = models.Brand.objects.all()
-        cache.set("all_brands", brands)
-    return brands
+def _get_review_threads_from_(
+        reviews: Iterable[models.Review],
+) -> list[ReviewThread]:
+    """
+    Returns threads (in one pass over the reviews ordered by -id)
+    with their answers in chronological order.
+    """
+    threads: list[ReviewThread] = []
+    answers_by_review_id: dict[int, list[models.Review]] = {}
+    answers: list[models.Review] = []
+    for review in reviews:
+        if review.parent_id is None:
+            thread = ReviewThread(review, [])
+            threads.append(thread)
+            answers_by_review_id[review.id] = thread.answers
+        else:
+            answers.append(review)
+    for answer in reversed(answers):
+        answers_by_review_id[answer.parent_id].append(answer)
+    return threads
+
+
+def get_review_threads_data_from_(
+        threads: list[ReviewThread],
+) -> list[dict[str, Any]]:
+    """Returns review threads data for JSON."""
+    return [
+        {
+            **_get_review_data_from_(thread.review),
+            "answers": [
+                _get_review_data_from_(answer) for answer in thread.answers
+            ],
+        }
+        for thread in threads
+    ]
+
+
+def _get_review_data_from_(review: models.Review) -> dict[str, Any]:
+    """Returns review data for JSON."""
+    return {
+        "id": review.id,
+        "name": review.name,
+        "body": review.body,
+        "created": date_format(
+            localtime(review.created), REVIEW_CREATED_FORMAT
+        ),
+    }
+
+
+def get_all_brands() -> list[models.Brand]:
+    """Returns a list with all brands from cache or database."""
+    return catalog_cache.get_or_set_catalog_entry(
+        "all_brands",
+        lambda: list(models.Brand.objects.all().only("name", "slug")),
+        timeout=60 * 60,  # 1 hour
+    )
 
 
-def get_all_categories() -> QuerySet[models.Category]:
-    """Returns a QuerySet with all categories from cache or database."""
-    if not (categories := cache.get("all_categories")):
-        categories = models.Category.objects.all()
-        cache.set("all_categories", categories)
-    return categories
+def get_all_categories() -> list[models.Category]:
+    """Returns a list with all categories from cache or database."""
+    return catalog_cache.get_or_set_catalog_entry(
+        "all_categories",
+        lambda: list(models.Category.objects.all().only("name", "slug")),
+        timeout=60 * 60,  # 1 hour
+    )
 
 
-def get_all_carousel_images() -> QuerySet[models.CarouselImage]:
-    """Returns a QuerySet with all carousel images from cache or database."""
-    if not (carousel_images := cache.get("all_carousel_images")):
-        carousel_images = (
+def get_all_carousel_images() -> list[models.CarouselImage]:
+    """Returns a list with all carousel images from cache or database."""
+    return catalog_cache.get_or_set_catalog_entry(
+        "all_carousel_images",
+        lambda: list(
             models.CarouselImage.objects.all()
             .select_related("product")
-            .only("image", "product__slug")
-        )
-        cache.set("all_carousel_images", carousel_images)
-    return carousel_images
+            .only("image", "image_renditions", "product__slug")
+        ),
+        timeout=60 * 60,  # 1 hour
+    )
 
 
 def are_ordering_parameters_valid(order_by: str, order_dir: str) -> bool:
@@ -68,7 +191,7 @@ def are_ordering_parameters_valid(order_by: str, order_dir: str) -> bool:
             # there is order_dir but there is not order_by
             or (order_dir and not order_by)
             or (order_dir not in ("asc", "desc"))
-            or (order_by not in ("name", "price"))
+            or (order_by not in ORDERING_FIELD_NAMES)
     ):
         return False
     return True
@@ -79,11 +202,51 @@ def get_order_symbol_by_(order_dir: str) -> str:
     return "-" if order_dir == "desc" else ""
 
 
-def get_products_that_contains_(
-        user_input: str, products: QuerySet[models.Product]
+def get_ordering_field_by_(order_by: str, order_dir: str) -> str:
+    """Returns the Django ordering field by the valid GET parameters."""
+    return get_order_symbol_by_(order_dir) + ORDERING_FIELD_NAMES[order_by]
+
+
+def get_search_results_by_(user_input: str) -> search.SearchResults | None:
+    """
+    Returns IDs of the most relevant products found by user search input
+    ordered by relevance and the number of all found products
+    or None if there are no words to search by.
+    """
+    return search.product_search_index.search(user_input)
+
+
+def get_products_with_(
+        product_ids: list[int], products: QuerySet[models.Product]
 ) -> QuerySet[models.Product]:
-    """Returns the given products filtered by user search input."""
-    return products.filter(name__icontains=user_input)
+    """
+    Returns the given products with the given (found) IDs
+    ordered by their position if there is no other ordering.
+    """
+    if not product_ids:
+        return products.none()
+
+    products = products.filter(id__in=product_ids)
+    if not products.query.order_by:
+        products = products.order_by(
+            Case(
+                *[
+                    When(id=product_id, then=position)
+                    for position, product_id in enumerate(product_ids)
+                ]
+            )
+        )
+    return products
+
+
+def get_search_suggestions_for_(user_input: str) -> list[dict[str, str]]:
+    """Returns search suggestions (name, type, url) for the user input."""
+    return [
+        suggestion._asdict()
+        for suggestion in suggestions.suggestion_index.get_suggestions_for_(
+            user_input[:100]
+        )
+    ]
 
 
 def check_and_get_redirect_response_by_(form) -> HttpResponseRedirect | None:
@@ -93,17 +256,18 @@ def check_and_get_redirect_response_by_(form) -> HttpResponseRedirect | None:
     category = form.cleaned_data["category"]
     brands = form.cleaned_data["brands"]
     years = form.cleaned_data["years"]
+    price_band = form.cleaned_data["price_band"] is not None
 
     # If checked only the category in the form
-    if category and not any([max_price, min_price, brands, years]):
+    if category and not any([max_price, min_price, price_band, brands, years]):
         return redirect("shop:category", slug=category.slug)
 
     if (  # checked only one brand in the form
             brands
             and len(brands) == 1
-            and not any([max_price, min_price, category, years])
+            and not any([max_price, min_price, price_band, category, years])
     ):
-        return redirect("shop:brand", slug=brands.first().slug)
+        return redirect("shop:brand", slug=brands[0].slug)
 
     return None
 
@@ -130,42 +294,78 @@ def create_review_with_data_from_(
     review.product = models.Product.objects.get(slug=product_slug)
     if review_parent_id:
         review.parent_id = int(review_parent_id)
-    review.save()
+    with transaction.atomic():
+        review.save()
+        models.Product.objects.filter(id=review.product_id).update(
+            review_count=F("review_count") + 1,
+            last_reviewed_at=review.created,
+        )
 
 
-def _get_user_id_from_(request_body: bytes) -> int | None:
-    """Extracts and returns the user ID from a JSON request body."""
-    data = json.loads(request_body)
-    try:
-        return int(data["user_id"])
-    except (KeyError, ValueError, TypeError):
-        return None
+def get_product_id_by_(slug: str) -> int | None:
+    """Returns the ID of the product by the slug from cache or database."""
+    return catalog_cache.get_or_set_catalog_entry(
+        f"product_id:{slug}",
+        lambda: models.Product.objects.filter(slug=slug)
+        .values_list("id", flat=True)
+        .first(),
+        timeout=60 * 60,  # 1 hour
+    )
 
 
 def add_or_delete_like_and_get_response_message(
-        request_body: bytes, product_slug: str
+        user_id: int, product_slug: str
 ) -> str:
     """
     Adds or deletes a 'like' record
     for the given product slug and user ID and returns a response message.
     """
-    user_id = _get_user_id_from_(request_body)
+    product_id = get_product_id_by_(product_slug)
 
-    if not (product_slug and user_id):
+    if not (product_id and user_id):
         logger.error(
             f"like processing: product_slug={product_slug}, user_id={user_id}"
         )
         return settings.ERROR_MESSAGE
 
-    like, was_created = models.Like.objects.get_or_create(
-        user_id=user_id,
-        product_id=models.Product.objects.get(slug=product_slug).id,
-    )
-
-    if not was_created:
-        like.delete()
-        message_prefix = "deleted from"
-    else:
+    if likes.toggle_like(user_id, product_id):
         message_prefix = "added to"
+    else:
+        message_prefix = "deleted from"
 
     return f"Product has successfully {message_prefix} your wish list."
+
+
+def _get_product_slugs_from_(request_body: bytes) -> list[str] | None:
+    """Extracts and returns product slugs from a JSON request body."""
+    try:
+        product_slugs = json.loads(request_body)["products"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if (
+        not isinstance(product_slugs, list)
+        or len(product_slugs) > LIKES_BATCH_MAX_SIZE
+        or not all(isinstance(slug, str) for slug in product_slugs)
+    ):
+        return None
+    return product_slugs
+
+
+def toggle_likes_and_get_states(
+        user_id: int, request_body: bytes
+) -> dict[str, bool] | None:
+    """
+    Toggles likes of the user for the products from the JSON request body
+    ({"products": [<slug>, ...]}) in the given order and returns
+    the like states of the products by slugs or None if the body is invalid.
+    Unknown slugs are skipped.
+    """
+    if (product_slugs := _get_product_slugs_from_(request_body)) is None:
+        return None
+
+    states = {}
+    with transaction.atomic():
+        for slug in product_slugs:
+            if product_id := get_product_id_by_(slug):
+                states[slug] = likes.toggle_like(user_id, product_id)
+    return states
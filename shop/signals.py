@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from . import catalog_cache, images
+from .models import Product, ProductShot, Brand, Category, CarouselImage
+
+
+CATALOG_MODELS = (Product, Brand, Category, CarouselImage)
+IMAGE_MODELS = (Product, ProductShot, CarouselImage)
+
+
+def invalidate_catalog_cache(sender, instance, **kwargs) -> None:
+    """
+    Invalidates the catalog cache after the transaction is committed
+    and logs the changed products for the search index.
+    """
+    if sender is Product:
+        changed_product_ids = [instance.id]
+    elif sender is CarouselImage:  # it isn't searchable
+        changed_product_ids = []
+    else:  # the brand or category name of its products
+        changed_product_ids = None
+    transaction.on_commit(
+        lambda: catalog_cache.bump_catalog_generation(changed_product_ids)
+    )
+
+
+def enqueue_image_processing(instance, **kwargs) -> None:
+    """Adds the job for the saved image after the transaction is committed
+    (if the image has been changed and it's allowed to be processed)."""
+    if instance.is_image_processing_required:
+        instance.is_image_processing_required = False
+        transaction.on_commit(
+            lambda: images.enqueue_image_job_for_(instance)
+        )
+
+
+for model in CATALOG_MODELS:
+    for signal in (post_save, post_delete):
+        signal.connect(
+            invalidate_catalog_cache,
+            sender=model,
+            dispatch_uid=f"invalidate_catalog_cache_{model.__name__}",
+        )
+
+for model in IMAGE_MODELS:
+    post_save.connect(
+        enqueue_image_processing,
+        sender=model,
+        dispatch_uid=f"enqueue_image_processing_{model.__name__}",
+    )
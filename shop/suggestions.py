@@ -0,0 +1,169 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Collection, NamedTuple
+
+from django.urls import reverse
+
+from .catalog_index import CatalogIndex
+from .models import Product, Brand, Category
+
+
+MAX_KEY_LENGTH = 24
+MAX_SCANNED_KEYS = 200
+SUGGESTIONS_LIMIT = 6
+
+# Categories and brands are suggested before products.
+TYPE_PRIORITIES = {"category": 0, "brand": 1, "product": 2}
+
+
+class Suggestion(NamedTuple):
+    """Named tuple that holds information about a search suggestion."""
+
+    name: str
+    type: str
+    url: str
+
+
+def normalize(text: str) -> str:
+    """Returns the lowercase text with single spaces between words."""
+    return " ".join(text.lower().split())
+
+
+class SuggestionIndex(CatalogIndex):
+    """
+    Compact prefix index of product, brand and category names. Every word
+    start of a name is a key in one sorted list, so a prefix lookup is
+    a binary search.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty (not built) index."""
+        super().__init__()
+        self._keys: list[str] = []
+        self._suggestion_ids = array("I")
+        self._suggestions: list[Suggestion | None] = []
+        self._normalized_names: list[str] = []
+        # product ID -> suggestion ID (for updates of changed products)
+        self._product_suggestion_ids: dict[int, int] = {}
+
+    def _get_built_state(self) -> dict[str, Any]:
+        """Returns the structures of the index of all names."""
+        suggestions, product_suggestion_ids = [], {}
+        for product_id, suggestion in _get_all_suggestions():
+            if product_id is not None:
+                product_suggestion_ids[product_id] = len(suggestions)
+            suggestions.append(suggestion)
+        normalized_names = [normalize(s.name) for s in suggestions]
+
+        key_pairs = [
+            (key, suggestion_id)
+            for suggestion_id, name in enumerate(normalized_names)
+            for key in _get_keys_of_(name)
+        ]
+        key_pairs.sort()
+        return {
+            "_keys": [key for key, _ in key_pairs],
+            "_suggestion_ids": array("I", (id_ for _, id_ in key_pairs)),
+            "_suggestions": suggestions,
+            "_normalized_names": normalized_names,
+            "_product_suggestion_ids": product_suggestion_ids,
+        }
+
+    def _update_products(self, product_ids: set[int]) -> None:
+        """
+        Replaces the keys of the products by the IDs (the suggestion slots
+        of deleted products stay empty until the index is rebuilt).
+        """
+        for product_id in product_ids & self._product_suggestion_ids.keys():
+            id_ = self._product_suggestion_ids.pop(product_id)
+            for key in _get_keys_of_(self._normalized_names[id_]):
+                self._remove_key(key, id_)
+            self._suggestions[id_] = None
+            self._normalized_names[id_] = ""
+
+        for product_id, suggestion in _get_product_suggestions(product_ids):
+            id_ = len(self._suggestions)
+            self._product_suggestion_ids[product_id] = id_
+            self._suggestions.append(suggestion)
+            self._normalized_names.append(name := normalize(suggestion.name))
+            for key in _get_keys_of_(name):
+                index = bisect_right(self._keys, key)
+                self._keys.insert(index, key)
+                self._suggestion_ids.insert(index, id_)
+
+    def _remove_key(self, key: str, suggestion_id: int) -> None:
+        """Removes the key of the suggestion from the sorted keys."""
+        index = bisect_left(self._keys, key)
+        while self._suggestion_ids[index] != suggestion_id:
+            index += 1
+        del self._keys[index]
+        del self._suggestion_ids[index]
+
+    def get_suggestions_for_(
+        self, user_input: str, limit: int = SUGGESTIONS_LIMIT
+    ) -> list[Suggestion]:
+        """Returns suggestions whose name has a word starting with input."""
+        if not (query := normalize(user_input)):
+            return []
+        with self._lock:
+            self._ensure_fresh()
+            key_prefix = query[:MAX_KEY_LENGTH]
+            index = bisect_left(self._keys, key_prefix)
+            last_index = min(index + MAX_SCANNED_KEYS, len(self._keys))
+            suggestion_ids = set()
+            while index < last_index and self._keys[index].startswith(
+                key_prefix
+            ):
+                suggestion_ids.add(self._suggestion_ids[index])
+                index += 1
+            suggestions = [
+                self._suggestions[id_]
+                for id_ in suggestion_ids
+                # Long queries are checked with the full names.
+                if len(query) <= MAX_KEY_LENGTH
+                or _has_word_starting_with_(self._normalized_names[id_], query)
+            ]
+
+        suggestions.sort(key=lambda s: (TYPE_PRIORITIES[s.type], s.name))
+        return suggestions[:limit]
+
+
+def _has_word_starting_with_(name: str, query: str) -> bool:
+    """Checks if the normalized name has a word that starts with the query."""
+    return name.startswith(query) or f" {query}" in name
+
+
+def _get_keys_of_(name: str) -> list[str]:
+    """Returns the keys (starts of every word) of the normalized name."""
+    keys, words_start = [], 0
+    for word in name.split(" "):
+        keys.append(name[words_start : words_start + MAX_KEY_LENGTH])
+        words_start += len(word) + 1
+    return keys
+
+
+def _get_all_suggestions():
+    """Yields suggestions for all categories, brands and products
+    (with IDs of the products)."""
+    for model, type_ in ((Category, "category"), (Brand, "brand")):
+        for name, slug in model.objects.values_list("name", "slug"):
+            yield None, Suggestion(name, type_, _get_url_by_(model, slug))
+    yield from _get_product_suggestions()
+
+
+def _get_product_suggestions(product_ids: Collection[int] | None = None):
+    """Yields IDs and suggestions of the products (all or by the IDs)."""
+    products = Product.objects.all()
+    if product_ids is not None:
+        products = products.filter(id__in=product_ids)
+    rows = products.values_list("id", "name", "slug")
+    for id_, name, slug in rows.iterator(chunk_size=2000):
+        yield id_, Suggestion(name, "product", _get_url_by_(Product, slug))
+
+
+def _get_url_by_(model: type[Product | Brand | Category], slug: str) -> str:
+    """Returns the URL to the page of the model instance by the slug."""
+    return reverse(f"shop:{model.url_pattern_name}", args=[slug])
+
+
+suggestion_index = SuggestionIndex()
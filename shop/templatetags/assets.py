@@ -0,0 +1,54 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import SafeText, mark_safe
+
+from general.critical_css import get_critical_css_of_
+
+
+register = template.Library()
+
+# It's set in the render context when the critical CSS of a page is inlined.
+CRITICAL_CSS_CONTEXT_KEY = "is_critical_css_inlined"
+
+
+@register.simple_tag(takes_context=True)
+def critical_css(context, page: str) -> SafeText:
+    """
+    Returns the style tag with the critical CSS of the page
+    (built by the build_critical_css command), so the next stylesheets
+    are loaded asynchronously and don't block the first paint.
+    """
+    if not (css := get_critical_css_of_(page)):
+        return ""
+    context.render_context[CRITICAL_CSS_CONTEXT_KEY] = True
+    return mark_safe(f"<style>{css}</style>")
+
+
+@register.simple_tag(takes_context=True)
+def stylesheet(
+    context, href: str, integrity: str = "", crossorigin: str = ""
+) -> SafeText:
+    """
+    Returns the link tag of the stylesheet (static file path or URL).
+    It's loaded asynchronously if the critical CSS has been inlined
+    (with the link tag in noscript tag for browsers without JavaScript).
+    """
+    if not href.startswith(("https://", "http://")):
+        href = static(href)
+    attributes = format_html(
+        'href="{}"{}{}',
+        href,
+        format_html(' integrity="{}"', integrity) if integrity else "",
+        format_html(' crossorigin="{}"', crossorigin) if crossorigin else "",
+    )
+    link = format_html('<link rel="stylesheet" {} />', attributes)
+    if not context.render_context.get(CRITICAL_CSS_CONTEXT_KEY):
+        return link
+    return format_html(
+        '<link rel="preload" as="style" {} '
+        "onload=\"this.onload=null;this.rel='stylesheet'\" />"
+        "<noscript>{}</noscript>",
+        attributes,
+        link,
+    )
@@ -0,0 +1,74 @@
+from django import template
+from django.db.models.fields.files import FieldFile
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeText
+
+from general.media import get_media_url_of_
+from general.models import ModelWithImage
+
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def media_url(context, file: FieldFile | str, absolute: bool = False) -> str:
+    """
+    Returns the URL of the media file (field file or name) on the media
+    origin (absolute if it's required, e.g. for meta tags).
+    """
+    if isinstance(file, FieldFile):
+        url = get_media_url_of_(file.name, file.storage)
+    else:
+        url = get_media_url_of_(file)
+    if absolute and (request := context.get("request")) is not None:
+        return request.build_absolute_uri(url)
+    return url
+
+
+def _get_srcset_of_(instance: ModelWithImage, image_format: str) -> str:
+    """Returns the srcset attribute value with the image renditions."""
+    return ", ".join(
+        f"{url} {width}w"
+        for width, url in instance.get_image_rendition_urls(image_format)
+    )
+
+
+@register.simple_tag
+def responsive_image(
+    instance: ModelWithImage,
+    sizes: str,
+    alt: str = "",
+    css_class: str = "",
+    loading: str = "lazy",
+) -> SafeText:
+    """
+    Returns the picture tag with the image renditions for the given sizes
+    (AVIF source if there are AVIF renditions and WebP srcset for the img),
+    so the browser downloads the image of the needed width only.
+    The img tag has the original image URL for browsers without srcset.
+    """
+    img_attributes = {
+        "src": instance.get_image_url(),
+        "alt": alt,
+        "class": css_class,
+        "loading": loading,
+    }
+    if webp_srcset := _get_srcset_of_(instance, "webp"):
+        img_attributes.update(srcset=webp_srcset, sizes=sizes)
+    avif_source = ""
+    if avif_srcset := _get_srcset_of_(instance, "avif"):
+        avif_source = format_html(
+            '<source type="image/avif" srcset="{}" sizes="{}" />',
+            avif_srcset,
+            sizes,
+        )
+    img = format_html_join(
+        " ",
+        '{}="{}"',
+        (
+            (name, value)
+            for name, value in img_attributes.items()
+            if value or name == "alt"
+        ),
+    )
+    return format_html("<picture>{}<img {} /></picture>", avif_source, img)
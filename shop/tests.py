@@ -0,0 +1,354 @@
+import io
+import os
+import shutil
+import tempfile
+from array import array
+from unittest import mock, skipUnless
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+from django.db import connection
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from general.test_mixins.for_views import (
+    ViewNumQueriesTestMixin,
+    UserTestMixin,
+    ProductTestMixin,
+)
+from general.images import is_content_hashed_
+from . import catalog_cache, facets, images, likes, query_plans
+from .models import Product, Review, ProductShot, CarouselImage
+from .suggestions import SuggestionIndex
+
+
+class ProductDetailViewNumQueriesTest(
+    ViewNumQueriesTestMixin, UserTestMixin, ProductTestMixin, TestCase
+):
+    """
+    Test that the product detail page of an anonymous user makes
+    a fixed number of queries regardless of its reviews and shots.
+    """
+
+    num_queries = 3
+    objects_count = 300
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Sets up test data by creating a product with a lot of
+        reviews, answers to them and shots and an user."""
+        UserTestMixin.setUpTestData.__func__(cls)
+        ProductTestMixin.setUpTestData.__func__(cls)
+        cls.url = cls.product.get_absolute_url()
+        threads = Review.objects.bulk_create(
+            Review(name=f"User {i}", body="Review", product=cls.product)
+            for i in range(cls.objects_count)
+        )
+        Review.objects.bulk_create(
+            Review(
+                name=f"User {i}",
+                body="Answer",
+                product=cls.product,
+                parent=thread,
+            )
+            for i, thread in enumerate(threads)
+        )
+        ProductShot.objects.bulk_create(
+            ProductShot(
+                name=f"Shot {i}",
+                image=f"product_shots/shot-{i}.webp",
+                product=cls.product,
+            )
+            for i in range(cls.objects_count)
+        )
+
+    def setUp(self) -> None:
+        """Clears the cache so the cached data is queried in the test."""
+        cache.clear()
+
+
+class ProductDetailViewNumQueriesForUserTest(
+    ProductDetailViewNumQueriesTest
+):
+    """
+    Test that the product detail page of a logged in user makes
+    a fixed number of queries regardless of its reviews and shots.
+    """
+
+    num_queries = 6
+    is_login_required = True
+
+
+class ToggleLikeTest(UserTestMixin, ProductTestMixin, TestCase):
+    """Test that toggling likes keeps the cached liked products fresh."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Sets up test data by creating an user and a product."""
+        UserTestMixin.setUpTestData.__func__(cls)
+        ProductTestMixin.setUpTestData.__func__(cls)
+
+    def setUp(self) -> None:
+        """Clears the cache and caches that nothing is liked by the user."""
+        cache.clear()
+        self.assertEqual(self._get_liked_product_ids(), set())
+
+    def _get_liked_product_ids(self) -> set[int]:
+        """Returns the IDs of the test products liked by the user."""
+        return likes.get_liked_among_(self.user.id, [self.product.id])
+
+    def _toggle_like(self) -> bool:
+        """Toggles the like and runs the callbacks of the commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return likes.toggle_like(self.user.id, self.product.id)
+
+    def test_liked_product_is_not_served_from_stale_cache(self):
+        """Test that a liked product is in the liked IDs at once."""
+        self.assertTrue(self._toggle_like())
+        self.assertEqual(self._get_liked_product_ids(), {self.product.id})
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.like_count, 1)
+
+    def test_unliked_product_is_not_served_from_stale_cache(self):
+        """Test that an unliked product is not in the liked IDs at once."""
+        self._toggle_like()
+        self._get_liked_product_ids()
+        self.assertFalse(self._toggle_like())
+        self.assertEqual(self._get_liked_product_ids(), set())
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.like_count, 0)
+
+    def test_cached_ids_are_updated_only_after_commit(self):
+        """Test that the cached IDs are updated when the like is committed."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            likes.toggle_like(self.user.id, self.product.id)
+        self.assertEqual(self._get_liked_product_ids(), set())
+        callbacks[0]()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self._get_liked_product_ids(), {self.product.id}
+            )
+
+    def test_cached_ids_are_not_served_from_per_process_cache(self):
+        """Test that a stale copy of the L1 cache tier (e.g. of another
+        process) isn't read after the like has been toggled."""
+        self._toggle_like()
+        caches["l1"].set(f"likes:{self.user.id}", array("q"))
+        self.assertEqual(self._get_liked_product_ids(), {self.product.id})
+
+
+class SuggestionIndexTest(ProductTestMixin, TestCase):
+    """Test that the suggestion index is updated without rebuilding."""
+
+    def setUp(self) -> None:
+        """Builds the index of the test product."""
+        cache.clear()
+        self.index = SuggestionIndex()
+        self.index.build()
+
+    def _get_names_for_(self, user_input: str) -> list[str]:
+        """Returns names of the suggestions for the input."""
+        return [
+            suggestion.name
+            for suggestion in self.index.get_suggestions_for_(user_input)
+        ]
+
+    def test_changed_products_are_updated_incrementally(self):
+        """Test that renamed, new and deleted products are updated."""
+        with mock.patch.object(
+            self.index, "_get_built_state"
+        ) as get_built_state, self.captureOnCommitCallbacks(execute=True):
+            self.product.name = "Renamed laptop"
+            self.product.save()
+            Product.objects.create(
+                name="New laptop",
+                price=1000,
+                year=2023,
+                brand=self.product.brand,
+                category=self.product.category,
+            )
+        self.assertEqual(
+            self._get_names_for_("lap"), ["New laptop", "Renamed laptop"]
+        )
+        self.assertEqual(self._get_names_for_("test product"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.delete()
+        self.assertEqual(self._get_names_for_("lap"), ["New laptop"])
+        get_built_state.assert_not_called()
+
+    def test_empty_changes_do_not_rebuild_index(self):
+        """Test that a bump without changed products keeps the index."""
+        catalog_cache.bump_catalog_generation(changed_product_ids=[])
+        with mock.patch.object(self.index, "_get_built_state") as build:
+            self.assertEqual(self._get_names_for_("test p"), ["Test product"])
+        build.assert_not_called()
+
+    def test_unknown_changes_rebuild_index_in_background(self):
+        """Test that the index is rebuilt in the background if any product
+        could be changed (e.g. by a renamed brand)."""
+        catalog_cache.bump_catalog_generation()
+        with mock.patch.object(
+            self.index, "_rebuild_in_background"
+        ) as rebuild_in_background:
+            self.assertEqual(self._get_names_for_("test p"), ["Test product"])
+        rebuild_in_background.assert_called_once()
+
+
+class FacetIndexTest(ProductTestMixin, TestCase):
+    """Test that the facet index counts products without rebuilding."""
+
+    def setUp(self) -> None:
+        """Builds the index of the test product and one more product."""
+        cache.clear()
+        self.other_product = Product.objects.create(
+            name="Other product",
+            price=700,
+            year=2021,
+            brand=self.product.brand,
+            category=self.product.category,
+        )
+        self.index = facets.FacetIndex()
+        self.index.build()
+
+    def test_counts_of_found_products(self):
+        """Test that only the found products are counted."""
+        counts = self.index.get_counts_for_(
+            facets.FacetFilters(years=frozenset([2023])),
+            [self.product.id, self.other_product.id, 0],
+        )
+        self.assertEqual(counts.total, 1)
+        self.assertEqual(counts.years, {2021: 1, 2023: 1})
+        self.assertEqual(counts.price_bands, {3: 1})
+        self.assertEqual(counts.brands, {self.product.brand_id: 1})
+
+    def test_changed_products_are_updated_incrementally(self):
+        """Test that the counts of a changed product are updated in place."""
+        filters = facets.FacetFilters()
+        self.assertEqual(
+            self.index.get_counts_for_(filters).price_bands, {1: 1, 3: 1}
+        )
+        with mock.patch.object(
+            self.index, "_get_built_state"
+        ) as get_built_state, self.captureOnCommitCallbacks(execute=True):
+            self.product.price = 400
+            self.product.year = 2020
+            self.product.save()
+            self.other_product.delete()
+        counts = self.index.get_counts_for_(filters)
+        self.assertEqual((counts.total, counts.price_bands), (1, {0: 1}))
+        self.assertEqual(self.index.get_years(), [2020])
+        get_built_state.assert_not_called()
+
+    def test_empty_changes_do_not_rebuild_index(self):
+        """Test that a bump without changed products keeps the index."""
+        catalog_cache.bump_catalog_generation(changed_product_ids=[])
+        with mock.patch.object(self.index, "_get_built_state") as build:
+            self.assertEqual(self.index.get_years(), [2021, 2023])
+        build.assert_not_called()
+
+
+class ProcessImageJobsTest(ProductTestMixin, TestCase):
+    """Test that processed images replace the originals without 404s."""
+
+    def setUp(self) -> None:
+        """Saves a big image of the product to a temporary media root."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 1000), "red").save(buffer, "PNG")
+        self.product.image = ContentFile(buffer.getvalue(), name="big.png")
+        self.product.save()
+        self.original_path = self.product.image.path
+        images.enqueue_image_job_for_(self.product)
+
+    def _process_image_jobs(self) -> images.BatchResult:
+        """Processes the jobs with threads and returns the result."""
+        with ThreadPoolExecutor(1) as executor:
+            return images.process_image_jobs(executor)
+
+    def test_image_is_replaced_with_hashed_copy(self):
+        """Test that the object gets the optimized content-hashed image."""
+        self.assertEqual(self._process_image_jobs().done, 1)
+        product = Product.objects.get(id=self.product.id)
+        self.assertTrue(is_content_hashed_(product.image.name))
+        with Image.open(product.image.path) as img:
+            self.assertEqual((img.format, img.width), ("WEBP", 800))
+        self.assertTrue(product.image_renditions["webp"])
+
+    def test_original_image_is_deleted_after_delay(self):
+        """Test that the original is served until the cached entries that
+        link to it have expired in every worker."""
+        self._process_image_jobs()
+        deletion_time = images.get_next_original_deletion_time()
+        self.assertGreaterEqual(
+            (deletion_time - timezone.now()).total_seconds(),
+            images.ORIGINAL_DELETION_DELAY - 10,
+        )
+        self._process_image_jobs()
+        self.assertTrue(os.path.exists(self.original_path))
+
+        with mock.patch.object(
+            images.timezone, "now", return_value=deletion_time
+        ):
+            self._process_image_jobs()
+        self.assertFalse(os.path.exists(self.original_path))
+        self.assertIsNone(images.get_next_original_deletion_time())
+
+    def test_carousel_image_is_not_resized(self):
+        """Test that only renditions of a carousel image are resized."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (2400, 800), "blue").save(buffer, "WEBP")
+        carousel_image = CarouselImage.objects.create(
+            name="carousel",
+            image=ContentFile(buffer.getvalue(), name="carousel.webp"),
+            product=self.product,
+        )
+        image_name = carousel_image.image.name
+        images.enqueue_image_job_for_(carousel_image)
+        self._process_image_jobs()
+
+        carousel_image.refresh_from_db()
+        self.assertEqual(carousel_image.image.name, image_name)
+        with Image.open(carousel_image.image.path) as img:
+            self.assertEqual(img.width, 2400)
+        self.assertEqual(
+            sorted(map(int, carousel_image.image_renditions["webp"])),
+            list(CarouselImage.image_rendition_widths),
+        )
+
+    def test_original_image_is_kept_if_it_has_been_changed(self):
+        """Test that files of an outdated job are deleted, not the image."""
+        Product.objects.filter(id=self.product.id).update(
+            image="products/other.webp"
+        )
+        self._process_image_jobs()
+        self.assertTrue(os.path.exists(self.original_path))
+        self.assertEqual(
+            os.listdir(os.path.dirname(self.original_path)),
+            [os.path.basename(self.original_path)],
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN of PostgreSQL")
+class CatalogQueryPlansTest(TestCase):
+    """Test that the canonical catalog queries use indexes."""
+
+    products_count = 5000
+
+    def test_catalog_queries_do_not_use_sequential_scans(self):
+        """Test that no catalog query plan has a 'Seq Scan' node."""
+        brand, category = query_plans.seed_catalog_with_(self.products_count)
+        for case_name, run_case in query_plans.get_catalog_query_cases_for_(
+            brand, category
+        ):
+            with self.subTest(case_name):
+                self.assertEqual(
+                    query_plans.get_seq_scan_tables_of_(run_case), set()
+                )
@@ -9,6 +9,11 @@ urlpatterns = [
     path(
         "products/", views.AllProductsListView.as_view(), name="product_list"
     ),
+    path(
+        "products/suggest/",
+        views.ProductSuggestView.as_view(),
+        name="product_suggest",
+    ),
     path(
         "category/<slug:slug>/",
         views.ProductListByCategoryView.as_view(),
@@ -28,8 +33,16 @@ urlpatterns = [
         "product/<slug:slug>/review/",
         views.ReviewFormView.as_view(),
     ),
+    path(
+        "product/<slug:slug>/reviews/",
+        views.ReviewThreadsView.as_view(),
+        name="product_reviews",
+    ),
     path(
         "product/<slug:slug>/like/",
         views.LikeView.as_view(),
     ),
+    path(
+        "likes/batch/", views.LikesBatchView.as_view(), name="likes_batch"
+    ),
 ]
@@ -1,29 +1,51 @@
 from typing import Any
 
+from django.conf import settings
 from django.views import generic
 from django.contrib import messages
+from django.core.exceptions import BadRequest
+from django.core.paginator import InvalidPage, Paginator
 from django.db.models import QuerySet
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse, HttpRequest, HttpResponseRedirect
+from django.http import (
+    HttpResponse,
+    HttpRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+    Http404,
+)
 
 from general.views import BaseView
+from general.pagination import (
+    EstimatedCountPaginator,
+    KeysetPaginator,
+    get_keyset_ordering_of_,
+)
 from . import services
 from .models import Product, Category, Brand
 from .forms import ProductFilterForm, ReviewModelForm
+from .search import SearchResults
 
 
 class _ShopViewMixin(BaseView):
     """Mixin for the "Shop" views that handle GET requests."""
 
+    # Name of the context variable with the products to display
+    products_context_name = "page_obj"
+
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """
-        Adds list of product IDs that user liked in context data and returns it.
+        Adds set of IDs of the displayed products that user liked
+        in context data and returns it.
         """
         context: dict[str, Any] = super().get_context_data(**kwargs)
         if self.request.user.is_authenticated:
-            context["liked_products"] = services.get_liked_products_for_(
-                self.request.user
+            context["liked_products"] = services.get_liked_product_ids_among_(
+                context.get(self.products_context_name) or [],
+                user=self.request.user,
             )
         return context
 
@@ -32,13 +54,14 @@ class HomeView(_ShopViewMixin, generic.TemplateView):
     """View for the home page and the "/" site URL."""
 
     template_name = "shop/home.html"
+    products_context_name = "recently_added_products"
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Adds some content in context data and returns it."""
-        context: dict[str, Any] = super().get_context_data(**kwargs)
-        context[
-            "recently_added_products"
-        ] = services.get_recently_added_products(10)
+        context: dict[str, Any] = super().get_context_data(
+            recently_added_products=services.get_recently_added_products(10),
+            **kwargs,
+        )
         context["brands"] = services.get_all_brands()
         context["categories"] = services.get_all_categories()
         context["carousel_images"] = services.get_all_carousel_images()
@@ -50,7 +73,11 @@ class _ProductListView(_ShopViewMixin, generic.ListView):
 
     model = Product
     paginate_by = 12
-    queryset = Product.objects.all().only("name", "slug", "image", "price")
+    queryset = Product.objects.all().only(
+        "name", "slug", "image", "image_renditions", "price"
+    )
+    # "offset", "estimated" or "keyset" (see settings)
+    pagination_mode = settings.PRODUCT_LIST_PAGINATION_MODE
 
     def get_ordering(self) -> list[str]:
         """Returns list of ordering after checking GET parameters."""
@@ -58,9 +85,43 @@ class _ProductListView(_ShopViewMixin, generic.ListView):
         order_dir: str | Any = self.request.GET.get("orderdir")
 
         if services.are_ordering_parameters_valid(order_by, order_dir):
-            return [services.get_order_symbol_by_(order_dir) + order_by]
+            return [services.get_ordering_field_by_(order_by, order_dir)]
         return []
 
+    def get_paginator(self, *args, **kwargs) -> Paginator:
+        """Returns the paginator that doesn't count all products exactly
+        in the "estimated" pagination mode."""
+        if self.pagination_mode == "estimated":
+            return EstimatedCountPaginator(*args, **kwargs)
+        return super().get_paginator(*args, **kwargs)
+
+    def paginate_queryset(self, queryset: QuerySet[Product], page_size: int):
+        """
+        Paginates products by the cursor in the "keyset" pagination mode
+        if products are ordered by their fields (not by search relevance).
+        """
+        if (
+            self.pagination_mode != "keyset"
+            or get_keyset_ordering_of_(queryset) is None
+        ):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.get_page(self.request.GET.get("cursor"))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Adds GET parameters for pagination links in context data."""
+        context: dict[str, Any] = super().get_context_data(**kwargs)
+        get_parameters = self.request.GET.copy()
+        get_parameters.pop("page", None)
+        get_parameters.pop("cursor", None)
+        context["pagination_get_parameters"] = get_parameters.urlencode()
+        return context
+
 
 class AllProductsListView(_ProductListView):
     """View for displaying all or filtered or searched products."""
@@ -68,15 +129,23 @@ class AllProductsListView(_ProductListView):
     def get_queryset(self) -> QuerySet[Product]:
         """Returns QuerySet with either searched or filtered products."""
         user_search_input: str | None = self.request.GET.get("q", None)
-        form = ProductFilterForm(self.request.POST)
+        self.filter_form = ProductFilterForm(self.request.POST)
+        self.found_product_ids: list[int] | None = None
+        self.search_results: SearchResults | None = None
         products = super().get_queryset()
 
         if user_search_input is not None:
-            products = services.get_products_that_contains_(
-                user_search_input, products
+            self.search_results = services.get_search_results_by_(
+                user_search_input
             )
-        if form.is_valid():
-            products = form.get_filtered_(products)
+        if self.search_results is not None:
+            self.found_product_ids = self.search_results.product_ids
+        if self.found_product_ids is not None:
+            products = services.get_products_with_(
+                self.found_product_ids, products
+            )
+        if self.filter_form.is_valid():
+            products = self.filter_form.get_filtered_(products)
 
         return products
 
@@ -84,7 +153,15 @@ class AllProductsListView(_ProductListView):
         """Adds page title and filter form in context data and returns it."""
         context: dict[str, Any] = super().get_context_data(**kwargs)
         context["page_title"] = "All products"
-        context["filter_form"] = ProductFilterForm(self.request.POST)
+        if self.search_results is not None and self.search_results.is_limited:
+            messages.info(
+                self.request,
+                f"Only the {len(self.search_results.product_ids)} most "
+                f"relevant of {self.search_results.total} found products "
+                "are shown. Refine your search to see the others.",
+            )
+        self.filter_form.add_facet_counts(self.found_product_ids)
+        context["filter_form"] = self.filter_form
         return context
 
     def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
@@ -100,6 +177,22 @@ class AllProductsListView(_ProductListView):
         return self.get(request, *args, **kwargs)
 
 
+@method_decorator(cache_control(public=True, max_age=60), name="get")
+class ProductSuggestView(BaseView, generic.View):
+    """View for search-as-you-type suggestions in JSON."""
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """Returns suggestions for the 'q' GET parameter."""
+        return JsonResponse(
+            {
+                "suggestions": services.get_search_suggestions_for_(
+                    request.GET.get("q", "")
+                )
+            },
+            json_dumps_params={"separators": (",", ":")},
+        )
+
+
 class ProductListByCategoryView(_ProductListView):
     """View for displaying products by category."""
 
@@ -115,6 +208,7 @@ class ProductListByCategoryView(_ProductListView):
         category = get_object_or_404(Category, slug=self.kwargs["slug"])
         context["page_title"] = category.name.capitalize()
         context["filter_form"] = ProductFilterForm({"category": category})
+        context["filter_form"].add_facet_counts()
         return context
 
 
@@ -133,6 +227,7 @@ class ProductListByBrandView(_ProductListView):
         brand = get_object_or_404(Brand, slug=self.kwargs["slug"])
         context["page_title"] = f"{brand.name.capitalize()} products"
         context["filter_form"] = ProductFilterForm({"brands": [brand]})
+        context["filter_form"].add_facet_counts()
         return context
 
 
@@ -146,14 +241,44 @@ class ProductDetailView(BaseView, generic.DetailView):
         Adds is_liked: bool and review form in context data and returns it.
         """
         context: dict[str, Any] = super().get_context_data(**kwargs)
+        product: Product = context["product"]
         context["review_form"] = ReviewModelForm()
+        context["product_shots"] = services.get_product_shots_for_(product)
+        (
+            context["review_threads"],
+            context["next_review_threads_before_id"],
+        ) = services.get_review_threads_for_(product.id)
         if self.request.user.is_authenticated:
-            context["is_liked"] = context[
-                                      "product"
-                                  ].id in services.get_liked_products_for_(self.request.user)
+            context["is_liked"] = services.is_product_liked_by_(
+                self.request.user, product.id
+            )
         return context
 
 
+class ReviewThreadsView(BaseView, generic.View):
+    """View for loading more review threads of a product in JSON."""
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """Returns review threads before the 'before' (review ID) parameter."""
+        product = get_object_or_404(
+            Product.objects.only("id"), slug=self.kwargs["slug"]
+        )
+        before_id: str | None = request.GET.get("before")
+        if before_id is not None and not before_id.isdigit():
+            raise BadRequest("The 'before' parameter must be a review ID.")
+
+        threads, next_before_id = services.get_review_threads_for_(
+            product.id, before_id=int(before_id) if before_id else None
+        )
+        return JsonResponse(
+            {
+                "threads": services.get_review_threads_data_from_(threads),
+                "next_before": next_before_id,
+            },
+            json_dumps_params={"separators": (",", ":")},
+        )
+
+
 class ReviewFormView(BaseView, generic.FormView):
     """Form view for adding review to product."""
 
@@ -202,6 +327,24 @@ class LikeView(BaseView, LoginRequiredMixin, generic.View):
         """Handles a like operation on the specified product."""
         return HttpResponse(
             services.add_or_delete_like_and_get_response_message(
-                request.body, product_slug=self.kwargs["slug"]
+                request.user.id, product_slug=self.kwargs["slug"]
+            )
+        )
+
+
+class LikesBatchView(BaseView, LoginRequiredMixin, generic.View):
+    """View for toggling likes to several products in one request."""
+
+    def post(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """Toggles likes to the products and returns their like states."""
+        states = services.toggle_likes_and_get_states(
+            request.user.id, request.body
+        )
+        if states is None:
+            raise BadRequest(
+                "The request body must be JSON like {\"products\": [...]} "
+                f"with at most {services.LIKES_BATCH_MAX_SIZE} slugs."
             )
+        return JsonResponse(
+            {"likes": states}, json_dumps_params={"separators": (",", ":")}
         )
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","zh",{embeddingInProgress:"正在嘗試嵌入已貼上的 URL...",embeddingFailed:"這個 URL 無法被自動嵌入。"});
\ No newline at end of file
@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","fr",{bgColor:"Couleur de fond",bgFixed:"Image fixe sans défilement",bgImage:"Image de fond",charset:"Encodage de caractère",charsetASCII:"ASCII",charsetCE:"Europe Centrale",charsetCR:"Cyrillique",charsetCT:"Chinois Traditionnel (Big5)",charsetGR:"Grec",charsetJP:"Japonais",charsetKR:"Coréen",charsetOther:"Autre encodage de caractère",charsetTR:"Turc",charsetUN:"Unicode (UTF-8)",charsetWE:"Occidental",chooseColor:"Choisissez",design:"Design",docTitle:"Titre de la page",
-docType:"Type de document",docTypeOther:"Autre type de document",label:"Propriétés du document",margin:"Marges",marginBottom:"Bas",marginLeft:"Gauche",marginRight:"Droite",marginTop:"Haut",meta:"Métadonnées",metaAuthor:"Auteur",metaCopyright:"Copyright",metaDescription:"Description",metaKeywords:"Mots-clés (séparés par des virgules)",other:"<autre>",previewHtml:'<p>Ceci est un <strong>texte d\'exemple</strong>. Vous utilisez <a href="javascript:void(0)">CKEditor</a>.</p>',title:"Propriétés du document",
-txtColor:"Couleur de texte",xhtmlDec:"Inclure les déclarations XHTML"});
\ No newline at end of file
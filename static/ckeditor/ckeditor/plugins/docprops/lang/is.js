@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","is",{bgColor:"Bakgrunnslitur",bgFixed:"Læstur bakgrunnur",bgImage:"Slóð bakgrunnsmyndar",charset:"Letursett",charsetASCII:"ASCII",charsetCE:"Mið-evrópskt",charsetCR:"Kýrilskt",charsetCT:"Kínverskt, hefðbundið (Big5)",charsetGR:"Grískt",charsetJP:"Japanskt",charsetKR:"Kóreskt",charsetOther:"Annað letursett",charsetTR:"Tyrkneskt",charsetUN:"Unicode (UTF-8)",charsetWE:"Vestur-evrópst",chooseColor:"Choose",design:"Design",docTitle:"Titill síðu",docType:"Flokkur skjalategunda",
-docTypeOther:"Annar flokkur skjalategunda",label:"Eigindi skjals",margin:"Hliðarspássía",marginBottom:"Neðst",marginLeft:"Vinstri",marginRight:"Hægri",marginTop:"Efst",meta:"Lýsigögn",metaAuthor:"Höfundur",metaCopyright:"Höfundarréttur",metaDescription:"Lýsing skjals",metaKeywords:"Lykilorð efnisorðaskrár (aðgreind með kommum)",other:"<annar>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',title:"Eigindi skjals",txtColor:"Litur texta",
-xhtmlDec:"Fella inn XHTML lýsingu"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","fr",{pathName:"objet média",title:"Média Intégré",button:"Insérer le média intégré",unsupportedUrlGiven:"L'URL spécifiée n'est pas supportée.",unsupportedUrl:"L'URL {url} n'est pas supportée par Média Intégré",fetchingFailedGiven:"Échec de la récupération du contenu de l'URL donnée.",fetchingFailed:"Échec de la récupération du contenu pour {url}.",fetchingOne:"Récupération de la réponse oEmbed...",fetchingMany:"Récupération des réponse oEmbed, {current} sur {max} effectué..."});
\ No newline at end of file
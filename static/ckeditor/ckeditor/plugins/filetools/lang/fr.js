@@ -1,6 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","fr",{loadError:"Une erreur est survenue lors de la lecture du fichier.",networkError:"Une erreur réseau est survenue lors du téléversement du fichier.",httpError404:"Une erreur HTTP est survenue durant le téléversement du fichier (404: Fichier non trouvé).",httpError403:"Une erreur HTTP est survenue durant le téléversement du fichier (403: Accès refusé).",httpError:"Une erreur HTTP est survenue durant le téléversement du fichier (statut de l'erreur : %1).",noUrlError:"L'URL de téléversement n'est pas spécifiée.",
-responseError:"Réponse du serveur incorrecte."});
\ No newline at end of file
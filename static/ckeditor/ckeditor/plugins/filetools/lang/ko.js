@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","ko",{loadError:"파일을 읽는 중 오류가 발생했습니다.",networkError:"파일 업로드 중 네트워크 오류가 발생했습니다.",httpError404:"파일 업로드중 HTTP 오류가 발생했습니다 (404: 파일 찾을수 없음).",httpError403:"파일 업로드중 HTTP 오류가 발생했습니다 (403: 권한 없음).",httpError:"파일 업로드중 HTTP 오류가 발생했습니다 (오류 코드 %1).",noUrlError:"업로드 주소가 정의되어 있지 않습니다.",responseError:"잘못된 서버 응답."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","af",{title:"Wiskunde in TeX",button:"Wiskunde",dialogInput:"Skryf you Tex hier",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX dokument",loading:"laai...",pathName:"wiskunde"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","el",{title:"Μαθηματικά με τη γλώσσα TeX",button:"Μαθηματικά",dialogInput:"Γράψτε κώδικα TeX εδώ",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Τεκμηρίωση TeX",loading:"γίνεται φόρτωση...",pathName:"μαθηματικά"});
\ No newline at end of file
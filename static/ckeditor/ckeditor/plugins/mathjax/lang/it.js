@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","it",{title:"Formule in TeX",button:"Formule",dialogInput:"Scrivere qui il proprio TeX",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Documentazione TeX",loading:"caricamento…",pathName:"formula"});
\ No newline at end of file
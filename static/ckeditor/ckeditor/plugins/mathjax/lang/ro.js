@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","ro",{title:"Matematici in TeX",button:"Matematici",dialogInput:"Scrie TeX-ul aici",docUrl:"http://ro.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Documentatie TeX",loading:"încarcă...",pathName:"matematici"});
\ No newline at end of file
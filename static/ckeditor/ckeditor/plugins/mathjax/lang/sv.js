@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","sv",{title:"Mattematik i TeX",button:"Matte",dialogInput:"Skriv din TeX här",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX dokumentation",loading:"laddar...",pathName:"matte"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","zh-cn",{title:"TeX 语法的数学公式编辑器",button:"数学公式",dialogInput:"在此编写您的 TeX 指令",docUrl:"http://zh.wikipedia.org/wiki/TeX",docLabel:"TeX 语法（可以参考维基百科自身关于数学公式显示方式的帮助）",loading:"正在加载...",pathName:"数字公式"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","de",{closed:"Benachrichtigung geschlossen."});
\ No newline at end of file
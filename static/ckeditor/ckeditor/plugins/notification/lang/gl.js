@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","gl",{closed:"Notificación pechada."});
\ No newline at end of file
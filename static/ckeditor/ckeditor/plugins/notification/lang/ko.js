@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","ko",{closed:"알림이 닫힘."});
\ No newline at end of file
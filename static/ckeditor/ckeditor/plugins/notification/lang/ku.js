@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","ku",{closed:"ئاگادارکەرەوەکە داخرا."});
\ No newline at end of file
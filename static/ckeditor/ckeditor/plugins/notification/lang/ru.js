@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","ru",{closed:"Уведомление закрыто"});
\ No newline at end of file
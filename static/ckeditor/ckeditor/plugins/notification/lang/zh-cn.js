@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","zh-cn",{closed:"通知已关闭。"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","bn",{toolbar:"সোর্স",title:"সোর্স"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","cs",{toolbar:"Zdroj",title:"Zdroj"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","cy",{toolbar:"HTML",title:"HTML"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","el",{toolbar:"Κώδικας",title:"Κώδικας"});
\ No newline at end of file
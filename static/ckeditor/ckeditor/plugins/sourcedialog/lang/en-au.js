@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","en-au",{toolbar:"Source",title:"Source"});
\ No newline at end of file
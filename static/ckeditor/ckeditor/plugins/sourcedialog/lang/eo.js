@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","eo",{toolbar:"Fonto",title:"Fonto"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","et",{toolbar:"Lähtekood",title:"Lähtekood"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","fi",{toolbar:"Koodi",title:"Koodi"});
\ No newline at end of file
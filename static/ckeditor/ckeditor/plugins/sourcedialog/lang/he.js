@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","he",{toolbar:"מקור",title:"מקור"});
\ No newline at end of file
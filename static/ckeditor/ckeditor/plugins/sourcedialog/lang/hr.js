@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","hr",{toolbar:"Kôd",title:"Kôd"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","is",{toolbar:"Kóði",title:"Kóði"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","it",{toolbar:"Sorgente",title:"Sorgente"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","lv",{toolbar:"HTML kods",title:"HTML kods"});
\ No newline at end of file
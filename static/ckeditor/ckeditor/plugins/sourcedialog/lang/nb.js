@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","nb",{toolbar:"Kilde",title:"Kilde"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","no",{toolbar:"Kilde",title:"Kilde"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","sq",{toolbar:"Burimi",title:"Burimi"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","sr",{toolbar:"Kôд",title:"Kôд"});
\ No newline at end of file
@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uicolor","ja",{title:"UIカラーピッカー",preview:"ライブプレビュー",config:"この文字列を config.js ファイルへ貼り付け",predefined:"既定カラーセット"});
\ No newline at end of file
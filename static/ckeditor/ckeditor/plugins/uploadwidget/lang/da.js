@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uploadwidget","da",{abort:"Upload er afbrudt af brugen.",doneOne:"Filen er uploadet.",doneMany:"Du har uploadet %1 filer.",uploadOne:"Uploader fil ({percentage}%)...",uploadMany:"Uploader filer, {current} af {max} er uploadet ({percentage}%)..."});
\ No newline at end of file
@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uploadwidget","en",{abort:"Upload aborted by the user.",doneOne:"File successfully uploaded.",doneMany:"Successfully uploaded %1 files.",uploadOne:"Uploading file ({percentage}%)...",uploadMany:"Uploading files, {current} of {max} done ({percentage}%)..."});
\ No newline at end of file
@@ -0,0 +1 @@
+const reviews_block=document.querySelector(".reviews"),load_reviews_btn=document.querySelector(".load-reviews");function add_answer_for_(e,t){document.getElementById("review_parent").value=t,document.getElementById("id_body").innerText=`${e}, `,document.querySelector("label[for='id_body']").textContent="Answer:",document.querySelector("#review_form .btn").value="Add answer"}function create_element(e,t,...r){let n=document.createElement(e);return n.className=t,n.append(...r),n}function create_review_header(e){return create_element("div","review__header p-2 mb-1 bg-primary bg-opacity-50 text-white d-flex justify-content-between",create_element("b","",e.name),e.created)}function create_review_thread(e){let t=create_element("a","answer btn btn-outline-info btn-sm","Answer");return t.href="#review_form",t.dataset.name=e.name,t.dataset.review_id=e.id,[create_element("div",`review review-${e.id} mt-4`,create_review_header(e),create_element("div","review__body d-flex justify-content-between align-items-center",create_element("p","mb-0",create_element("b","","Review:")," ",e.body),t)),...e.answers.map(e=>create_element("div","review child mt-2 d-flex justify-content-end",create_element("div","child-review",create_review_header(e),create_element("p","mb-0",create_element("b","","Answer:")," ",e.body))))]}reviews_block.addEventListener("click",function(e){let t=e.target.closest(".answer");t&&add_answer_for_(t.dataset.name,t.dataset.review_id)}),load_reviews_btn&&load_reviews_btn.addEventListener("click",function(){fetch(`${load_reviews_btn.dataset.href}?before=${load_reviews_btn.dataset.before}`,{headers:{Accept:"application/json"}}).then(e=>e.json()).then(e=>{e.threads.forEach(e=>reviews_block.append(...create_review_thread(e))),e.next_before?load_reviews_btn.dataset.before=e.next_before:load_reviews_btn.remove()}).catch(e=>{console.log(e),alert("There was an error! Try again later.")})});
@@ -0,0 +1 @@
+const search_input=document.querySelector("header input[name='q']"),suggestion_list=document.createElement("datalist");let suggestion_urls={},suggest_timeout;function show_search_suggestions(t){suggestion_urls={},suggestion_list.replaceChildren(...t.map(t=>{suggestion_urls[t.name]=t.url;let e=document.createElement("option");return e.value=t.name,e.label=t.type,e}))}suggestion_list.id="search_suggestions",search_input.setAttribute("list",suggestion_list.id),search_input.setAttribute("autocomplete","off"),search_input.after(suggestion_list),search_input.addEventListener("input",function(t){clearTimeout(suggest_timeout);let e=search_input.value.trim();if(e in suggestion_urls&&(void 0===t.inputType||"insertReplacementText"===t.inputType)){window.location.href=suggestion_urls[e];return}e&&(suggest_timeout=setTimeout(()=>{fetch(`/products/suggest/?q=${encodeURIComponent(e)}`,{headers:{Accept:"application/json"}}).then(t=>t.json()).then(t=>show_search_suggestions(t.suggestions)).catch(t=>console.log(t))},150))});